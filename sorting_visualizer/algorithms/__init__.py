@@ -9,6 +9,12 @@ from .selection_sort import SelectionSort
 from .merge_sort import MergeSort
 from .quick_sort import QuickSort
 from .heap_sort import HeapSort
+from .intro_sort import IntroSort
+from .three_way_quick_sort import ThreeWayQuickSort
+from .tim_sort import TimSort
+from .counting_sort import CountingSort
+from .radix_sort import RadixSort
+from .parallel_merge_sort import ParallelMergeSort
 
 # Algorithm registry
 ALGORITHMS = {
@@ -17,10 +23,16 @@ ALGORITHMS = {
     'selection_sort': SelectionSort,
     'merge_sort': MergeSort,
     'quick_sort': QuickSort,
-    'heap_sort': HeapSort
+    'heap_sort': HeapSort,
+    'intro_sort': IntroSort,
+    'quick_sort_3way': ThreeWayQuickSort,
+    'tim_sort': TimSort,
+    'counting_sort': CountingSort,
+    'radix_sort': RadixSort,
+    'parallel_merge_sort': ParallelMergeSort
 }
 
-def get_algorithm_by_name(name, array, callback):
+def get_algorithm_by_name(name, array, callback=None, headless=False):
     """
     Get algorithm instance by name
 
@@ -28,6 +40,8 @@ def get_algorithm_by_name(name, array, callback):
         name: Algorithm name
         array: Array to sort
         callback: Callback function for visualization
+        headless: Only count comparisons and swaps, skipping all
+            visualization work (implied when no callback is given)
 
     Returns:
         Algorithm instance
@@ -35,7 +49,7 @@ def get_algorithm_by_name(name, array, callback):
     if name not in ALGORITHMS:
         raise ValueError(f"Unknown algorithm: {name}")
 
-    return ALGORITHMS[name](array, callback)
+    return ALGORITHMS[name](array, callback, headless=headless)
 
 def get_available_algorithms():
     """
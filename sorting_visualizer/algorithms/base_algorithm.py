@@ -5,35 +5,78 @@ All sorting algorithms inherit from this class
 
 import time
 from abc import ABC, abstractmethod
+from collections import deque
 
 class BaseAlgorithm(ABC):
-    def __init__(self, array, update_callback):
+    def __init__(self, array, update_callback=None, headless=False):
         """
         Initialize the algorithm
 
         Args:
             array: List of numbers to sort
-            update_callback: Function to call for visualization updates
+            update_callback: Function called as (operation, indices, values)
+                for each step; values holds the new contents of the
+                written indices, or None when nothing was written
+            headless: Skip all visualization work and only keep the
+                statistics (implied when no callback is given)
         """
         self.original_array = array.copy()
         self.array = array.copy()
         self.update_callback = update_callback
+        self.headless = headless or update_callback is None
 
         # Statistics tracking
         self.comparisons = 0
         self.swaps = 0
+        self.aux_space = 0  # peak auxiliary buffer size, in elements
         self.start_time = None
         self.end_time = None
         self.is_running = True
 
     @abstractmethod
-    def sort(self):
+    def _sort_steps(self):
         """
-        Main sorting method - must be implemented by each algorithm
-        This is where the actual sorting logic goes
+        Main sorting logic - must be implemented by each algorithm
+        Written as a generator that yields after every step (skipped in
+        headless mode), so the run can be suspended and resumed between
+        any two operations
         """
         pass
 
+    def sort(self):
+        """Run the algorithm to completion, reporting steps through the callback"""
+        self.start_time = time.time()
+        for _ in self._sort_steps():
+            pass
+        self.end_time = time.time()
+
+    def steps(self):
+        """
+        Run the algorithm as a resumable generator of steps
+
+        Each next() advances the algorithm by one step, so the caller
+        decides when and how fast it runs. Pausing is simply not pulling,
+        and closing the generator abandons the run.
+
+        Yields:
+            (operation, indices, values) tuples, as passed to a step callback
+        """
+        pending = deque()
+        callback, headless = self.update_callback, self.headless
+        self.update_callback = lambda *step: pending.append(step)
+        self.headless = False
+
+        self.start_time = time.time()
+        try:
+            for _ in self._sort_steps():
+                while pending:
+                    yield pending.popleft()
+            while pending:
+                yield pending.popleft()
+        finally:
+            self.update_callback, self.headless = callback, headless
+            self.end_time = time.time()
+
     @abstractmethod
     def get_complexity_info(self):
         """
@@ -58,10 +101,34 @@ class BaseAlgorithm(ABC):
         self.comparisons += 1
 
         # Notify visualizer about comparison
-        self.update_callback('compare', [i, j], self.array.copy())
+        if not self.headless:
+            self.update_callback('compare', [i, j], None)
 
         return self.array[i] > self.array[j]
 
+    def compare_three_way(self, i, j):
+        """
+        Compare two elements three ways and notify the visualizer
+        Counts as a single comparison
+
+        Args:
+            i, j: Indices to compare
+
+        Returns:
+            -1, 0 or 1 as array[i] is less than, equal to or greater than array[j]
+        """
+        if not self.is_running:
+            return 0
+
+        self.comparisons += 1
+
+        # Notify visualizer about comparison
+        if not self.headless:
+            self.update_callback('compare', [i, j], None)
+
+        a, b = self.array[i], self.array[j]
+        return int(a > b) - int(a < b)
+
     def swap(self, i, j):
         """
         Swap two elements and notify the visualizer
@@ -79,7 +146,8 @@ class BaseAlgorithm(ABC):
             self.array[i], self.array[j] = self.array[j], self.array[i]
 
             # Notify visualizer about swap
-            self.update_callback('swap', [i, j], self.array.copy())
+            if not self.headless:
+                self.update_callback('swap', [i, j], [self.array[i], self.array[j]])
 
     def mark_sorted(self, indices):
         """
@@ -88,13 +156,13 @@ class BaseAlgorithm(ABC):
         Args:
             indices: List of indices that are now in final position
         """
-        if not self.is_running:
+        if not self.is_running or self.headless:
             return
 
         if not isinstance(indices, list):
             indices = [indices]
 
-        self.update_callback('sorted', indices, self.array.copy())
+        self.update_callback('sorted', indices, None)
 
     def mark_pivot(self, index):
         """
@@ -103,10 +171,10 @@ class BaseAlgorithm(ABC):
         Args:
             index: Index of the pivot element
         """
-        if not self.is_running:
+        if not self.is_running or self.headless:
             return
 
-        self.update_callback('pivot', [index], self.array.copy())
+        self.update_callback('pivot', [index], None)
 
     def get_statistics(self):
         """
@@ -123,7 +191,8 @@ class BaseAlgorithm(ABC):
             'comparisons': self.comparisons,
             'swaps': self.swaps,
             'time': elapsed_time,
-            'array_size': len(self.original_array)
+            'array_size': len(self.original_array),
+            'aux_space': self.aux_space
         }
 
     def reset(self):
@@ -131,6 +200,7 @@ class BaseAlgorithm(ABC):
         self.array = self.original_array.copy()
         self.comparisons = 0
         self.swaps = 0
+        self.aux_space = 0
         self.start_time = None
         self.end_time = None
         self.is_running = True
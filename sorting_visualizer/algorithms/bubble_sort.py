@@ -4,15 +4,13 @@ Simple sorting algorithm that repeatedly steps through the list,
 compares adjacent elements and swaps them if they're in the wrong order.
 """
 
-import time
 from .base_algorithm import BaseAlgorithm
 
 class BubbleSort(BaseAlgorithm):
-    def sort(self):
+    def _sort_steps(self):
         """
         Implement bubble sort algorithm with visualization
         """
-        self.start_time = time.time()
         n = len(self.array)
 
         # Outer loop for each pass through the array
@@ -34,9 +32,14 @@ class BubbleSort(BaseAlgorithm):
                     self.swap(j, j + 1)
                     swapped = True
 
+                if not self.headless:
+                    yield
+
             # After each pass, the largest element is in its final position
             if self.is_running:
                 self.mark_sorted(n - i - 1)
+                if not self.headless:
+                    yield
 
             # If no swapping occurred, array is already sorted
             if not swapped:
@@ -44,10 +47,10 @@ class BubbleSort(BaseAlgorithm):
                 for k in range(n - i - 1):
                     if self.is_running:
                         self.mark_sorted(k)
+                        if not self.headless:
+                            yield
                 break
 
-        self.end_time = time.time()
-
     def get_complexity_info(self):
         """Return complexity information for bubble sort"""
         return {
@@ -0,0 +1,104 @@
+"""
+Counting Sort Algorithm Implementation
+Counts how often each value occurs, then writes the values back in order.
+Only works on integers, and needs memory proportional to the value range.
+"""
+
+import numpy as np
+
+from .base_algorithm import BaseAlgorithm
+
+# Widest value range (max - min + 1) counted directly
+MAX_COUNTING_RANGE = 1 << 24
+
+def as_integer_array(values):
+    """
+    View a list or array of integers as a NumPy integer array
+
+    Args:
+        values: List or NumPy array of integers
+
+    Returns:
+        NumPy integer array (the input itself when it already is one)
+
+    Raises:
+        ValueError: If the values are not all integers
+    """
+    result = np.asarray(values)
+    if not result.size:
+        return result.astype(np.int64)
+    if result.dtype.kind not in 'iu':
+        raise ValueError("Counting and radix sort only work on integer values")
+    return result
+
+def restore_container(sorted_values, original):
+    """Return sorted NumPy values as the same container type as the input"""
+    if isinstance(original, np.ndarray):
+        return sorted_values.astype(original.dtype, copy=False)
+    return sorted_values.tolist()
+
+class CountingSort(BaseAlgorithm):
+    def _sort_steps(self):
+        """
+        Implement counting sort algorithm with visualization
+        """
+        n = len(self.array)
+        values = as_integer_array(self.array)
+        if n == 0:
+            return
+
+        low, high = int(values.min()), int(values.max())
+        value_range = high - low + 1
+        if value_range > MAX_COUNTING_RANGE:
+            raise ValueError(
+                f"Value range {value_range} is too wide for counting sort; use radix sort instead"
+            )
+        self.aux_space = value_range
+
+        if self.headless:
+            # Histogram, then expand each value by its count in one pass
+            counts = np.bincount(values - low, minlength=value_range)
+            result = np.repeat(np.arange(low, high + 1, dtype=values.dtype), counts)
+            self.array = restore_container(result, self.array)
+            return
+
+        # Count occurrences of each value
+        counts = [0] * value_range
+        for i in range(n):
+            if not self.is_running:
+                return
+            counts[self.array[i] - low] += 1
+            self.update_callback('read', [i], None)
+            yield
+
+        # Write every value back as many times as it was counted
+        k = 0
+        for offset, count in enumerate(counts):
+            for _ in range(count):
+                if not self.is_running:
+                    return
+                self.array[k] = low + offset
+                self.update_callback('insert', [k], [self.array[k]])
+                k += 1
+                yield
+
+        # Mark all elements as sorted
+        self.mark_sorted(list(range(n)))
+
+    def get_complexity_info(self):
+        """Return complexity information for counting sort"""
+        return {
+            'name': 'Counting Sort',
+            'time_best': 'O(n + k)',
+            'time_average': 'O(n + k)',
+            'time_worst': 'O(n + k)',
+            'space': 'O(k)',
+            'stable': True,
+            'in_place': False,
+            'description': (
+                "Counts how many times each value occurs, then writes the "
+                "values back in order. No comparisons at all, but it only "
+                "works on integers and needs memory for every value in the "
+                "range k."
+            )
+        }
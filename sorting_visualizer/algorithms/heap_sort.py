@@ -3,22 +3,25 @@ Heap Sort Algorithm Implementation
 Builds a max heap from the array, then repeatedly extracts the maximum element.
 """
 
-import time
 from .base_algorithm import BaseAlgorithm
 
-class HeapSort(BaseAlgorithm):
-    def sort(self):
+class HeapSortMixin:
+    """
+    Heap sort building blocks shared by HeapSort and QuickSort's introsort
+    fallback; relies on the BaseAlgorithm compare, swap and mark helpers
+    """
+
+    def _heap_sort_range(self, low, high):
         """
-        Implement heap sort algorithm with visualization
+        Heap sort the subrange array[low..high] in place
         """
-        self.start_time = time.time()
-        n = len(self.array)
+        n = high - low + 1
 
         # Build max heap
         for i in range(n // 2 - 1, -1, -1):
             if not self.is_running:
                 break
-            self._heapify(n, i)
+            yield from self._sift_down(n, i, low)
 
         # Extract elements from heap one by one
         for i in range(n - 1, 0, -1):
@@ -26,42 +29,55 @@ class HeapSort(BaseAlgorithm):
                 break
 
             # Move current root to end
-            self.swap(0, i)
-            self.mark_sorted(i)
+            self.swap(low, low + i)
+            self.mark_sorted(low + i)
+            if not self.headless:
+                yield
 
-            # Call heapify on the reduced heap
-            self._heapify(i, 0)
+            # Restore the heap property on the reduced heap
+            yield from self._sift_down(i, 0, low)
 
         if self.is_running:
-            self.mark_sorted(0)  # Mark first element as sorted
+            self.mark_sorted(low)  # Mark first element as sorted
 
-        self.end_time = time.time()
-
-    def _heapify(self, n, i):
+    def _sift_down(self, n, i, offset=0):
         """
-        Heapify a subtree rooted with node i
+        Sift the element at node i down until the subtree rooted there is a max heap
+        Node k of the heap lives at array[offset + k]
         """
-        if not self.is_running:
-            return
+        while self.is_running:
+            largest = i  # Initialize largest as root
+            left = 2 * i + 1  # Left child
+            right = 2 * i + 2  # Right child
+
+            # If left child exists and is greater than root
+            if left < n and self.compare(offset + left, offset + largest):
+                largest = left
 
-        largest = i  # Initialize largest as root
-        left = 2 * i + 1  # Left child
-        right = 2 * i + 2  # Right child
+            # If right child exists and is greater than largest so far
+            if right < n and self.compare(offset + right, offset + largest):
+                largest = right
 
-        # If left child exists and is greater than root
-        if left < n and self.compare(largest, left):  # array[largest] < array[left]
-            largest = left
+            if not self.headless:
+                yield
 
-        # If right child exists and is greater than largest so far
-        if right < n and self.compare(largest, right):  # array[largest] < array[right]
-            largest = right
+            # Stop once the root is larger than both children
+            if largest == i:
+                return
 
-        # If largest is not root
-        if largest != i and self.is_running:
-            self.swap(i, largest)
+            self.swap(offset + i, offset + largest)
+            if not self.headless:
+                yield
 
-            # Recursively heapify the affected sub-tree
-            self._heapify(n, largest)
+            # Continue down the affected sub-tree
+            i = largest
+
+class HeapSort(HeapSortMixin, BaseAlgorithm):
+    def _sort_steps(self):
+        """
+        Implement heap sort algorithm with visualization
+        """
+        yield from self._heap_sort_range(0, len(self.array) - 1)
 
     def get_complexity_info(self):
         """Return complexity information for heap sort"""
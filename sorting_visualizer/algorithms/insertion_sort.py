@@ -3,15 +3,13 @@ Insertion Sort Algorithm Implementation
 Builds the final sorted array one item at a time, inserting each element into its correct position.
 """
 
-import time
 from .base_algorithm import BaseAlgorithm
 
 class InsertionSort(BaseAlgorithm):
-    def sort(self):
+    def _sort_steps(self):
         """
         Implement insertion sort algorithm with visualization
         """
-        self.start_time = time.time()
         n = len(self.array)
 
         # Start from second element (index 1)
@@ -25,21 +23,32 @@ class InsertionSort(BaseAlgorithm):
 
             # Move elements that are greater than key one position ahead
             while j >= 0 and self.is_running:
-                if not self.compare(j, i):  # array[j] <= key
+                # Compare against the saved key, since array[i] may
+                # already have been overwritten by a shift
+                self.comparisons += 1
+                if not self.headless:
+                    self.update_callback('compare', [j, j + 1], None)
+                if self.array[j] <= key:
+                    if not self.headless:
+                        yield
                     break
 
                 # Shift element to the right
                 self.array[j + 1] = self.array[j]
-                self.update_callback('shift', [j, j + 1], self.array.copy())
+                if not self.headless:
+                    self.update_callback('shift', [j, j + 1], [self.array[j], self.array[j + 1]])
                 j -= 1
+                if not self.headless:
+                    yield
 
             # Insert the key at correct position
             if self.is_running:
                 self.array[j + 1] = key
-                self.update_callback('insert', [j + 1], self.array.copy())
-                self.mark_sorted(list(range(i + 1)))
-
-        self.end_time = time.time()
+                if not self.headless:
+                    self.update_callback('insert', [j + 1], [key])
+                    self.mark_sorted(list(range(i + 1)))
+                if not self.headless:
+                    yield
 
     def get_complexity_info(self):
         """Return complexity information for insertion sort"""
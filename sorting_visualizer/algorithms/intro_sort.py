@@ -0,0 +1,40 @@
+"""
+Intro Sort Algorithm Implementation
+Quick sort with median-of-three pivots that falls back to heap sort when partitioning
+degrades and finishes small partitions with insertion sort.
+"""
+
+from .quick_sort import QuickSort
+
+class IntroSort(QuickSort):
+    def __init__(self, array, update_callback=None, headless=False):
+        """
+        Initialize intro sort
+
+        Args:
+            array: List of numbers to sort
+            update_callback: Function called for each step
+            headless: Skip all visualization work
+        """
+        super().__init__(
+            array, update_callback, headless,
+            pivot_strategy='median_of_three',
+            introsort=True
+        )
+
+    def get_complexity_info(self):
+        """Return complexity information for intro sort"""
+        return {
+            'name': 'Intro Sort',
+            'time_best': 'O(n log n)',
+            'time_average': 'O(n log n)',
+            'time_worst': 'O(n log n)',
+            'space': 'O(log n)',
+            'stable': False,
+            'in_place': True,
+            'description': (
+                "Quick sort with median-of-three pivots that switches to heap "
+                "sort once partitioning nests deeper than 2·log n, and uses "
+                "insertion sort on small partitions."
+            )
+        }
@@ -1,84 +1,96 @@
 """
 Merge Sort Algorithm Implementation
-Divides the array into halves, sorts them separately, then merges the sorted halves.
+Merges sorted runs bottom-up, doubling the run width on each pass until
+the whole array is one sorted run, ping-ponging between the array and one
+auxiliary buffer.
 """
 
-import time
 from .base_algorithm import BaseAlgorithm
 
 class MergeSort(BaseAlgorithm):
-    def sort(self):
+    def _sort_steps(self):
         """
         Implement merge sort algorithm with visualization
+
+        A single n-element auxiliary buffer is allocated up front. Each pass
+        merges runs from one buffer into the other, and the two buffers
+        swap roles between passes, so no merge allocates anything.
         """
-        self.start_time = time.time()
-        self._merge_sort_recursive(0, len(self.array) - 1)
-        self.end_time = time.time()
+        n = len(self.array)
+        source = self.array
+        target = self.array.copy()
+        self.aux_space = n
 
-        # Mark all elements as sorted
-        if self.is_running:
-            self.mark_sorted(list(range(len(self.array))))
+        width = 1
 
-    def _merge_sort_recursive(self, left, right):
-        """
-        Recursive merge sort implementation
-        """
-        if not self.is_running or left >= right:
-            return
+        # Merge adjacent runs of the current width until one run remains
+        while width < n and self.is_running:
+            for left in range(0, n, 2 * width):
+                if not self.is_running:
+                    break
 
-        # Find the middle point
-        mid = (left + right) // 2
+                mid = min(left + width - 1, n - 1)
+                right = min(left + 2 * width - 1, n - 1)
+                yield from self._merge(source, target, left, mid, right)
 
-        # Sort first and second halves
-        self._merge_sort_recursive(left, mid)
-        self._merge_sort_recursive(mid + 1, right)
+            if not self.is_running:
+                break
 
-        # Merge the sorted halves
-        if self.is_running:
-            self._merge(left, mid, right)
+            # The merged pass becomes the source of the next one
+            source, target = target, source
+            width *= 2
 
-    def _merge(self, left, mid, right):
+        # After an odd number of passes the result lives in the other buffer
+        self.array = source
+
+        # Mark all elements as sorted
+        if self.is_running and not self.headless:
+            self.mark_sorted(list(range(len(self.array))))
+
+    def _merge(self, source, target, left, mid, right):
         """
-        Merge two sorted subarrays
+        Merge sorted source[left..mid] and source[mid+1..right] into target[left..right]
+        A trailing run without a partner (mid == right) is copied across
         """
-        if not self.is_running:
-            return
-
-        # Create temporary arrays for left and right subarrays
-        left_arr = self.array[left:mid + 1]
-        right_arr = self.array[mid + 1:right + 1]
+        visual = not self.headless
+        i, j, k = left, mid + 1, left
 
-        # Initial indexes for left, right and merged arrays
-        i = j = 0
-        k = left
+        while i <= mid and j <= right:
+            if not self.is_running:
+                return
 
-        # Merge the temporary arrays back into array[left..right]
-        while i < len(left_arr) and j < len(right_arr) and self.is_running:
-            # Compare elements from left and right subarrays
-            self.update_callback('compare', [left + i, mid + 1 + j], self.array.copy())
+            # Compare elements from left and right runs
             self.comparisons += 1
+            if visual:
+                self.update_callback('compare', [i, j], None)
 
-            if left_arr[i] <= right_arr[j]:
-                self.array[k] = left_arr[i]
+            if source[i] <= source[j]:
+                target[k] = source[i]
                 i += 1
             else:
-                self.array[k] = right_arr[j]
+                target[k] = source[j]
                 j += 1
 
             # Update visualization
-            self.update_callback('merge', [k], self.array.copy())
+            if visual:
+                self.update_callback('merge', [k], [target[k]])
+                yield
             k += 1
 
         # Copy remaining elements
-        while i < len(left_arr) and self.is_running:
-            self.array[k] = left_arr[i]
-            self.update_callback('merge', [k], self.array.copy())
+        while i <= mid and self.is_running:
+            target[k] = source[i]
+            if visual:
+                self.update_callback('merge', [k], [target[k]])
+                yield
             i += 1
             k += 1
 
-        while j < len(right_arr) and self.is_running:
-            self.array[k] = right_arr[j]
-            self.update_callback('merge', [k], self.array.copy())
+        while j <= right and self.is_running:
+            target[k] = source[j]
+            if visual:
+                self.update_callback('merge', [k], [target[k]])
+                yield
             j += 1
             k += 1
 
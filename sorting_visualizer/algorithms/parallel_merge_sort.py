@@ -0,0 +1,262 @@
+"""
+Parallel Merge Sort Algorithm Implementation
+Sorts chunks of the array in worker processes that share one block of memory,
+then merges neighbouring runs in parallel until one run is left. Canvas runs
+and small arrays use the serial merge sort steps instead.
+
+The parallel path sorts and merges with NumPy inside the workers, so it
+does not count comparisons: they stay 0 when a run takes that path (see
+get_statistics).
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from config.settings import PARALLEL_CONFIG
+from .merge_sort import MergeSort
+
+def _run_on_shared(task, name, dtype, n, *args):
+    """
+    Worker entry point: attach to the shared block and run one task on it
+
+    The block holds two n-element arrays, the data and a scratch buffer of
+    the same size, so only the block name and a few offsets are pickled.
+    """
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        task(np.ndarray((2, n), dtype=dtype, buffer=block.buf), *args)
+    finally:
+        block.close()
+
+def _sort_chunk(buffers, start, stop):
+    """Sort data[start:stop] in place"""
+    buffers[0, start:stop].sort(kind='stable')
+
+def _merge_runs(buffers, source, left, right, out):
+    """
+    Merge two sorted slices of one buffer into the other
+
+    Args:
+        buffers: Data and scratch arrays
+        source: 0 to merge from data into scratch, 1 for the reverse
+        left, right: (start, stop) slices of the two runs, left run first
+        out: Output position of the first merged element
+    """
+    src, dst = buffers[source], buffers[1 - source]
+    a = src[left[0]:left[1]]
+    b = src[right[0]:right[1]]
+
+    # Stable merge by rank: each element lands after everything smaller
+    # in the other run, and ties go to the left run first
+    dst[np.arange(len(a)) + np.searchsorted(b, a, side='left') + out] = a
+    dst[np.arange(len(b)) + np.searchsorted(a, b, side='right') + out] = b
+
+class ParallelMergeSort(MergeSort):
+    def __init__(self, array, update_callback=None, headless=False, workers=None, min_parallel_size=None):
+        """
+        Initialize parallel merge sort
+
+        Args:
+            array: List of numbers to sort
+            update_callback: Function called as (operation, indices, values)
+            headless: Skip all visualization work and only keep the statistics
+            workers: Number of worker processes (default: every available core)
+            min_parallel_size: Smallest array sorted in parallel
+        """
+        super().__init__(array, update_callback, headless)
+        self.workers = workers or PARALLEL_CONFIG['MAX_WORKERS'] or _available_cores()
+        self.min_parallel_size = min_parallel_size or PARALLEL_CONFIG['MIN_PARALLEL_SIZE']
+        self.parallel = False  # whether the last run used the worker pool
+
+    def _sort_steps(self):
+        """
+        Implement parallel merge sort, falling back to serial merge sort
+        when steps are shown or the array is too small to be worth it
+        """
+        values = np.asarray(self.array)
+        self.parallel = (
+            self.headless and
+            len(values) >= self.min_parallel_size and
+            values.dtype.kind in 'iuf'
+        )
+
+        if not self.parallel:
+            yield from super()._sort_steps()
+            return
+
+        result = self._sort_parallel(values)
+        if isinstance(self.array, np.ndarray):
+            self.array = result
+        else:
+            self.array = result.tolist()
+
+    def _sort_parallel(self, values):
+        """
+        Sort a numeric array with the worker pool
+
+        Returns:
+            Sorted copy of values, as a NumPy array
+        """
+        n = len(values)
+        block = shared_memory.SharedMemory(create=True, size=2 * n * values.dtype.itemsize)
+        try:
+            return self._sort_shared(block, values)
+        finally:
+            block.close()
+            block.unlink()
+
+    def _sort_shared(self, block, values):
+        """Sort values through the given shared block"""
+        n = len(values)
+        dtype = values.dtype
+        buffers = np.ndarray((2, n), dtype=dtype, buffer=block.buf)
+        buffers[0] = values
+        self.aux_space = n
+
+        chunks = min(self.workers, n)
+        bounds = [n * k // chunks for k in range(chunks + 1)]
+        runs = [(bounds[k], bounds[k + 1]) for k in range(chunks)]
+        source = 0
+
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            def run_all(task, task_args):
+                futures = [pool.submit(_run_on_shared, task, block.name, dtype, n, *args)
+                           for args in task_args]
+                for future in futures:
+                    future.result()
+
+            # Sort every chunk where it lies
+            run_all(_sort_chunk, runs)
+
+            # Merge neighbouring runs until a single run is left
+            while len(runs) > 1 and self.is_running:
+                tasks = []
+                merged = []
+                pieces = max(1, self.workers // (len(runs) // 2))
+
+                for k in range(0, len(runs) - 1, 2):
+                    left, right = runs[k], runs[k + 1]
+                    tasks.extend(
+                        (source,) + task
+                        for task in self._split_merge(buffers[source], left, right, pieces)
+                    )
+                    merged.append((left[0], right[1]))
+
+                if len(runs) % 2:
+                    # The odd run out is merged with nothing, i.e. copied across
+                    left = runs[-1]
+                    tasks.append((source, left, (left[1], left[1]), left[0]))
+                    merged.append(left)
+
+                run_all(_merge_runs, tasks)
+                runs = merged
+                source = 1 - source
+
+        return buffers[source].copy()
+
+    def _split_merge(self, src, left, right, pieces):
+        """
+        Split the merge of two runs into independent pieces
+
+        The left run is cut into equal parts, and each cut is located in
+        the right run by binary search, so every piece writes its own
+        output range.
+
+        Returns:
+            List of (left_slice, right_slice, out) merge tasks
+        """
+        a_start, a_stop = left
+        b_start, b_stop = right
+        a_cuts = [a_start + (a_stop - a_start) * k // pieces for k in range(pieces + 1)]
+        b_cuts = [b_start] + [
+            b_start + int(np.searchsorted(src[b_start:b_stop], src[cut], side='left'))
+            for cut in a_cuts[1:-1]
+        ] + [b_stop]
+
+        tasks = []
+        for k in range(pieces):
+            out = a_cuts[k] + (b_cuts[k] - b_start)
+            tasks.append(((a_cuts[k], a_cuts[k + 1]), (b_cuts[k], b_cuts[k + 1]), out))
+        return tasks
+
+    def get_statistics(self):
+        """
+        Get performance statistics
+
+        Comparisons are only counted by the serial merge sort steps; when
+        the last run took the parallel path ('parallel' is True) they stay 0.
+
+        Returns:
+            Dictionary containing performance metrics
+        """
+        stats = super().get_statistics()
+        stats['parallel'] = self.parallel
+        return stats
+
+    def get_complexity_info(self):
+        """Return complexity information for parallel merge sort"""
+        return {
+            'name': 'Parallel Merge Sort',
+            'time_best': 'O(n log n / p)',
+            'time_average': 'O(n log n / p)',
+            'time_worst': 'O(n log n / p)',
+            'space': 'O(n)',
+            'stable': True,
+            'in_place': False,
+            'description': (
+                "Splits the array into one chunk per core, sorts the chunks "
+                "in separate processes over shared memory, then merges "
+                "neighbouring runs in parallel. Shown step by step, it runs "
+                "as an ordinary merge sort."
+            )
+        }
+
+def _available_cores():
+    """Number of cores this process may run on"""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+def _time_sort(algorithm):
+    """Seconds a headless sort takes"""
+    start = time.perf_counter()
+    algorithm.sort()
+    return time.perf_counter() - start
+
+def measure_speedup(array, workers=None):
+    """
+    Time the parallel sort against the same shared-memory path on one worker
+
+    The speed-up compares like with like: both runs sort with NumPy in
+    worker processes, so it measures parallelism only. The pure-Python
+    MergeSort time is reported next to it for reference; the gap to that
+    one is mostly NumPy against Python, not parallelism.
+
+    Args:
+        array: List of numbers to sort
+        workers: Number of worker processes (default: every available core)
+
+    Returns:
+        Dictionary with the one-worker, parallel and MergeSort times in
+        seconds, the speed-up over one worker, the speed-up over MergeSort
+        and the worker count
+    """
+    one_worker_time = _time_sort(ParallelMergeSort(array, headless=True, workers=1, min_parallel_size=1))
+
+    parallel = ParallelMergeSort(array, headless=True, workers=workers, min_parallel_size=1)
+    parallel_time = _time_sort(parallel)
+
+    merge_sort_time = _time_sort(MergeSort(array, headless=True))
+
+    return {
+        'serial_time': one_worker_time,
+        'parallel_time': parallel_time,
+        'merge_sort_time': merge_sort_time,
+        'speedup': one_worker_time / parallel_time if parallel_time else float('inf'),
+        'merge_sort_speedup': merge_sort_time / parallel_time if parallel_time else float('inf'),
+        'workers': parallel.workers
+    }
@@ -1,36 +1,151 @@
 """
 Quick Sort Algorithm Implementation
-Selects a pivot element and partitions the array around it, then recursively sorts the partitions.
+Selects a pivot element and partitions the array around it, then sorts the partitions
+using an explicit stack instead of recursion.
 """
 
-import time
+import random
 from .base_algorithm import BaseAlgorithm
+from .heap_sort import HeapSortMixin
 
-class QuickSort(BaseAlgorithm):
-    def sort(self):
+# Pivot selection strategies accepted by QuickSort
+PIVOT_STRATEGIES = ('last', 'median_of_three', 'ninther', 'random')
+
+# Partitioning schemes accepted by QuickSort
+PARTITION_SCHEMES = ('lomuto', 'three_way')
+
+class QuickSort(HeapSortMixin, BaseAlgorithm):
+    def __init__(self, array, update_callback=None, headless=False,
+                 pivot_strategy='last', introsort=False, small_partition_size=16,
+                 seed=None, partition_scheme='lomuto'):
+        """
+        Initialize quick sort
+
+        Args:
+            array: List of numbers to sort
+            update_callback: Function called for each step
+            headless: Skip all visualization work
+            pivot_strategy: One of PIVOT_STRATEGIES
+            introsort: Fall back to heap sort on subranges nested deeper
+                than 2·log2(n) and insertion sort on small partitions
+            small_partition_size: Largest partition handed to insertion
+                sort in introsort mode
+            seed: Random seed for the 'random' pivot strategy
+            partition_scheme: 'lomuto' for two-way partitioning, or
+                'three_way' to gather keys equal to the pivot into a
+                middle band that is never partitioned again
+        """
+        super().__init__(array, update_callback, headless)
+
+        if pivot_strategy not in PIVOT_STRATEGIES:
+            raise ValueError(f"Unknown pivot strategy: {pivot_strategy}")
+        if partition_scheme not in PARTITION_SCHEMES:
+            raise ValueError(f"Unknown partition scheme: {partition_scheme}")
+
+        self.pivot_strategy = pivot_strategy
+        self.partition_scheme = partition_scheme
+        self.introsort = introsort
+        self.small_partition_size = small_partition_size
+        self.random = random.Random(seed)
+
+    def _sort_steps(self):
         """
         Implement quick sort algorithm with visualization
         """
-        self.start_time = time.time()
-        self._quick_sort_recursive(0, len(self.array) - 1)
-        self.end_time = time.time()
+        n = len(self.array)
+        depth_limit = 2 * max(n, 1).bit_length()
+
+        # Subranges still waiting to be partitioned, with their nesting depth
+        stack = [(0, n - 1, 0)]
+
+        while stack and self.is_running:
+            low, high, depth = stack.pop()
+            if low >= high:
+                continue
+
+            if self.introsort:
+                if high - low + 1 <= self.small_partition_size:
+                    yield from self._insertion_sort_range(low, high)
+                    continue
+
+                if depth >= depth_limit:
+                    # Partitioning is degrading, so heap sort this subrange
+                    yield from self._heap_sort_range(low, high)
+                    continue
+
+            # Partition the array; array[lt..gt] then holds the pivot key(s)
+            if self.partition_scheme == 'three_way':
+                lt, gt = yield from self._partition_three_way(low, high)
+            else:
+                lt = gt = yield from self._partition(low, high)
+
+            # Push the larger side first so the smaller one is handled next,
+            # which keeps the stack at O(log n) entries
+            left = (low, lt - 1, depth + 1)
+            right = (gt + 1, high, depth + 1)
+            if lt - low > high - gt:
+                stack.append(left)
+                stack.append(right)
+            else:
+                stack.append(right)
+                stack.append(left)
 
         # Mark all elements as sorted
-        if self.is_running:
+        if self.is_running and not self.headless:
             self.mark_sorted(list(range(len(self.array))))
 
-    def _quick_sort_recursive(self, low, high):
+    def _choose_pivot(self, low, high):
+        """
+        Pick the pivot index for array[low..high] using the pivot strategy
+        """
+        if self.pivot_strategy == 'random':
+            return self.random.randint(low, high)
+
+        if self.pivot_strategy == 'last' or high - low < 2:
+            return high
+
+        mid = (low + high) // 2
+
+        if self.pivot_strategy == 'ninther' and high - low + 1 >= 40:
+            # Median of the medians of three evenly spaced triples
+            step = (high - low + 1) // 8
+            first = self._median_of_three(low, low + step, low + 2 * step)
+            middle = self._median_of_three(mid - step, mid, mid + step)
+            last = self._median_of_three(high - 2 * step, high - step, high)
+            return self._median_of_three(first, middle, last)
+
+        return self._median_of_three(low, mid, high)
+
+    def _median_of_three(self, a, b, c):
+        """
+        Return whichever of the indices a, b, c holds the median value
+        """
+        if self.compare(a, b):  # array[a] > array[b]
+            a, b = b, a
+
+        # Now array[a] <= array[b]
+        if self.compare(b, c):  # array[b] > array[c]
+            return a if self.compare(a, c) else c
+
+        return b
+
+    def _insertion_sort_range(self, low, high):
         """
-        Recursive quick sort implementation
+        Insertion sort array[low..high] using adjacent swaps
         """
-        if not self.is_running or low < high:
-            # Partition the array and get pivot index
-            if self.is_running:
-                pivot_index = self._partition(low, high)
+        for i in range(low + 1, high + 1):
+            j = i
+            while j > low and self.is_running and self.compare(j - 1, j):
+                self.swap(j - 1, j)
+                j -= 1
+                if not self.headless:
+                    yield
+
+            if not self.headless:
+                yield
 
-                # Recursively sort elements before and after partition
-                self._quick_sort_recursive(low, pivot_index - 1)
-                self._quick_sort_recursive(pivot_index + 1, high)
+        if self.is_running and not self.headless:
+            self.mark_sorted(list(range(low, high + 1)))
 
     def _partition(self, low, high):
         """
@@ -39,9 +154,13 @@ class QuickSort(BaseAlgorithm):
         if not self.is_running:
             return low
 
-        # Choose rightmost element as pivot
-        pivot = self.array[high]
+        # Move the chosen pivot to the end of the range
+        pivot_index = self._choose_pivot(low, high)
+        if pivot_index != high:
+            self.swap(pivot_index, high)
         self.mark_pivot(high)
+        if not self.headless:
+            yield
 
         # Index of smaller element
         i = low - 1
@@ -56,13 +175,59 @@ class QuickSort(BaseAlgorithm):
                 if i != j:
                     self.swap(i, j)
 
+            if not self.headless:
+                yield
+
         # Place pivot in correct position
         if self.is_running:
             self.swap(i + 1, high)
             self.mark_sorted(i + 1)
+            if not self.headless:
+                yield
 
         return i + 1
 
+    def _partition_three_way(self, low, high):
+        """
+        Dijkstra three-way partition of array[low..high]
+
+        Returns:
+            (lt, gt) such that array[low..lt-1] < pivot, array[lt..gt] == pivot
+            and array[gt+1..high] > pivot
+        """
+        # Move the chosen pivot to the start of the range
+        pivot_index = self._choose_pivot(low, high)
+        if pivot_index != low:
+            self.swap(pivot_index, low)
+        self.mark_pivot(low)
+        if not self.headless:
+            yield
+
+        # array[lt] always holds a key equal to the pivot
+        lt, i, gt = low, low + 1, high
+
+        while i <= gt and self.is_running:
+            order = self.compare_three_way(i, lt)
+            if order < 0:
+                self.swap(lt, i)
+                lt += 1
+                i += 1
+            elif order > 0:
+                self.swap(i, gt)
+                gt -= 1
+            else:
+                i += 1
+
+            if not self.headless:
+                yield
+
+        # The equal band is in its final position
+        if self.is_running and not self.headless:
+            self.mark_sorted(list(range(lt, gt + 1)))
+            yield
+
+        return lt, gt
+
     def get_complexity_info(self):
         """Return complexity information for quick sort"""
         return {
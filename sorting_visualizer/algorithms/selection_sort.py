@@ -3,15 +3,13 @@ Selection Sort Algorithm Implementation
 Finds the minimum element and places it at the beginning, then repeats for remaining elements.
 """
 
-import time
 from .base_algorithm import BaseAlgorithm
 
 class SelectionSort(BaseAlgorithm):
-    def sort(self):
+    def _sort_steps(self):
         """
         Implement selection sort algorithm with visualization
         """
-        self.start_time = time.time()
         n = len(self.array)
 
         # Move boundary of unsorted subarray
@@ -30,6 +28,9 @@ class SelectionSort(BaseAlgorithm):
                 if self.compare(min_idx, j):  # array[min_idx] > array[j]
                     min_idx = j
 
+                if not self.headless:
+                    yield
+
             # Swap the found minimum element with the first element
             if self.is_running and min_idx != i:
                 self.swap(i, min_idx)
@@ -37,8 +38,8 @@ class SelectionSort(BaseAlgorithm):
             # Mark current position as sorted
             if self.is_running:
                 self.mark_sorted(i)
-
-        self.end_time = time.time()
+                if not self.headless:
+                    yield
 
     def get_complexity_info(self):
         """Return complexity information for selection sort"""
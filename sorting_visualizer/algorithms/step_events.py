@@ -0,0 +1,28 @@
+"""
+Step event model shared by the algorithms and the visualizer
+Each step carries only the operation, the indices involved and, for
+operations that write to the array, the new values at those indices.
+"""
+
+# Operations that only highlight positions without changing the array;
+# 'read' looks at single elements without comparing them to anything
+READ_OPERATIONS = ('compare', 'read', 'sorted', 'pivot')
+
+# Operations that change the array; their values list the new contents
+WRITE_OPERATIONS = ('swap', 'merge', 'insert', 'shift')
+
+def apply_step(array, operation, indices, values):
+    """
+    Apply the delta carried by a step to a local copy of the array
+
+    Args:
+        array: Local array copy to update in place
+        operation: Type of operation ('compare', 'swap', 'merge', etc.)
+        indices: List of indices involved in the operation
+        values: New values at those indices, or None for read-only steps
+    """
+    if values is None:
+        return
+
+    for index, value in zip(indices, values):
+        array[index] = value
@@ -0,0 +1,40 @@
+"""
+Three-Way Quick Sort Algorithm Implementation
+Partitions around a pivot into less-than, equal-to and greater-than bands (Dutch national
+flag), so runs of duplicate keys are placed once and never partitioned again.
+"""
+
+from .quick_sort import QuickSort
+
+class ThreeWayQuickSort(QuickSort):
+    def __init__(self, array, update_callback=None, headless=False):
+        """
+        Initialize three-way quick sort
+
+        Args:
+            array: List of numbers to sort
+            update_callback: Function called for each step
+            headless: Skip all visualization work
+        """
+        super().__init__(
+            array, update_callback, headless,
+            pivot_strategy='median_of_three',
+            partition_scheme='three_way'
+        )
+
+    def get_complexity_info(self):
+        """Return complexity information for three-way quick sort"""
+        return {
+            'name': 'Quick Sort (3-way)',
+            'time_best': 'O(n)',
+            'time_average': 'O(n log n)',
+            'time_worst': 'O(n²)',
+            'space': 'O(log n)',
+            'stable': False,
+            'in_place': True,
+            'description': (
+                "Partitions around a pivot into keys less than, equal to and "
+                "greater than it. The equal band is never partitioned again, "
+                "so arrays with few distinct keys sort in close to linear time."
+            )
+        }
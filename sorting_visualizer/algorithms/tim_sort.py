@@ -0,0 +1,536 @@
+"""
+Tim Sort Algorithm Implementation
+Adaptive merge sort: detects ascending and descending runs, extends short runs with
+binary insertion sort, merges runs under stack invariants and gallops when one run
+keeps winning, so nearly sorted input costs close to n comparisons.
+"""
+
+from .base_algorithm import BaseAlgorithm
+
+# Consecutive wins needed before a merge switches to galloping mode
+MIN_GALLOP = 7
+
+class TimSort(BaseAlgorithm):
+    def _sort_steps(self):
+        """
+        Implement tim sort algorithm with visualization
+        """
+        n = len(self.array)
+        self.min_gallop = MIN_GALLOP
+        self.runs = []  # Stack of pending (base, length) runs
+
+        min_run = self._compute_min_run(n)
+        low = 0
+
+        while low < n and self.is_running:
+            # Find the next natural run, reversing it if it is descending
+            run_length = yield from self._count_run_and_make_ascending(low, n)
+
+            # Extend short runs to min_run elements with binary insertion
+            if run_length < min_run:
+                forced = min(min_run, n - low)
+                yield from self._binary_insertion_sort(low, low + forced, low + run_length)
+                run_length = forced
+
+            self.runs.append((low, run_length))
+            yield from self._merge_collapse()
+            low += run_length
+
+        yield from self._merge_force_collapse()
+
+        # Mark all elements as sorted
+        if self.is_running and not self.headless:
+            self.mark_sorted(list(range(n)))
+
+    def _compute_min_run(self, n):
+        """
+        Pick a run length in [32, 64] so that n / min_run is close to a power of two
+        """
+        extra = 0
+        while n >= 64:
+            extra |= n & 1
+            n >>= 1
+        return n + extra
+
+    def _less(self, x, y, i, j):
+        """
+        Count and show a comparison of two values, returning x < y
+
+        Args:
+            x, y: Values being compared
+            i, j: Array positions to highlight for them
+        """
+        self.comparisons += 1
+        if not self.headless:
+            self.update_callback('compare', [i, j], None)
+        return x < y
+
+    def _write(self, index, value):
+        """Store a value in the array and notify the visualizer"""
+        self.array[index] = value
+        if not self.headless:
+            self.update_callback('merge', [index], [value])
+
+    def _count_run_and_make_ascending(self, low, high):
+        """
+        Length of the run starting at low; strictly descending runs are reversed
+        """
+        a = self.array
+        run_high = low + 1
+        if run_high == high:
+            return 1
+
+        if self._less(a[run_high], a[low], run_high, low):
+            # Strictly descending, so reversing it keeps the sort stable
+            run_high += 1
+            while run_high < high and self._less(a[run_high], a[run_high - 1], run_high, run_high - 1):
+                run_high += 1
+
+            i, j = low, run_high - 1
+            while i < j:
+                self.swap(i, j)
+                if not self.headless:
+                    yield
+                i += 1
+                j -= 1
+        else:
+            run_high += 1
+            while run_high < high and not self._less(a[run_high], a[run_high - 1], run_high, run_high - 1):
+                run_high += 1
+
+        return run_high - low
+
+    def _binary_insertion_sort(self, low, high, start):
+        """
+        Sort array[low..high-1], given that array[low..start-1] is already sorted
+        """
+        a = self.array
+
+        for start in range(start, high):
+            pivot = a[start]
+
+            # Find the insertion point, after any equal keys for stability
+            left, right = low, start
+            while left < right:
+                mid = (left + right) >> 1
+                if self._less(pivot, a[mid], start, mid):
+                    right = mid
+                else:
+                    left = mid + 1
+
+            if not self.headless:
+                yield
+
+            # Shift the larger elements one position to the right
+            for k in range(start, left, -1):
+                a[k] = a[k - 1]
+                if not self.headless:
+                    self.update_callback('shift', [k - 1, k], [a[k - 1], a[k]])
+                    yield
+
+            a[left] = pivot
+            if not self.headless:
+                self.update_callback('insert', [left], [pivot])
+                yield
+
+    def _merge_collapse(self):
+        """
+        Merge runs until the stack invariants hold again:
+        len[-3] > len[-2] + len[-1] and len[-2] > len[-1]
+        """
+        runs = self.runs
+
+        while len(runs) > 1 and self.is_running:
+            n = len(runs) - 2
+            if ((n > 0 and runs[n - 1][1] <= runs[n][1] + runs[n + 1][1]) or
+                    (n > 1 and runs[n - 2][1] <= runs[n - 1][1] + runs[n][1])):
+                if runs[n - 1][1] < runs[n + 1][1]:
+                    n -= 1
+                yield from self._merge_at(n)
+            elif runs[n][1] <= runs[n + 1][1]:
+                yield from self._merge_at(n)
+            else:
+                break
+
+    def _merge_force_collapse(self):
+        """Merge all remaining runs into one"""
+        runs = self.runs
+
+        while len(runs) > 1 and self.is_running:
+            n = len(runs) - 2
+            if n > 0 and runs[n - 1][1] < runs[n + 1][1]:
+                n -= 1
+            yield from self._merge_at(n)
+
+    def _merge_at(self, index):
+        """
+        Merge the runs at stack positions index and index + 1
+        """
+        a = self.array
+        base1, len1 = self.runs[index]
+        base2, len2 = self.runs[index + 1]
+
+        self.runs[index] = (base1, len1 + len2)
+        del self.runs[index + 1]
+
+        # Elements of run 1 that are <= run 2's first element are already in place
+        k = self._gallop_right(a[base2], a, base1, len1, 0, base2, 0)
+        base1 += k
+        len1 -= k
+        if len1 == 0:
+            return
+
+        # Elements of run 2 that are >= run 1's last element are already in place
+        len2 = self._gallop_left(a[base1 + len1 - 1], a, base2, len2, len2 - 1, base1 + len1 - 1, 0)
+        if len2 == 0:
+            return
+
+        # Copy the shorter run out and merge from that end
+        if len1 <= len2:
+            yield from self._merge_lo(base1, len1, base2, len2)
+        else:
+            yield from self._merge_hi(base1, len1, base2, len2)
+
+    def _gallop_left(self, key, seq, base, length, hint, key_index, origin):
+        """
+        Locate key in the sorted seq[base..base+length-1], starting near hint
+
+        Args:
+            key_index: Array position to highlight for the key
+            origin: Offset added to seq positions to get array positions
+
+        Returns:
+            k such that seq[base+k-1] < key <= seq[base+k]
+        """
+        last_offset, offset = 0, 1
+        at = base + hint
+
+        if self._less(seq[at], key, origin + at, key_index):
+            # Gallop right until seq[at+last_offset] < key <= seq[at+offset]
+            max_offset = length - hint
+            while offset < max_offset and self._less(seq[at + offset], key, origin + at + offset, key_index):
+                last_offset = offset
+                offset = (offset << 1) + 1
+            offset = min(offset, max_offset)
+            last_offset += hint
+            offset += hint
+        else:
+            # Gallop left until seq[at-offset] < key <= seq[at-last_offset]
+            max_offset = hint + 1
+            while offset < max_offset and not self._less(seq[at - offset], key, origin + at - offset, key_index):
+                last_offset = offset
+                offset = (offset << 1) + 1
+            offset = min(offset, max_offset)
+            last_offset, offset = hint - offset, hint - last_offset
+
+        # Binary search in seq[base+last_offset+1 .. base+offset]
+        last_offset += 1
+        while last_offset < offset:
+            mid = last_offset + ((offset - last_offset) >> 1)
+            if self._less(seq[base + mid], key, origin + base + mid, key_index):
+                last_offset = mid + 1
+            else:
+                offset = mid
+        return offset
+
+    def _gallop_right(self, key, seq, base, length, hint, key_index, origin):
+        """
+        Like _gallop_left, but places key after any equal elements
+
+        Returns:
+            k such that seq[base+k-1] <= key < seq[base+k]
+        """
+        last_offset, offset = 0, 1
+        at = base + hint
+
+        if self._less(key, seq[at], key_index, origin + at):
+            # Gallop left until seq[at-offset] <= key < seq[at-last_offset]
+            max_offset = hint + 1
+            while offset < max_offset and self._less(key, seq[at - offset], key_index, origin + at - offset):
+                last_offset = offset
+                offset = (offset << 1) + 1
+            offset = min(offset, max_offset)
+            last_offset, offset = hint - offset, hint - last_offset
+        else:
+            # Gallop right until seq[at+last_offset] <= key < seq[at+offset]
+            max_offset = length - hint
+            while offset < max_offset and not self._less(key, seq[at + offset], key_index, origin + at + offset):
+                last_offset = offset
+                offset = (offset << 1) + 1
+            offset = min(offset, max_offset)
+            last_offset += hint
+            offset += hint
+
+        # Binary search in seq[base+last_offset+1 .. base+offset]
+        last_offset += 1
+        while last_offset < offset:
+            mid = last_offset + ((offset - last_offset) >> 1)
+            if self._less(key, seq[base + mid], key_index, origin + base + mid):
+                offset = mid
+            else:
+                last_offset = mid + 1
+        return offset
+
+    def _merge_lo(self, base1, len1, base2, len2):
+        """
+        Merge adjacent runs left to right, where run 1 is the shorter one
+        Run 1 is copied out, and its first element is known to be greater
+        than run 2's first element
+        """
+        a = self.array
+        visual = not self.headless
+        temp = a[base1:base1 + len1].copy()
+        self.aux_space = max(self.aux_space, len1)
+        i, j, dest = 0, base2, base1
+
+        # Run 2's first element is known to come first
+        self._write(dest, a[j])
+        if visual:
+            yield
+        dest += 1
+        j += 1
+        len2 -= 1
+
+        min_gallop = self.min_gallop
+
+        while len2 > 0 and len1 > 1:
+            a_count = b_count = 0
+
+            # Plain merge until one run starts winning consistently
+            while True:
+                if self._less(a[j], temp[i], j, base1 + i):
+                    self._write(dest, a[j])
+                    dest += 1
+                    j += 1
+                    len2 -= 1
+                    b_count += 1
+                    a_count = 0
+                    if visual:
+                        yield
+                    if len2 == 0 or b_count >= min_gallop:
+                        break
+                else:
+                    self._write(dest, temp[i])
+                    dest += 1
+                    i += 1
+                    len1 -= 1
+                    a_count += 1
+                    b_count = 0
+                    if visual:
+                        yield
+                    if len1 == 1 or a_count >= min_gallop:
+                        break
+
+            if len2 == 0 or len1 == 1:
+                break
+
+            # Galloping mode: copy whole blocks found by exponential search
+            min_gallop += 1
+            while True:
+                min_gallop -= min_gallop > 1
+                self.min_gallop = min_gallop
+
+                a_count = self._gallop_right(a[j], temp, i, len1, 0, j, base1)
+                for _ in range(a_count):
+                    self._write(dest, temp[i])
+                    dest += 1
+                    i += 1
+                    if visual:
+                        yield
+                len1 -= a_count
+                if len1 <= 1:
+                    break
+
+                self._write(dest, a[j])
+                dest += 1
+                j += 1
+                len2 -= 1
+                if visual:
+                    yield
+                if len2 == 0:
+                    break
+
+                b_count = self._gallop_left(temp[i], a, j, len2, 0, base1 + i, 0)
+                for _ in range(b_count):
+                    self._write(dest, a[j])
+                    dest += 1
+                    j += 1
+                    if visual:
+                        yield
+                len2 -= b_count
+                if len2 == 0:
+                    break
+
+                self._write(dest, temp[i])
+                dest += 1
+                i += 1
+                len1 -= 1
+                if visual:
+                    yield
+                if len1 <= 1:
+                    break
+
+                if a_count < MIN_GALLOP and b_count < MIN_GALLOP:
+                    # Penalize leaving galloping mode
+                    min_gallop += 1
+                    self.min_gallop = min_gallop
+                    break
+
+        if len1 == 1 and len2 > 0:
+            # Run 2's remainder comes before the last element of run 1
+            for _ in range(len2):
+                self._write(dest, a[j])
+                dest += 1
+                j += 1
+                if visual:
+                    yield
+            self._write(dest, temp[i])
+        else:
+            # Run 2 is exhausted, so the rest of run 1 goes last
+            for _ in range(len1):
+                self._write(dest, temp[i])
+                dest += 1
+                i += 1
+                if visual:
+                    yield
+
+    def _merge_hi(self, base1, len1, base2, len2):
+        """
+        Merge adjacent runs right to left, where run 2 is the shorter one
+        Run 2 is copied out, and run 1's last element is known to be
+        greater than run 2's last element
+        """
+        a = self.array
+        visual = not self.headless
+        temp = a[base2:base2 + len2].copy()
+        self.aux_space = max(self.aux_space, len2)
+        i, t, dest = base1 + len1 - 1, len2 - 1, base2 + len2 - 1
+
+        # Run 1's last element is known to come last
+        self._write(dest, a[i])
+        if visual:
+            yield
+        dest -= 1
+        i -= 1
+        len1 -= 1
+
+        min_gallop = self.min_gallop
+
+        while len1 > 0 and len2 > 1:
+            a_count = b_count = 0
+
+            # Plain merge until one run starts winning consistently
+            while True:
+                if self._less(temp[t], a[i], base2 + t, i):
+                    self._write(dest, a[i])
+                    dest -= 1
+                    i -= 1
+                    len1 -= 1
+                    a_count += 1
+                    b_count = 0
+                    if visual:
+                        yield
+                    if len1 == 0 or a_count >= min_gallop:
+                        break
+                else:
+                    self._write(dest, temp[t])
+                    dest -= 1
+                    t -= 1
+                    len2 -= 1
+                    b_count += 1
+                    a_count = 0
+                    if visual:
+                        yield
+                    if len2 == 1 or b_count >= min_gallop:
+                        break
+
+            if len1 == 0 or len2 == 1:
+                break
+
+            # Galloping mode: copy whole blocks found by exponential search
+            min_gallop += 1
+            while True:
+                min_gallop -= min_gallop > 1
+                self.min_gallop = min_gallop
+
+                a_count = len1 - self._gallop_right(temp[t], a, base1, len1, len1 - 1, base2 + t, 0)
+                for _ in range(a_count):
+                    self._write(dest, a[i])
+                    dest -= 1
+                    i -= 1
+                    if visual:
+                        yield
+                len1 -= a_count
+                if len1 == 0:
+                    break
+
+                self._write(dest, temp[t])
+                dest -= 1
+                t -= 1
+                len2 -= 1
+                if visual:
+                    yield
+                if len2 == 1:
+                    break
+
+                b_count = len2 - self._gallop_left(a[i], temp, 0, len2, len2 - 1, i, base2)
+                for _ in range(b_count):
+                    self._write(dest, temp[t])
+                    dest -= 1
+                    t -= 1
+                    if visual:
+                        yield
+                len2 -= b_count
+                if len2 <= 1:
+                    break
+
+                self._write(dest, a[i])
+                dest -= 1
+                i -= 1
+                len1 -= 1
+                if visual:
+                    yield
+                if len1 == 0:
+                    break
+
+                if a_count < MIN_GALLOP and b_count < MIN_GALLOP:
+                    # Penalize leaving galloping mode
+                    min_gallop += 1
+                    self.min_gallop = min_gallop
+                    break
+
+        if len2 == 1 and len1 > 0:
+            # Run 1's remainder comes after the first element of run 2
+            for _ in range(len1):
+                self._write(dest, a[i])
+                dest -= 1
+                i -= 1
+                if visual:
+                    yield
+            self._write(dest, temp[t])
+        else:
+            # Run 1 is exhausted, so the rest of run 2 goes first
+            for _ in range(len2):
+                self._write(dest, temp[t])
+                dest -= 1
+                t -= 1
+                if visual:
+                    yield
+
+    def get_complexity_info(self):
+        """Return complexity information for tim sort"""
+        return {
+            'name': 'Tim Sort',
+            'time_best': 'O(n)',
+            'time_average': 'O(n log n)',
+            'time_worst': 'O(n log n)',
+            'space': 'O(n)',
+            'stable': True,
+            'in_place': False,
+            'description': (
+                "Finds runs that are already ascending or descending, extends "
+                "short runs with binary insertion sort, then merges runs while "
+                "galloping through long stretches won by one side. Nearly "
+                "sorted input needs close to n comparisons."
+            )
+        }
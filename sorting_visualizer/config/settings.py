@@ -16,26 +16,65 @@ APP_CONFIG = {
 # Animation Settings
 ANIMATION_CONFIG = {
     'SPEED_MIN': 1,
-    'SPEED_MAX': 10,
-    'SPEED_DEFAULT': 5,
+    'SPEED_MAX': 100,  # the top position runs to completion and draws the result
+    'SPEED_DEFAULT': 25,
+    'STEPS_PER_SECOND_MIN': 1,  # at SPEED_MIN; rising logarithmically with the slider
+    'STEPS_PER_SECOND_MAX': 1000000,  # at SPEED_MAX - 1
     'DELAY_BASE': 100,  # milliseconds
+    'FRAME_RATE': 60,  # frames drawn per second while sorting
+    'STEP_TIME_FRACTION': 0.5,  # share of each frame interval spent running steps
+    'TURBO_TIME_FRACTION': 0.9,  # the same share when running to completion
+    'RATE_UPDATE_INTERVAL': 0.5,  # seconds between achieved steps/s updates
 }
 
 # Array Settings
 ARRAY_CONFIG = {
     'SIZE_MIN': 10,
-    'SIZE_MAX': 200,
+    'SIZE_MAX': 1000000,
+    'SIZE_SLIDER_STEPS': 100,  # positions of the logarithmic size slider
     'SIZE_DEFAULT': 50,
     'VALUE_MIN': 10,
     'VALUE_MAX': 400,
 }
 
+# Parallel Sorting Settings
+PARALLEL_CONFIG = {
+    'MIN_PARALLEL_SIZE': 100000,  # smaller headless runs stay serial
+    'MAX_WORKERS': None,  # None uses every available core
+}
+
+# Benchmark Settings
+BENCHMARK_CONFIG = {
+    'WARMUP_RUNS': 1,  # untimed runs before the trials of each cell
+    'TRIALS': 7,
+    'SIZES': [1000, 2000, 4000, 8000],
+    'SEED': 42,
+    'QUADRATIC_SIZE_LIMIT': 4000,  # larger cells skip O(n²) algorithms
+    'MAX_WORKERS': 1,  # concurrent cells; more is faster but noisier
+    'PIN_CPUS': True,  # pin each worker to its own CPU where supported
+    'MEMORY_LIMIT': None,  # address space cap per worker in bytes, None for no cap
+}
+
+# Regression Gate Settings
+REGRESSION_CONFIG = {
+    'DISTRIBUTIONS': ['random', 'sorted', 'reversed', 'few_unique'],
+    'SIZES': [256, 1024],
+    'TRIALS': 9,
+    'WARMUP_RUNS': 1,
+    'SEED': 42,
+    'ALPHA': 0.01,  # significance level of the one-sided Mann-Whitney U test
+    'MIN_SLOWDOWN': 0.05,  # median slowdowns below this fraction are never flagged
+    'MIN_BASELINE_SAMPLES': 5,  # fewer timing samples per cell can never reach ALPHA
+}
+
 # Visual Settings
 VISUAL_CONFIG = {
     'CANVAS_WIDTH': 800,
     'CANVAS_HEIGHT': 500,
     'BAR_GAP_RATIO': 0.1,
     'BAR_MIN_WIDTH': 2,
+    'RENDERER': 'auto',  # 'bars', 'raster', or 'auto' to pick by array size
+    'RASTER_THRESHOLD': 1000,  # 'auto' rasterizes arrays larger than this
 }
 
 # Color Scheme
@@ -55,6 +94,7 @@ COLORS = {
     'bar_sorted': '#2ECC71',
     'bar_pivot': '#9B59B6',
     'bar_current': '#1ABC9C',
+    'bar_reading': '#F1C40F',
 }
 
 # Algorithm Complexity Data
@@ -118,5 +158,65 @@ ALGORITHM_COMPLEXITY = {
         'stable': False,
         'in_place': True,
         'description': 'Builds a max heap from the array, then repeatedly extracts the maximum element.'
+    },
+    'intro_sort': {
+        'name': 'Intro Sort',
+        'time_best': 'O(n log n)',
+        'time_average': 'O(n log n)',
+        'time_worst': 'O(n log n)',
+        'space': 'O(log n)',
+        'stable': False,
+        'in_place': True,
+        'description': 'Quick sort with median-of-three pivots, a heap sort fallback for deep partitioning and insertion sort for small partitions.'
+    },
+    'quick_sort_3way': {
+        'name': 'Quick Sort (3-way)',
+        'time_best': 'O(n)',
+        'time_average': 'O(n log n)',
+        'time_worst': 'O(n²)',
+        'space': 'O(log n)',
+        'stable': False,
+        'in_place': True,
+        'description': 'Partitions around a pivot into less-than, equal-to and greater-than bands, so duplicate keys are never partitioned again.'
+    },
+    'tim_sort': {
+        'name': 'Tim Sort',
+        'time_best': 'O(n)',
+        'time_average': 'O(n log n)',
+        'time_worst': 'O(n log n)',
+        'space': 'O(n)',
+        'stable': True,
+        'in_place': False,
+        'description': 'Adaptive merge sort that exploits existing runs and gallops through long one-sided stretches.'
+    },
+    'counting_sort': {
+        'name': 'Counting Sort',
+        'time_best': 'O(n + k)',
+        'time_average': 'O(n + k)',
+        'time_worst': 'O(n + k)',
+        'space': 'O(k)',
+        'stable': True,
+        'in_place': False,
+        'description': 'Counts how often each integer value occurs and writes the values back in order, without comparisons.'
+    },
+    'radix_sort': {
+        'name': 'Radix Sort (LSD)',
+        'time_best': 'O(d(n + b))',
+        'time_average': 'O(d(n + b))',
+        'time_worst': 'O(d(n + b))',
+        'space': 'O(n + b)',
+        'stable': True,
+        'in_place': False,
+        'description': 'Distributes integers by one digit at a time, least significant first, with a stable counting pass per digit.'
+    },
+    'parallel_merge_sort': {
+        'name': 'Parallel Merge Sort',
+        'time_best': 'O(n log n / p)',
+        'time_average': 'O(n log n / p)',
+        'time_worst': 'O(n log n / p)',
+        'space': 'O(n)',
+        'stable': True,
+        'in_place': False,
+        'description': 'Sorts one chunk per core in worker processes over shared memory, then merges neighbouring runs in parallel.'
     }
 }
@@ -0,0 +1,253 @@
+"""
+Bar chart renderer that keeps its matplotlib artists between frames
+
+The bars, labels and axes are laid out once per array. After that a frame
+only changes the heights and face colors of the bars that changed: their
+columns are restored from a cached copy of the static background (axes,
+labels, ticks), the changed bars are drawn on top, and just that part of
+the canvas is blitted to the screen. Any full draw of the figure, such as
+after a resize, re-caches the background.
+
+Bars can also show a range instead of a single value (see draw's lows):
+solid up to the low end, and a lighter band of the same color up to the
+high end.
+"""
+
+import math
+
+import numpy as np
+from matplotlib.colors import to_hex, to_rgb
+from matplotlib.transforms import Bbox
+
+from config.settings import COLORS
+
+# Arrays up to this size get a value label above each bar
+VALUE_LABEL_LIMIT = 20
+
+# Weight of the bar color in the lighter band above a bar's low end
+ENVELOPE_ALPHA = 0.5
+
+def envelope_color(color):
+    """Color of the band between a bar's low and high ends"""
+    background = to_rgb(COLORS['background'])
+    return to_hex([ENVELOPE_ALPHA * c + (1 - ENVELOPE_ALPHA) * b
+                   for c, b in zip(to_rgb(color), background)])
+
+class BarRenderer:
+    def __init__(self, figure, ax, canvas):
+        """
+        Set up the renderer on an existing axes
+
+        Args:
+            figure: Matplotlib figure holding the axes
+            ax: Axes to draw the bars in
+            canvas: Figure canvas (FigureCanvasTkAgg, or any Agg canvas)
+        """
+        self.figure = figure
+        self.ax = ax
+        self.canvas = canvas
+
+        self.bars = []
+        self.floors = []  # solid lower parts of the bars, when drawing ranges
+        self.labels = []
+        self.values = []
+        self.lows = None
+        self.colors = []
+        self.y_max = 0
+        self.background = None
+
+        # Number of full layouts and partial frames, for diagnostics
+        self.layout_count = 0
+        self.frame_count = 0
+
+        # A full draw (first show, resize, relayout) invalidates the background
+        self._draw_connection = canvas.mpl_connect('draw_event', self._on_draw)
+
+    def draw(self, values, colors, lows=None):
+        """
+        Lay out the axes and bars for a new array and draw everything
+
+        Args:
+            values: Bar heights
+            colors: Bar face colors, one per value
+            lows: Optional low ends, one per value, for bars showing a range
+        """
+        self.values = list(values)
+        self.lows = list(lows) if lows is not None else None
+        self.colors = list(colors)
+        self.layout_count += 1
+
+        self.ax.clear()
+        self.style_axes()
+        self.bars = []
+        self.floors = []
+        self.labels = []
+
+        if not self.values:
+            self.y_max = 0
+            self.canvas.draw()
+            return
+
+        self.y_max = max(self.values) * 1.1 or 1
+        self.bars = list(self.ax.bar(
+            np.arange(len(self.values)),
+            self.values,
+            color=[self._bar_color(color) for color in self.colors],
+            edgecolor='white',
+            linewidth=0.5
+        ))
+        if self.lows is not None:
+            self.floors = list(self.ax.bar(
+                np.arange(len(self.values)),
+                self.lows,
+                color=self.colors,
+                linewidth=0
+            ))
+
+        # Add value labels for small arrays
+        if len(self.values) <= VALUE_LABEL_LIMIT:
+            for i, value in enumerate(self.values):
+                self.labels.append(self.ax.text(
+                    i,
+                    value + self.y_max * 0.01,
+                    str(value),
+                    ha='center',
+                    va='bottom',
+                    color=COLORS['text'],
+                    fontsize=8,
+                    clip_on=True
+                ))
+
+        self.ax.set_xlim(-0.5, len(self.values) - 0.5)
+        self.ax.set_ylim(0, self.y_max)
+
+        # Animated artists are left out of full draws, so the cached
+        # background holds only the static parts of the plot
+        for artist in self.bars + self.floors + self.labels:
+            artist.set_animated(True)
+
+        self.canvas.draw()
+
+    def _bar_color(self, color):
+        """Face color of a full-height bar (lighter when showing ranges)"""
+        return color if self.lows is None else envelope_color(color)
+
+    def close(self):
+        """Stop listening to the canvas, before another renderer takes over"""
+        self.canvas.mpl_disconnect(self._draw_connection)
+
+    def style_axes(self):
+        """Apply the color scheme and labels to the (cleared) axes"""
+        self.ax.set_facecolor(COLORS['background'])
+        self.ax.set_xlabel('Array Index', color=COLORS['text'])
+        self.ax.set_ylabel('Value', color=COLORS['text'])
+        self.ax.set_title('Sorting Algorithm Visualization', color=COLORS['text'])
+
+        self.ax.tick_params(colors=COLORS['text'])
+        for spine in self.ax.spines.values():
+            spine.set_color(COLORS['text'])
+
+    def update(self, indices, values, colors, lows=None):
+        """
+        Change some bars and redraw them over the cached background
+
+        Args:
+            indices: Indices of the bars whose height or color may have changed
+            values: Full list of bar heights
+            colors: Full list of bar face colors
+            lows: Full list of low ends, when the bars show ranges
+        """
+        if len(values) != len(self.bars) or (lows is None) != (self.lows is None):
+            self.draw(values, colors, lows)
+            return
+
+        for i in indices:
+            value, color = values[i], colors[i]
+            if value != self.values[i]:
+                if value > self.y_max:
+                    # Out of the axes' range: lay everything out again
+                    self.draw(values, colors, lows)
+                    return
+                self.values[i] = value
+                self.bars[i].set_height(value)
+                if self.labels:
+                    self.labels[i].set_text(str(value))
+                    self.labels[i].set_y(value + self.y_max * 0.01)
+            if color != self.colors[i]:
+                self.colors[i] = color
+                self.bars[i].set_facecolor(self._bar_color(color))
+                if self.floors:
+                    self.floors[i].set_facecolor(color)
+            if lows is not None and lows[i] != self.lows[i]:
+                self.lows[i] = lows[i]
+                self.floors[i].set_height(lows[i])
+
+        self.frame_count += 1
+        self.blit(indices)
+
+    def blit(self, indices=None):
+        """
+        Redraw bars over the background and show the result
+
+        Args:
+            indices: Bars to redraw (default: all of them)
+        """
+        if self.background is None or not self.canvas.supports_blit:
+            self.canvas.draw_idle()
+            return
+
+        indices = sorted(set(indices)) if indices is not None else None
+        if indices is None or len(indices) * 4 > len(self.bars):
+            self.canvas.restore_region(self.background)
+            self._draw_animated()
+            self.canvas.blit(self.ax.bbox)
+            return
+        if not indices:
+            return
+
+        # Restore the background of each changed bar's column only; xy is
+        # the region's own origin, so each column lands where it came from
+        origin_x, top, _, bottom = self.background.get_extents()
+        axes = self.ax.bbox
+        columns = [self._column(i) for i in indices]
+
+        # Bars this many slots away can still reach into a column with their
+        # edge lines, which matters once slots are only a few pixels wide
+        slot_width = axes.width / len(self.bars)
+        reach = 1 + math.ceil(2 / slot_width)
+
+        for i, (left, right) in zip(indices, columns):
+            self.canvas.restore_region(self.background, bbox=(left, top, right, bottom),
+                                       xy=(origin_x, top))
+
+            # Those neighbours are redrawn too, clipped to the column so
+            # nothing outside it is painted twice (the restored pixel range
+            # includes its right end); layer by layer, as in a full draw
+            clip = Bbox.from_extents(left, axes.y0, min(right + 1, axes.x1), axes.y1)
+            neighbours = slice(max(0, i - reach), min(len(self.bars), i + reach + 1))
+            for layer in [self.bars, self.floors, self.labels]:
+                for artist in layer[neighbours]:
+                    artist.set_clip_box(clip)
+                    self.ax.draw_artist(artist)
+                    artist.set_clip_box(axes)
+
+        self.canvas.blit(Bbox.from_extents(
+            min(left for left, _ in columns), axes.y0,
+            max(right for _, right in columns) + 1, axes.y1
+        ))
+
+    def _column(self, index):
+        """Pixel range (left, right) of a bar's slot, clipped to the axes"""
+        (left, _), (right, _) = self.ax.transData.transform([(index - 0.5, 0), (index + 0.5, 0)])
+        axes = self.ax.bbox
+        return max(math.floor(left), int(axes.x0)), min(math.ceil(right), int(math.ceil(axes.x1)))
+
+    def _on_draw(self, event):
+        """Cache the freshly drawn static background, then add the bars"""
+        self.background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._draw_animated()
+
+    def _draw_animated(self):
+        """Draw the bars and value labels onto the canvas renderer"""
+        for artist in self.bars + self.floors + self.labels:
+            self.ax.draw_artist(artist)
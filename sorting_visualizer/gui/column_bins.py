@@ -0,0 +1,79 @@
+"""
+Per-pixel-column summary of an array wider than the canvas
+
+When an array has more elements than the plot has pixel columns, drawing
+each element is mostly overdraw. The elements are binned into contiguous
+runs instead, one per pixel column, and only each column's minimum and
+maximum are drawn. Writes keep the bins current incrementally: a column
+only has to be rescanned when a write removes its current extreme, so the
+cost of a frame follows the number of columns touched rather than the
+array length.
+"""
+
+import numpy as np
+
+class ColumnBins:
+    def __init__(self, values, columns):
+        """
+        Bin an array into pixel columns
+
+        Args:
+            values: Array to summarize (at least as many values as columns)
+            columns: Number of pixel columns
+        """
+        self.values = np.array(values, dtype=float)
+        self.columns = columns
+
+        size = len(self.values)
+        self.starts = np.arange(columns) * size // columns
+        self.stops = np.arange(1, columns + 1) * size // columns
+        self.lows = np.minimum.reduceat(self.values, self.starts)
+        self.highs = np.maximum.reduceat(self.values, self.starts)
+
+        self.changed = set()  # columns written since the last flush
+        self.stale = set()  # columns whose extreme was overwritten
+
+    def column_of(self, index):
+        """Pixel column holding an element"""
+        return ((index + 1) * self.columns - 1) // len(self.values)
+
+    def write(self, indices, values):
+        """
+        Apply a write delta to the array and its bins
+
+        Args:
+            indices: Indices written
+            values: New values at those indices
+        """
+        for index, value in zip(indices, values):
+            column = self.column_of(index)
+            old = self.values[index]
+            self.values[index] = value
+            self.changed.add(column)
+
+            if value >= self.highs[column]:
+                self.highs[column] = value
+            elif old == self.highs[column]:
+                self.stale.add(column)
+
+            if value <= self.lows[column]:
+                self.lows[column] = value
+            elif old == self.lows[column]:
+                self.stale.add(column)
+
+    def flush(self):
+        """
+        Finish the writes of a frame
+
+        Returns:
+            Sorted list of the columns written since the last flush
+        """
+        for column in self.stale:
+            values = self.values[self.starts[column]:self.stops[column]]
+            self.lows[column] = values.min()
+            self.highs[column] = values.max()
+
+        changed = sorted(self.changed)
+        self.changed = set()
+        self.stale = set()
+        return changed
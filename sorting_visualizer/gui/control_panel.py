@@ -2,10 +2,51 @@
 Control panel with buttons, sliders, and algorithm information
 """
 
+import math
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from config.settings import COLORS, ANIMATION_CONFIG, ARRAY_CONFIG, ALGORITHM_COMPLEXITY
 from utils.complexity_analyzer import ComplexityAnalyzer
+from .frame_pacer import format_speed
+
+# File dialog choices for loading and saving arrays
+ARRAY_FILE_TYPES = [
+    ("Text files", "*.txt"),
+    ("CSV files", "*.csv"),
+    ("NumPy arrays", "*.npy"),
+    ("Raw int32 values", "*.i32"),
+    ("Raw float64 values", "*.f64"),
+    ("All files", "*.*")
+]
+
+# Renderer choices, shown name -> VisualizationCanvas renderer mode
+RENDERER_MODES = {
+    'Auto': 'auto',
+    'Bars': 'bars',
+    'Raster': 'raster',
+}
+
+def array_size_for_position(position):
+    """
+    Array size for a size slider position
+
+    The slider is logarithmic, so it covers SIZE_MIN to SIZE_MAX with the
+    same precision at every scale.
+
+    Args:
+        position: Slider position from 0 to SIZE_SLIDER_STEPS
+
+    Returns:
+        Number of elements
+    """
+    low, high = ARRAY_CONFIG['SIZE_MIN'], ARRAY_CONFIG['SIZE_MAX']
+    return int(round(low * (high / low) ** (position / ARRAY_CONFIG['SIZE_SLIDER_STEPS'])))
+
+def position_for_array_size(size):
+    """Size slider position closest to an array size"""
+    low, high = ARRAY_CONFIG['SIZE_MIN'], ARRAY_CONFIG['SIZE_MAX']
+    size = min(max(size, low), high)
+    return int(round(math.log(size / low) / math.log(high / low) * ARRAY_CONFIG['SIZE_SLIDER_STEPS']))
 
 class ControlPanel(tk.Frame):
     def __init__(self, parent, main_window, **kwargs):
@@ -27,7 +68,8 @@ class ControlPanel(tk.Frame):
         # Variables for UI controls
         self.algorithm_var = tk.StringVar(value='bubble_sort')
         self.speed_var = tk.IntVar(value=ANIMATION_CONFIG['SPEED_DEFAULT'])
-        self.size_var = tk.IntVar(value=ARRAY_CONFIG['SIZE_DEFAULT'])
+        self.size_position_var = tk.IntVar(value=position_for_array_size(ARRAY_CONFIG['SIZE_DEFAULT']))
+        self.renderer_var = tk.StringVar(value='Auto')
 
         # State variables
         self.is_sorting = False
@@ -64,7 +106,13 @@ class ControlPanel(tk.Frame):
                 ('selection_sort', 'Selection Sort'),
                 ('merge_sort', 'Merge Sort'),
                 ('quick_sort', 'Quick Sort'),
-                ('heap_sort', 'Heap Sort')
+                ('heap_sort', 'Heap Sort'),
+                ('intro_sort', 'Intro Sort'),
+                ('quick_sort_3way', 'Quick Sort (3-way)'),
+                ('tim_sort', 'Tim Sort'),
+                ('counting_sort', 'Counting Sort'),
+                ('radix_sort', 'Radix Sort (LSD)'),
+                ('parallel_merge_sort', 'Parallel Merge Sort')
             ],
             state='readonly'
         )
@@ -74,7 +122,13 @@ class ControlPanel(tk.Frame):
             'Selection Sort', 
             'Merge Sort',
             'Quick Sort',
-            'Heap Sort'
+            'Heap Sort',
+            'Intro Sort',
+            'Quick Sort (3-way)',
+            'Tim Sort',
+            'Counting Sort',
+            'Radix Sort (LSD)',
+            'Parallel Merge Sort'
         ]
         self.algorithm_combo.current(0)
 
@@ -86,12 +140,22 @@ class ControlPanel(tk.Frame):
             fg=COLORS['text']
         ).grid(row=2, column=0, sticky='w', padx=5, pady=5)
 
+        # The slider is logarithmic, so its position is shown as a size
+        self.size_label = tk.Label(
+            self.control_frame,
+            text=f"{self.get_array_size():,} elements",
+            bg=COLORS['surface'],
+            fg=COLORS['text']
+        )
+
         self.size_scale = tk.Scale(
             self.control_frame,
-            from_=ARRAY_CONFIG['SIZE_MIN'],
-            to=ARRAY_CONFIG['SIZE_MAX'],
+            from_=0,
+            to=ARRAY_CONFIG['SIZE_SLIDER_STEPS'],
             orient=tk.HORIZONTAL,
-            variable=self.size_var,
+            variable=self.size_position_var,
+            showvalue=False,
+            command=self.on_size_moved,
             bg=COLORS['surface'],
             fg=COLORS['text'],
             highlightbackground=COLORS['surface']
@@ -105,17 +169,43 @@ class ControlPanel(tk.Frame):
             fg=COLORS['text']
         ).grid(row=4, column=0, sticky='w', padx=5, pady=5)
 
+        # The slider is logarithmic, so its position is shown as steps/s
+        self.speed_label = tk.Label(
+            self.control_frame,
+            text=format_speed(self.speed_var.get()),
+            bg=COLORS['surface'],
+            fg=COLORS['text']
+        )
+
         self.speed_scale = tk.Scale(
             self.control_frame,
             from_=ANIMATION_CONFIG['SPEED_MIN'],
             to=ANIMATION_CONFIG['SPEED_MAX'],
             orient=tk.HORIZONTAL,
             variable=self.speed_var,
+            showvalue=False,
+            command=self.on_speed_changed,
             bg=COLORS['surface'],
             fg=COLORS['text'],
             highlightbackground=COLORS['surface']
         )
 
+        # Renderer selection
+        tk.Label(
+            self.control_frame,
+            text="Renderer:",
+            bg=COLORS['surface'],
+            fg=COLORS['text']
+        ).grid(row=6, column=0, sticky='w', padx=5, pady=5)
+
+        self.renderer_combo = ttk.Combobox(
+            self.control_frame,
+            textvariable=self.renderer_var,
+            values=list(RENDERER_MODES),
+            state='readonly',
+            width=8
+        )
+
         # Action buttons frame
         self.buttons_frame = tk.Frame(self.control_frame, bg=COLORS['surface'])
 
@@ -167,6 +257,41 @@ class ControlPanel(tk.Frame):
             bd=2
         )
 
+        # Save array button
+        self.save_array_btn = tk.Button(
+            self.buttons_frame,
+            text="Save Array",
+            command=self.save_array,
+            bg=COLORS['text_secondary'],
+            fg='white',
+            font=('Arial', 10, 'bold'),
+            relief='raised',
+            bd=2
+        )
+
+        # Trace buttons
+        self.save_trace_btn = tk.Button(
+            self.buttons_frame,
+            text="Save Trace",
+            command=self.save_trace,
+            bg=COLORS['text_secondary'],
+            fg='white',
+            font=('Arial', 10, 'bold'),
+            relief='raised',
+            bd=2
+        )
+
+        self.replay_trace_btn = tk.Button(
+            self.buttons_frame,
+            text="Replay Trace",
+            command=self.replay_trace,
+            bg=COLORS['text_secondary'],
+            fg='white',
+            font=('Arial', 10, 'bold'),
+            relief='raised',
+            bd=2
+        )
+
         # Algorithm info frame
         self.info_frame = tk.LabelFrame(
             self,
@@ -222,6 +347,13 @@ class ControlPanel(tk.Frame):
             fg=COLORS['text']
         )
 
+        self.frames_label = tk.Label(
+            self.stats_frame,
+            text="Frames: 0 (0 coalesced steps, 0 dropped)",
+            bg=COLORS['surface'],
+            fg=COLORS['text']
+        )
+
     def layout_widgets(self):
         """Layout all widgets using grid"""
         # Main frames
@@ -231,16 +363,23 @@ class ControlPanel(tk.Frame):
 
         # Control frame layout
         self.algorithm_combo.grid(row=1, column=0, columnspan=2, sticky='ew', padx=5, pady=2)
+        self.size_label.grid(row=2, column=1, sticky='e', padx=5, pady=5)
         self.size_scale.grid(row=3, column=0, columnspan=2, sticky='ew', padx=5, pady=2)
+        self.speed_label.grid(row=4, column=1, sticky='e', padx=5, pady=5)
         self.speed_scale.grid(row=5, column=0, columnspan=2, sticky='ew', padx=5, pady=2)
 
-        self.buttons_frame.grid(row=6, column=0, columnspan=2, pady=10)
+        self.renderer_combo.grid(row=6, column=1, sticky='e', padx=5, pady=5)
+
+        self.buttons_frame.grid(row=7, column=0, columnspan=2, pady=10)
 
         # Buttons layout
         self.generate_btn.pack(side='top', fill='x', pady=2)
         self.start_btn.pack(side='top', fill='x', pady=2)
         self.reset_btn.pack(side='top', fill='x', pady=2)
         self.load_btn.pack(side='top', fill='x', pady=2)
+        self.save_array_btn.pack(side='top', fill='x', pady=2)
+        self.save_trace_btn.pack(side='top', fill='x', pady=2)
+        self.replay_trace_btn.pack(side='top', fill='x', pady=2)
 
         # Info frame layout
         self.description_text.pack(fill='both', expand=True, padx=5, pady=5)
@@ -250,6 +389,7 @@ class ControlPanel(tk.Frame):
         self.comparisons_label.pack(anchor='w', padx=5, pady=2)
         self.swaps_label.pack(anchor='w', padx=5, pady=2)
         self.time_label.pack(anchor='w', padx=5, pady=2)
+        self.frames_label.pack(anchor='w', padx=5, pady=2)
 
         # Configure column weights
         self.control_frame.columnconfigure(0, weight=1)
@@ -258,6 +398,7 @@ class ControlPanel(tk.Frame):
         """Bind event handlers"""
         self.algorithm_combo.bind('<<ComboboxSelected>>', self.on_algorithm_changed)
         self.size_scale.bind('<ButtonRelease-1>', self.on_size_changed)
+        self.renderer_combo.bind('<<ComboboxSelected>>', self.on_renderer_changed)
 
     def on_algorithm_changed(self, event=None):
         """Handle algorithm selection change"""
@@ -269,6 +410,19 @@ class ControlPanel(tk.Frame):
         if not self.is_sorting:
             self.generate_array()
 
+    def on_size_moved(self, value=None):
+        """Handle size slider movement"""
+        self.size_label.config(text=f"{self.get_array_size():,} elements")
+
+    def on_renderer_changed(self, event=None):
+        """Handle renderer selection change"""
+        if hasattr(self.main_window, 'set_renderer_mode'):
+            self.main_window.set_renderer_mode(RENDERER_MODES[self.renderer_var.get()])
+
+    def on_speed_changed(self, value=None):
+        """Handle speed slider movement"""
+        self.speed_label.config(text=format_speed(self.speed_var.get()))
+
     def get_selected_algorithm(self):
         """Get currently selected algorithm name"""
         selection = self.algorithm_combo.get()
@@ -278,13 +432,19 @@ class ControlPanel(tk.Frame):
             'Selection Sort': 'selection_sort',
             'Merge Sort': 'merge_sort',
             'Quick Sort': 'quick_sort',
-            'Heap Sort': 'heap_sort'
+            'Heap Sort': 'heap_sort',
+            'Intro Sort': 'intro_sort',
+            'Quick Sort (3-way)': 'quick_sort_3way',
+            'Tim Sort': 'tim_sort',
+            'Counting Sort': 'counting_sort',
+            'Radix Sort (LSD)': 'radix_sort',
+            'Parallel Merge Sort': 'parallel_merge_sort'
         }
         return algorithm_map.get(selection, 'bubble_sort')
 
     def get_array_size(self):
         """Get current array size setting"""
-        return self.size_var.get()
+        return array_size_for_position(self.size_position_var.get())
 
     def get_animation_speed(self):
         """Get current animation speed setting"""
@@ -313,11 +473,7 @@ class ControlPanel(tk.Frame):
         """Load array from file"""
         filename = filedialog.askopenfilename(
             title="Load Array Data",
-            filetypes=[
-                ("Text files", "*.txt"),
-                ("CSV files", "*.csv"),
-                ("All files", "*.*")
-            ]
+            filetypes=ARRAY_FILE_TYPES
         )
 
         if filename and hasattr(self.main_window, 'load_array_from_file'):
@@ -326,6 +482,44 @@ class ControlPanel(tk.Frame):
             except Exception as e:
                 messagebox.showerror("Error", f"Could not load file: {str(e)}")
 
+    def save_array(self):
+        """Save the current array to a file"""
+        filename = filedialog.asksaveasfilename(
+            title="Save Array Data",
+            defaultextension=".npy",
+            filetypes=ARRAY_FILE_TYPES
+        )
+
+        if filename and hasattr(self.main_window, 'save_array_to_file'):
+            self.main_window.save_array_to_file(filename)
+
+    def save_trace(self):
+        """Record a run of the selected algorithm to a trace file"""
+        filename = filedialog.asksaveasfilename(
+            title="Save Sorting Trace",
+            defaultextension=".svtrace",
+            filetypes=[
+                ("Sorting traces", "*.svtrace"),
+                ("All files", "*.*")
+            ]
+        )
+
+        if filename and hasattr(self.main_window, 'save_trace'):
+            self.main_window.save_trace(filename)
+
+    def replay_trace(self):
+        """Replay a recorded trace file"""
+        filename = filedialog.askopenfilename(
+            title="Replay Sorting Trace",
+            filetypes=[
+                ("Sorting traces", "*.svtrace"),
+                ("All files", "*.*")
+            ]
+        )
+
+        if filename and hasattr(self.main_window, 'replay_trace'):
+            self.main_window.replay_trace(filename)
+
     def update_algorithm_info(self, algorithm_name):
         """Update algorithm information display"""
         info = self.complexity_analyzer.get_algorithm_complexity(algorithm_name)
@@ -368,14 +562,26 @@ In-place: {'Yes' if info['in_place'] else 'No'}"""
             self.algorithm_combo.config(state='disabled')
             self.generate_btn.config(state='disabled')
             self.load_btn.config(state='disabled')
+            self.save_array_btn.config(state='disabled')
+            self.save_trace_btn.config(state='disabled')
+            self.replay_trace_btn.config(state='disabled')
         else:
             self.start_btn.config(text="Start", bg=COLORS['secondary'])
             self.algorithm_combo.config(state='readonly')
             self.generate_btn.config(state='normal')
             self.load_btn.config(state='normal')
+            self.save_array_btn.config(state='normal')
+            self.save_trace_btn.config(state='normal')
+            self.replay_trace_btn.config(state='normal')
 
     def update_statistics(self, comparisons=0, swaps=0, time_elapsed=0):
         """Update statistics display"""
         self.comparisons_label.config(text=f"Comparisons: {comparisons}")
         self.swaps_label.config(text=f"Swaps: {swaps}")
         self.time_label.config(text=f"Time: {time_elapsed:.2f}s")
+
+    def update_frame_statistics(self, frames=0, coalesced=0, dropped=0):
+        """Update the animation frame counters"""
+        self.frames_label.config(
+            text=f"Frames: {frames} ({coalesced} coalesced steps, {dropped} dropped)"
+        )
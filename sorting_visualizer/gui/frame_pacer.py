@@ -0,0 +1,126 @@
+"""
+Fixed-rate frame pacing and the speed model of the animation loop
+
+Frames are scheduled against absolute deadlines, so a slow frame shortens
+the wait before the next one instead of pushing every later frame back.
+When a frame overruns by whole intervals those frames are skipped, not
+queued, and counted as dropped. Every step beyond the first drawn in a
+frame is counted as coalesced.
+
+Speed slider positions map logarithmically to steps per second, from a
+few steps per second up to thousands of steps per frame, and the top
+position means running to completion and drawing only the result.
+"""
+
+from config.settings import ANIMATION_CONFIG
+
+def steps_per_second_for_speed(speed):
+    """
+    Steps per second for a speed slider position
+
+    Args:
+        speed: Slider position from SPEED_MIN to SPEED_MAX
+
+    Returns:
+        Steps per second, or None at SPEED_MAX for running to completion
+    """
+    low, high = ANIMATION_CONFIG['SPEED_MIN'], ANIMATION_CONFIG['SPEED_MAX']
+    if speed >= high:
+        return None
+
+    fraction = (max(speed, low) - low) / max(1, high - 1 - low)
+    slowest = ANIMATION_CONFIG['STEPS_PER_SECOND_MIN']
+    fastest = ANIMATION_CONFIG['STEPS_PER_SECOND_MAX']
+    return slowest * (fastest / slowest) ** fraction
+
+def format_speed(speed):
+    """Human-readable speed of a slider position"""
+    rate = steps_per_second_for_speed(speed)
+    if rate is None:
+        return "Run to completion"
+    return f"{rate:,.0f} steps/s" if rate >= 10 else f"{rate:.1f} steps/s"
+
+class FramePacer:
+    def __init__(self, frame_rate):
+        """
+        Set up pacing for a frame rate
+
+        Args:
+            frame_rate: Target frames per second
+        """
+        self.interval = 1.0 / frame_rate
+        self.start(0.0)
+
+    def start(self, now):
+        """
+        Restart pacing and the counters
+
+        Args:
+            now: Current time in seconds (time.perf_counter())
+        """
+        self.started = now
+        self.deadline = now
+        self.frames = 0
+        self.steps = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.rate_mark = (now, 0)
+
+    def record_frame(self, steps):
+        """
+        Count a drawn frame
+
+        Args:
+            steps: Number of steps the frame folded together
+        """
+        self.frames += 1
+        self.steps += steps
+        self.coalesced += max(0, steps - 1)
+
+    def record_steps(self, steps):
+        """
+        Count steps run without drawing a frame, to be shown by a later one
+
+        Args:
+            steps: Number of steps run
+        """
+        self.steps += steps
+        self.coalesced += steps
+
+    def next_delay(self, now):
+        """
+        Schedule the next frame
+
+        Args:
+            now: Current time in seconds
+
+        Returns:
+            Milliseconds to wait before the next frame
+        """
+        self.deadline += self.interval
+        if now > self.deadline:
+            # Overran: skip the frames whose time has already passed
+            missed = int((now - self.deadline) / self.interval)
+            self.dropped += missed
+            self.deadline += missed * self.interval
+
+        return max(0, int(round((self.deadline - now) * 1000)))
+
+    def steps_per_second(self, now):
+        """Average steps run per second since the start"""
+        elapsed = now - self.started
+        return self.steps / elapsed if elapsed > 0 else 0.0
+
+    def sample_rate(self, now):
+        """
+        Steps run per second since the previous sample
+
+        Args:
+            now: Current time in seconds
+
+        Returns:
+            Recent steps per second
+        """
+        then, steps = self.rate_mark
+        self.rate_mark = (now, self.steps)
+        return (self.steps - steps) / (now - then) if now > then else 0.0
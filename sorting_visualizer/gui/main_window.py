@@ -4,15 +4,17 @@ Main application window that contains all GUI components
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
 import time
 
 from .visualization_canvas import VisualizationCanvas
 from .control_panel import ControlPanel
+from .frame_pacer import FramePacer, steps_per_second_for_speed
 from algorithms import get_algorithm_by_name, get_available_algorithms
+from algorithms.step_events import apply_step
 from utils.data_generator import DataGenerator
 from utils.complexity_analyzer import ComplexityAnalyzer
-from config.settings import APP_CONFIG, COLORS
+from utils.trace_file import TraceReader, record_trace
+from config.settings import APP_CONFIG, ANIMATION_CONFIG, COLORS
 
 class MainWindow:
     def __init__(self, root):
@@ -36,7 +38,11 @@ class MainWindow:
         self.current_algorithm = None
         self.is_sorting = False
         self.is_paused = False
-        self.sorting_thread = None
+        self.step_source = None
+        self.trace_reader = None
+        self.frame_pacer = FramePacer(ANIMATION_CONFIG['FRAME_RATE'])
+        self.step_budget = 0.0  # steps owed to the next frame, carried between frames
+        self.run_status = ""  # status bar text of the current run, before its steps/s
         self.array_data = []
         self.original_array = []
 
@@ -178,8 +184,10 @@ class MainWindow:
             return
 
         try:
-            self.array_data = self.data_generator.load_from_file(filename)
-            self.original_array = self.array_data.copy()
+            # Binary files come back memory-mapped and read-only; that mapping
+            # is kept as the original, and sorting works on an in-memory copy
+            self.original_array = self.data_generator.load_from_file(filename, as_array=True)
+            self.array_data = self.original_array.copy()
             self.canvas.draw_array(self.array_data)
 
             # Reset statistics
@@ -191,9 +199,58 @@ class MainWindow:
         except Exception as e:
             messagebox.showerror("Error", f"Could not load file: {str(e)}")
 
+    def save_array_to_file(self, filename):
+        """Save the current array, e.g. a generated or sorted one, to a file"""
+        if self.is_sorting:
+            return
+
+        try:
+            self.data_generator.save_to_file(self.array_data, filename)
+            self.update_status(f"Array of {len(self.array_data)} elements saved to {filename}")
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not save file: {str(e)}")
+
+    def save_trace(self, filename):
+        """Record a run of the selected algorithm to a trace file"""
+        if self.is_sorting or not len(self.array_data):
+            return
+
+        algorithm_name = self.control_panel.get_selected_algorithm()
+
+        try:
+            algorithm = record_trace(algorithm_name, self.array_data, filename)
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not record trace: {str(e)}")
+            return
+
+        stats = algorithm.get_statistics()
+        self.update_status(
+            f"Trace saved to {filename} - {stats['comparisons']:,} comparisons, "
+            f"{stats['swaps']:,} swaps"
+        )
+
+    def replay_trace(self, filename):
+        """Replay a recorded trace file without re-running the algorithm"""
+        if self.is_sorting:
+            return
+
+        try:
+            self.trace_reader = TraceReader(filename)
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not open trace: {str(e)}")
+            return
+
+        self.array_data = self.trace_reader.initial_array
+        self.original_array = self.array_data.copy()
+        self.current_algorithm = None
+
+        self.run_steps(self.trace_reader.iter_steps())
+        self.run_status = f"Replaying trace {filename} ({len(self.trace_reader):,} steps)"
+        self.update_status(f"{self.run_status}...")
+
     def start_sorting(self):
         """Start the sorting animation"""
-        if self.is_sorting or not self.array_data:
+        if self.is_sorting or not len(self.array_data):
             return
 
         algorithm_name = self.control_panel.get_selected_algorithm()
@@ -201,13 +258,31 @@ class MainWindow:
         try:
             self.current_algorithm = get_algorithm_by_name(
                 algorithm_name,
-                self.array_data.copy(),
-                self.on_algorithm_step
+                self.array_data.copy()
             )
         except Exception as e:
             messagebox.showerror("Error", f"Could not create algorithm: {str(e)}")
             return
 
+        self.run_steps(self.current_algorithm.steps())
+
+        algorithm_display_name = self.control_panel.algorithm_combo.get()
+        self.run_status = f"Sorting with {algorithm_display_name}"
+        self.update_status(f"{self.run_status}...")
+
+    def run_steps(self, steps):
+        """
+        Start animating a source of steps from the Tk event loop
+
+        Args:
+            steps: Iterator of (operation, indices, values) tuples, such as
+                an algorithm's steps() generator or a trace replay
+        """
+        self.step_source = steps
+
+        # Deltas are applied on top of the array the steps start from
+        self.canvas.draw_array(self.array_data)
+
         self.is_sorting = True
         self.is_paused = False
         self.control_panel.set_sorting_state(True)
@@ -216,40 +291,130 @@ class MainWindow:
         self.comparisons = 0
         self.swaps = 0
         self.start_time = time.time()
+        self.frame_pacer.start(time.perf_counter())
+        self.step_budget = 0.0
 
-        # Start sorting in a separate thread to keep GUI responsive
-        self.sorting_thread = threading.Thread(
-            target=self.run_sorting_algorithm,
-            daemon=True
-        )
-        self.sorting_thread.start()
+        self.root.after(0, self._run_next_steps)
 
-        algorithm_display_name = self.control_panel.algorithm_combo.get()
-        self.update_status(f"Sorting with {algorithm_display_name}...")
+    def _run_next_steps(self):
+        """
+        Run one animation frame (called from main thread)
+
+        Frames come at a fixed rate. Each one pulls the steps the current
+        speed owes it, folds them into a single drawing of the latest
+        array state, and stops pulling early when the frame's time share
+        runs out, so the display never falls behind the algorithm.
+
+        At the top speed steps are pulled for most of every frame interval
+        and nothing is drawn until the source is exhausted; the event loop
+        still runs between intervals, so the window stays responsive.
+        """
+        if not self.is_sorting or self.step_source is None:
+            return
+
+        if not self.is_paused:
+            frame_rate = ANIMATION_CONFIG['FRAME_RATE']
+            steps_per_second = self.get_steps_per_second()
+            turbo = steps_per_second is None
+
+            if turbo:
+                count = float('inf')
+                time_share = ANIMATION_CONFIG['TURBO_TIME_FRACTION']
+            else:
+                self.step_budget += steps_per_second / frame_rate
+                count = int(self.step_budget)
+                self.step_budget -= count
+                time_share = ANIMATION_CONFIG['STEP_TIME_FRACTION']
+
+            time_limit = time.perf_counter() + time_share / frame_rate
+            pulled = 0
+            try:
+                while pulled < count:
+                    step = next(self.step_source, None)
+                    if step is None:
+                        self._draw_frame(pulled)
+                        self._finish_steps()
+                        return
+                    self.on_algorithm_step(*step)
+                    pulled += 1
+                    if time.perf_counter() > time_limit:
+                        break
+            except Exception as e:
+                self._close_step_source()
+                self.on_sorting_error(str(e))
+                return
+
+            if turbo:
+                self.frame_pacer.record_steps(pulled)
+            elif pulled:
+                self._draw_frame(pulled)
+
+            self._show_step_rate()
+
+        self.root.after(self.frame_pacer.next_delay(time.perf_counter()), self._run_next_steps)
+
+    def get_steps_per_second(self):
+        """
+        Algorithm steps per second for the current animation speed
+
+        Returns:
+            Steps per second, or None to run to completion without drawing
+        """
+        return steps_per_second_for_speed(self.control_panel.get_animation_speed())
+
+    def _show_step_rate(self):
+        """Show the achieved steps per second in the status bar, now and then"""
+        now = time.perf_counter()
+        if now - self.frame_pacer.rate_mark[0] >= ANIMATION_CONFIG['RATE_UPDATE_INTERVAL']:
+            rate = self.frame_pacer.sample_rate(now)
+            self.update_status(f"{self.run_status}... {rate:,.0f} steps/s")
+
+    def _finish_steps(self):
+        """Called when the step source is exhausted"""
+        is_replay = self.current_algorithm is None
+        self._close_step_source()
+
+        if is_replay:
+            self.is_sorting = False
+            self.is_paused = False
+            self.control_panel.set_sorting_state(False)
+            self.canvas.mark_all_sorted()
+            self.update_status("Trace replay completed")
+        else:
+            self.on_sorting_complete()
+
+    def _close_step_source(self):
+        """Abandon the current step source and release any trace file"""
+        if self.step_source is not None:
+            close = getattr(self.step_source, 'close', None)
+            if close:
+                close()
+        self.step_source = None
+
+        if self.trace_reader:
+            self.trace_reader.close()
+        self.trace_reader = None
 
     def pause_sorting(self):
         """Pause the current sorting operation"""
         if not self.is_sorting:
             return
 
+        # Steps are only pulled while unpaused, so the algorithm state is untouched
         self.is_paused = not self.is_paused
-        if self.current_algorithm:
-            if self.is_paused:
-                self.current_algorithm.stop()
-                self.update_status("Sorting paused")
-                self.control_panel.start_btn.config(text="Resume")
-            else:
-                self.current_algorithm.is_running = True
-                self.update_status("Sorting resumed")
-                self.control_panel.start_btn.config(text="Pause")
+        if self.is_paused:
+            self.update_status("Sorting paused")
+            self.control_panel.start_btn.config(text="Resume")
+        else:
+            self.update_status("Sorting resumed")
+            self.control_panel.start_btn.config(text="Pause")
 
     def stop_sorting(self):
         """Stop the current sorting operation"""
         if not self.is_sorting:
             return
 
-        if self.current_algorithm:
-            self.current_algorithm.stop()
+        self._close_step_source()
 
         self.is_sorting = False
         self.is_paused = False
@@ -261,7 +426,7 @@ class MainWindow:
         if self.is_sorting:
             self.stop_sorting()
 
-        if self.original_array:
+        if len(self.original_array):
             self.array_data = self.original_array.copy()
             self.canvas.draw_array(self.array_data)
 
@@ -272,6 +437,12 @@ class MainWindow:
 
             self.update_status("Array reset to original state")
 
+    def set_renderer_mode(self, mode):
+        """Switch how the canvas draws arrays ('auto', 'bars' or 'raster')"""
+        self.canvas.set_renderer_mode(mode)
+        renderer = self.canvas.renderer_for(len(self.array_data))
+        self.update_status(f"Drawing {len(self.array_data):,} elements with the {renderer} renderer")
+
     def toggle_sorting(self):
         """Toggle between start and pause"""
         if not self.is_sorting:
@@ -279,25 +450,13 @@ class MainWindow:
         else:
             self.pause_sorting()
 
-    def run_sorting_algorithm(self):
-        """Run the sorting algorithm (called in separate thread)"""
-        try:
-            self.current_algorithm.sort()
-
-            # Schedule completion handling on main thread
-            self.root.after(0, self.on_sorting_complete)
-
-        except Exception as e:
-            # Schedule error handling on main thread
-            self.root.after(0, lambda: self.on_sorting_error(str(e)))
-
-    def on_algorithm_step(self, operation, indices, array_state):
+    def on_algorithm_step(self, operation, indices, values):
         """
-        Called by the algorithm for each step
+        Called for each step pulled from the step source
         This updates the visualization
         """
-        if not self.is_sorting or self.is_paused:
-            return
+        # Keep our copy of the array in step with the algorithm
+        apply_step(self.array_data, operation, indices, values)
 
         # Update statistics
         if operation == 'compare':
@@ -305,22 +464,25 @@ class MainWindow:
         elif operation == 'swap':
             self.swaps += 1
 
-        # Update display (must be called from main thread)
-        self.root.after(0, lambda: self._update_display(operation, indices, array_state))
+        # Drawn with the rest of the frame's steps
+        self.canvas.queue_step(operation, indices, values)
 
-        # Control animation speed
-        speed = self.control_panel.get_animation_speed()
-        delay = max(10, 200 - (speed * 18)) / 1000.0  # Convert to seconds
-        time.sleep(delay)
+    def _draw_frame(self, steps):
+        """
+        Draw the steps pulled for this frame (called from main thread)
 
-    def _update_display(self, operation, indices, array_state):
-        """Update display elements (called from main thread)"""
-        # Update canvas
-        self.canvas.update_visualization(operation, indices, array_state)
+        Args:
+            steps: Number of steps folded into the frame
+        """
+        self.canvas.render_frame()
+        self.frame_pacer.record_frame(steps)
 
         # Update statistics
         elapsed_time = time.time() - self.start_time if self.start_time else 0
         self.control_panel.update_statistics(self.comparisons, self.swaps, elapsed_time)
+        self.control_panel.update_frame_statistics(
+            self.frame_pacer.frames, self.frame_pacer.coalesced, self.frame_pacer.dropped
+        )
 
     def on_sorting_complete(self):
         """Called when sorting is finished"""
@@ -347,7 +509,8 @@ Efficiency:
 • {self.comparisons/len(self.array_data):.1f} comparisons per element
 • {self.swaps/len(self.array_data):.1f} swaps per element"""
 
-        self.update_status(f"{algorithm_name} completed successfully!")
+        steps_per_second = self.frame_pacer.steps_per_second(time.perf_counter())
+        self.update_status(f"{algorithm_name} completed successfully! ({steps_per_second:,.0f} steps/s)")
         messagebox.showinfo("Sorting Complete", message)
 
     def on_sorting_error(self, error_message):
@@ -367,8 +530,7 @@ Efficiency:
         """Handle application closing"""
         if self.is_sorting:
             if messagebox.askokcancel("Quit", "Sorting is in progress. Do you want to quit?"):
-                if self.current_algorithm:
-                    self.current_algorithm.stop()
+                self._close_step_source()
                 self.root.destroy()
         else:
             self.root.destroy()
@@ -0,0 +1,253 @@
+"""
+Raster renderer for arrays too large to draw as one bar artist per element
+
+The array is rasterized straight into an RGBA image buffer the size of the
+axes in screen pixels, and handed to the canvas renderer as one image, with
+no resampling since it already matches the screen pixels. Each pixel
+column shows one element, or the tallest of the elements that share it
+when the array has more elements than the axes has pixels. A frame only
+refills the pixel columns of the elements that changed (a vectorized fill
+per column block) and blits the image over the cached background, so
+frame cost follows the canvas size rather than the array length.
+
+Ranges are drawn as in BarRenderer: solid up to the low end, and a
+lighter band up to the high end.
+"""
+
+import numpy as np
+from matplotlib.artist import Artist
+from matplotlib.colors import to_rgba
+
+from config.settings import COLORS, VISUAL_CONFIG
+from .bar_renderer import BarRenderer, envelope_color
+
+# Slots narrower than this many pixels are drawn without a gap
+GAP_MIN_SLOT_WIDTH = 3
+
+def _pixel(color):
+    """A matplotlib color as one packed RGBA pixel of the buffer"""
+    rgba = [int(round(channel * 255)) for channel in to_rgba(color)]
+    return np.array(rgba, dtype=np.uint8).view(np.uint32)[0]
+
+class _BufferImage(Artist):
+    """Artist drawing a renderer's pixel buffer over its axes"""
+
+    def __init__(self, owner):
+        super().__init__()
+        self.owner = owner
+
+    def draw(self, renderer):
+        self.owner.draw_buffer(renderer)
+
+class RasterRenderer(BarRenderer):
+    def __init__(self, figure, ax, canvas):
+        """
+        Set up the renderer on an existing axes
+
+        Args:
+            figure: Matplotlib figure holding the axes
+            ax: Axes to draw the array in
+            canvas: Figure canvas (FigureCanvasTkAgg, or any Agg canvas)
+        """
+        super().__init__(figure, ax, canvas)
+
+        self.values = np.zeros(0)
+        self.codes = np.zeros(0, dtype=np.intp)  # palette index of each element
+        self.palette = {}  # color -> palette index
+        self.palette_pixels = np.zeros(0, dtype=np.uint32)
+        self.envelope_pixels = np.zeros(0, dtype=np.uint32)  # lighter band of each color
+        self.lows = None
+        self.background_pixel = _pixel(COLORS['background'])
+
+        self.image = None
+        self.buffer = None  # (height, width, 4) RGBA of the axes, bottom row first
+        self.pixels = None  # the same buffer as (height, width) packed pixels
+        self.lo = None  # first element of each pixel column
+        self.hi = None  # one past the last element of each pixel column
+        self.gaps = None  # pixel columns left blank between bars
+
+    def draw(self, values, colors, lows=None):
+        """
+        Lay out the axes and image for a new array and draw everything
+
+        Args:
+            values: Bar heights
+            colors: Bar face colors, one per value
+            lows: Optional low ends, one per value, for bars showing a range
+        """
+        self.values = np.array(values, dtype=float)
+        self.lows = np.array(lows, dtype=float) if lows is not None else None
+        self.codes = self._encode(colors)
+        self.layout_count += 1
+
+        self.ax.clear()
+        self.style_axes()
+        self.image = None
+        self.buffer = None
+
+        if not len(self.values):
+            self.y_max = 0
+            self.canvas.draw()
+            return
+
+        size = len(self.values)
+        self.y_max = float(self.values.max()) * 1.1 or 1
+
+        # The pixels are filled in when the image is first drawn, once the
+        # axes' size on screen is known
+        self.image = self.ax.add_artist(_BufferImage(self))
+        self.image.set_animated(True)
+        self.ax.set_xlim(-0.5, size - 0.5)
+        self.ax.set_ylim(0, self.y_max)
+
+        self.canvas.draw()
+
+    def update(self, indices, values, colors, lows=None):
+        """
+        Change some elements and redraw their pixel columns
+
+        Args:
+            indices: Indices of the elements whose value or color may have changed
+            values: Full list of element values
+            colors: Full list of element colors
+            lows: Full list of low ends, when the bars show ranges
+        """
+        if (self.image is None or len(values) != len(self.values)
+                or (lows is None) != (self.lows is None)):
+            self.draw(values, colors, lows)
+            return
+        if not len(indices):
+            return
+
+        indices = np.asarray(indices, dtype=np.intp)
+        changed = np.array([values[i] for i in indices], dtype=float)
+        if changed.max() > self.y_max:
+            # Out of the axes' range: lay everything out again
+            self.draw(values, colors, lows)
+            return
+
+        self.values[indices] = changed
+        if lows is not None:
+            self.lows[indices] = [lows[i] for i in indices]
+        self.codes[indices] = self._encode([colors[i] for i in indices])
+        self.frame_count += 1
+
+        if self.buffer is None:
+            # Not drawn yet; the first full draw rasterizes everything
+            self.canvas.draw_idle()
+            return
+
+        self._fill(self._columns_of(indices))
+        self.blit()
+
+    def blit(self, indices=None):
+        """
+        Show the image buffer over the background
+
+        Args:
+            indices: Unused; the whole image is one artist
+        """
+        if self.image is None:
+            return
+
+        if self.background is None or not self.canvas.supports_blit:
+            self.canvas.draw_idle()
+            return
+
+        self.canvas.restore_region(self.background)
+        self.ax.draw_artist(self.image)
+        self.canvas.blit(self.ax.bbox)
+
+    def draw_buffer(self, renderer):
+        """
+        Draw the pixel buffer, fitting it to the axes' current size first
+
+        Args:
+            renderer: Matplotlib renderer of the canvas
+        """
+        bbox = self.ax.bbox
+        width, height = max(1, int(round(bbox.width))), max(1, int(round(bbox.height)))
+        if self.buffer is None or self.buffer.shape[:2] != (height, width):
+            self._layout_columns(width, height)
+
+        gc = renderer.new_gc()
+        renderer.draw_image(gc, int(round(bbox.x0)), int(round(bbox.y0)), self.buffer)
+        gc.restore()
+
+    def _draw_animated(self):
+        """Draw the image onto the canvas renderer"""
+        if self.image is not None:
+            self.ax.draw_artist(self.image)
+
+    def _layout_columns(self, width, height):
+        """Map pixel columns to elements and rasterize the whole array"""
+        size = len(self.values)
+        x = np.arange(width)
+
+        if size <= width:
+            # Each element spans one or more pixel columns
+            position = (x + 0.5) * size / width
+            self.lo = position.astype(np.intp)
+            self.hi = self.lo + 1
+
+            slot_width = width / size
+            if slot_width >= GAP_MIN_SLOT_WIDTH:
+                gap = max(VISUAL_CONFIG['BAR_GAP_RATIO'], 1 / slot_width)
+                self.gaps = position - self.lo >= 1 - gap
+            else:
+                self.gaps = np.zeros(width, dtype=bool)
+        else:
+            # Each pixel column covers a run of elements
+            self.lo = x * size // width
+            self.hi = (x + 1) * size // width
+            self.gaps = np.zeros(width, dtype=bool)
+
+        self.buffer = np.empty((height, width, 4), dtype=np.uint8)
+        self.pixels = self.buffer.view(np.uint32)[:, :, 0]
+        self._fill(x)
+
+    def _columns_of(self, indices):
+        """Pixel columns showing any of the given elements"""
+        if len(self.values) <= len(self.lo):
+            return np.flatnonzero(np.isin(self.lo, indices))
+        return np.unique(np.searchsorted(self.lo, indices, side='right') - 1)
+
+    def _fill(self, columns):
+        """Rasterize the given pixel columns into the buffer"""
+        if not len(columns):
+            return
+
+        if len(self.values) <= len(self.lo):
+            shown = self.lo[columns]
+        else:
+            # The tallest element of each column is the one that shows
+            shown = np.array([lo + int(np.argmax(self.values[lo:hi]))
+                              for lo, hi in zip(self.lo[columns], self.hi[columns])])
+
+        rows = np.arange(self.pixels.shape[0])[:, None]
+        codes = self.codes[shown]
+        tops = np.where(self.gaps[columns], 0, self._pixel_heights(self.values[shown]))
+
+        # Rows run bottom up, so a bar fills the rows below its height
+        if self.lows is None:
+            block = np.where(rows < tops, self.palette_pixels[codes], self.background_pixel)
+        else:
+            block = np.where(rows < tops, self.envelope_pixels[codes], self.background_pixel)
+            block = np.where(rows < np.minimum(tops, self._pixel_heights(self.lows[shown])),
+                             self.palette_pixels[codes], block)
+
+        self.pixels[:, columns] = block
+
+    def _pixel_heights(self, values):
+        """Heights of values in buffer rows"""
+        height = self.buffer.shape[0]
+        return np.clip(np.rint(values / self.y_max * height), 0, height)
+
+    def _encode(self, colors):
+        """Palette indices of a list of colors, adding new colors to the palette"""
+        for color in set(colors):
+            if color not in self.palette:
+                self.palette[color] = len(self.palette)
+                self.palette_pixels = np.append(self.palette_pixels, _pixel(color))
+                self.envelope_pixels = np.append(self.envelope_pixels, _pixel(envelope_color(color)))
+        return np.fromiter((self.palette[color] for color in colors), dtype=np.intp, count=len(colors))
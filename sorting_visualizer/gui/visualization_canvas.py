@@ -5,10 +5,40 @@ Visualization canvas that draws the sorting animation using matplotlib embedded
 import tkinter as tk
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.pyplot as plt
-import numpy as np
+from algorithms.step_events import apply_step
 from config.settings import COLORS, VISUAL_CONFIG
 from utils.color_manager import ColorManager
+from .bar_renderer import BarRenderer
+from .raster_renderer import RasterRenderer
+from .column_bins import ColumnBins
+
+# Renderers the canvas can draw with, by name
+RENDERERS = {
+    'bars': BarRenderer,
+    'raster': RasterRenderer,
+}
+
+# Bar state each operation highlights its indices with
+OPERATION_STATES = {
+    'compare': 'comparing',
+    'read': 'reading',
+    'swap': 'swapping',
+    'sorted': 'sorted',
+    'pivot': 'pivot',
+    'merge': 'current',
+    'insert': 'current',
+    'shift': 'current',
+}
+
+# When elements share a pixel column, the column shows its highest-ranked state
+STATE_PRIORITY = {
+    'sorted': 1,
+    'reading': 2,
+    'current': 3,
+    'pivot': 4,
+    'comparing': 5,
+    'swapping': 6,
+}
 
 class VisualizationCanvas(tk.Frame):
     def __init__(self, parent, **kwargs):
@@ -24,7 +54,13 @@ class VisualizationCanvas(tk.Frame):
         self.color_manager = ColorManager()
         self.array_data = []
         self.bar_colors = []
-        self.bars = []
+        self.highlighted = []  # indices colored by the last frame
+        self.pending_states = {}  # index -> bar state of steps not yet drawn
+
+        # Arrays wider than the plot are drawn one pixel column at a time
+        # (see redraw_bars); highlighted and pending_states then hold columns
+        self.bins = None
+        self.column_colors = []
 
         # Create matplotlib figure
         self.figure = Figure(figsize=(10, 6), dpi=100)
@@ -37,25 +73,17 @@ class VisualizationCanvas(tk.Frame):
         self.canvas = FigureCanvasTkAgg(self.figure, self)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
 
+        # Bars are built once per array and then updated in place; large
+        # arrays are rasterized instead (see set_renderer_mode)
+        self.renderer_mode = VISUAL_CONFIG['RENDERER']
+        self.renderer = BarRenderer(self.figure, self.ax, self.canvas)
+
         # Initialize empty plot
         self.setup_plot()
 
     def setup_plot(self):
         """Set up the initial plot configuration"""
-        self.ax.clear()
-        self.ax.set_facecolor(COLORS['background'])
-        self.ax.tick_params(colors=COLORS['text'])
-        self.ax.spines['bottom'].set_color(COLORS['text'])
-        self.ax.spines['top'].set_color(COLORS['text'])
-        self.ax.spines['right'].set_color(COLORS['text'])
-        self.ax.spines['left'].set_color(COLORS['text'])
-
-        # Set labels
-        self.ax.set_xlabel('Array Index', color=COLORS['text'])
-        self.ax.set_ylabel('Value', color=COLORS['text'])
-        self.ax.set_title('Sorting Algorithm Visualization', color=COLORS['text'])
-
-        self.canvas.draw()
+        self.renderer.draw([], [])
 
     def draw_array(self, array_data, colors=None):
         """
@@ -75,99 +103,156 @@ class VisualizationCanvas(tk.Frame):
         self.redraw_bars()
 
     def redraw_bars(self):
-        """Redraw all bars with current data and colors"""
-        self.ax.clear()
+        """
+        Lay out all bars again with current data and colors
 
-        if not self.array_data:
-            self.setup_plot()
+        Arrays with more elements than the plot has pixel columns are
+        binned into those columns, and each column is drawn as the range
+        between its smallest and largest value, colored like its first
+        element.
+        """
+        self.highlighted = []
+        self.pending_states = {}
+        self.use_renderer(self.renderer_for(len(self.array_data)))
+
+        columns = self.pixel_columns()
+        if len(self.array_data) <= columns:
+            self.bins = None
+            self.column_colors = []
+            self.renderer.draw(self.array_data, self.bar_colors)
             return
 
-        # Create x positions
-        x_positions = np.arange(len(self.array_data))
+        self.bins = ColumnBins(self.array_data, columns)
+        self.column_colors = [self.bar_colors[start] for start in self.bins.starts]
+        self.renderer.draw(self.bins.highs, self.column_colors, lows=self.bins.lows)
 
-        # Create bars
-        self.bars = self.ax.bar(
-            x_positions, 
-            self.array_data, 
-            color=self.bar_colors,
-            edgecolor='white',
-            linewidth=0.5
-        )
+    def pixel_columns(self):
+        """Width of the plot area in pixels"""
+        return max(1, int(round(self.ax.bbox.width)))
 
-        # Customize plot
-        self.ax.set_facecolor(COLORS['background'])
-        self.ax.set_xlabel('Array Index', color=COLORS['text'])
-        self.ax.set_ylabel('Value', color=COLORS['text'])
-        self.ax.set_title('Sorting Algorithm Visualization', color=COLORS['text'])
-
-        # Set axis properties
-        self.ax.tick_params(colors=COLORS['text'])
-        for spine in self.ax.spines.values():
-            spine.set_color(COLORS['text'])
-
-        # Set limits
-        self.ax.set_xlim(-0.5, len(self.array_data) - 0.5)
-        if self.array_data:
-            self.ax.set_ylim(0, max(self.array_data) * 1.1)
-
-        # Add value labels for small arrays
-        if len(self.array_data) <= 20:
-            for i, (bar, value) in enumerate(zip(self.bars, self.array_data)):
-                height = bar.get_height()
-                self.ax.text(
-                    bar.get_x() + bar.get_width()/2., 
-                    height + max(self.array_data) * 0.01,
-                    str(value), 
-                    ha='center', 
-                    va='bottom',
-                    color=COLORS['text'],
-                    fontsize=8
-                )
-
-        self.canvas.draw()
-
-    def update_visualization(self, operation, indices, array_state):
+    def set_renderer_mode(self, mode):
+        """
+        Choose how arrays are drawn and redraw the current one
+
+        Args:
+            mode: 'bars', 'raster', or 'auto' to rasterize arrays larger
+                than VISUAL_CONFIG['RASTER_THRESHOLD']
+        """
+        if mode != 'auto' and mode not in RENDERERS:
+            raise ValueError(f"Unknown renderer: {mode}")
+
+        self.renderer_mode = mode
+        self.redraw_bars()
+
+    def renderer_for(self, size):
+        """Name of the renderer the current mode uses for an array size"""
+        if self.renderer_mode != 'auto':
+            return self.renderer_mode
+        return 'raster' if size > VISUAL_CONFIG['RASTER_THRESHOLD'] else 'bars'
+
+    def use_renderer(self, name):
+        """Switch to a renderer, unless it is already in use"""
+        renderer_class = RENDERERS[name]
+        if type(self.renderer) is not renderer_class:
+            self.renderer.close()
+            self.renderer = renderer_class(self.figure, self.ax, self.canvas)
+
+    def update_visualization(self, operation, indices, values=None):
         """
         Update the visualization based on algorithm operation
 
         Args:
             operation: Type of operation ('compare', 'swap', 'sorted', etc.)
             indices: List of indices involved in the operation
-            array_state: Current state of the array
+            values: New values at those indices for write operations
         """
-        self.array_data = array_state.copy()
+        self.queue_step(operation, indices, values)
+        self.render_frame()
 
-        # Reset all colors to default
-        self.bar_colors = [self.color_manager.get_bar_color('default')] * len(self.array_data)
+    def queue_step(self, operation, indices, values=None):
+        """
+        Apply a step to the array without drawing it yet
 
-        # Color bars based on operation
-        if operation == 'compare':
-            for idx in indices:
-                if 0 <= idx < len(self.bar_colors):
-                    self.bar_colors[idx] = self.color_manager.get_bar_color('comparing')
+        Steps queued between two frames are drawn together by
+        render_frame, each index highlighted by its latest operation.
 
-        elif operation == 'swap':
-            for idx in indices:
-                if 0 <= idx < len(self.bar_colors):
-                    self.bar_colors[idx] = self.color_manager.get_bar_color('swapping')
+        Args:
+            operation: Type of operation ('compare', 'swap', 'sorted', etc.)
+            indices: List of indices involved in the operation
+            values: New values at those indices for write operations
+        """
+        # Apply the step's delta to our own copy of the array
+        apply_step(self.array_data, operation, indices, values)
 
-        elif operation == 'sorted':
+        size = len(self.array_data)
+        state = OPERATION_STATES.get(operation)
+        if self.bins is None:
             for idx in indices:
-                if 0 <= idx < len(self.bar_colors):
-                    self.bar_colors[idx] = self.color_manager.get_bar_color('sorted')
+                if 0 <= idx < size:
+                    self.pending_states[idx] = state
+            return
 
-        elif operation == 'pivot':
+        # Binned: update the column ranges and keep each column's top state
+        if values is not None:
+            self.bins.write(indices, values)
+        if state:
+            priority = STATE_PRIORITY[state]
             for idx in indices:
-                if 0 <= idx < len(self.bar_colors):
-                    self.bar_colors[idx] = self.color_manager.get_bar_color('pivot')
+                if 0 <= idx < size:
+                    column = self.bins.column_of(idx)
+                    if priority >= STATE_PRIORITY[self.pending_states.get(column, state)]:
+                        self.pending_states[column] = state
 
-        elif operation in ['merge', 'insert', 'shift']:
-            for idx in indices:
-                if 0 <= idx < len(self.bar_colors):
-                    self.bar_colors[idx] = self.color_manager.get_bar_color('current')
+    def render_frame(self):
+        """
+        Draw the steps queued since the last frame
 
-        # Redraw with updated colors
-        self.redraw_bars()
+        Only the bars that were written or whose highlight changed are
+        redrawn.
+        """
+        if self.bins is not None:
+            self._render_columns()
+            return
+
+        # Bars highlighted by the previous frame go back to default
+        default = self.color_manager.get_bar_color('default')
+        changed = set(self.highlighted)
+        for idx in self.highlighted:
+            self.bar_colors[idx] = default
+
+        self.highlighted = []
+        for idx, state in self.pending_states.items():
+            if state:
+                self.bar_colors[idx] = self.color_manager.get_bar_color(state)
+                self.highlighted.append(idx)
+        changed.update(self.pending_states)
+        self.pending_states = {}
+
+        if changed:
+            self.renderer.update(sorted(changed), self.array_data, self.bar_colors)
+
+    def _render_columns(self):
+        """Draw the queued steps of a binned array, one pixel column per bin"""
+        if self.bins.columns != self.pixel_columns():
+            # The plot was resized: bin the array again
+            self.redraw_bars()
+            return
+
+        default = self.color_manager.get_bar_color('default')
+        changed = set(self.highlighted)
+        for column in self.highlighted:
+            self.column_colors[column] = default
+
+        self.highlighted = list(self.pending_states)
+        for column, state in self.pending_states.items():
+            self.column_colors[column] = self.color_manager.get_bar_color(state)
+        changed.update(self.highlighted)
+        changed.update(self.bins.flush())
+        self.pending_states = {}
+
+        if changed:
+            self.renderer.update(sorted(changed), self.bins.highs, self.column_colors,
+                                 lows=self.bins.lows)
 
     def mark_all_sorted(self):
         """Mark all bars as sorted (green)"""
@@ -178,5 +263,8 @@ class VisualizationCanvas(tk.Frame):
         """Clear the canvas"""
         self.array_data = []
         self.bar_colors = []
-        self.bars = []
+        self.highlighted = []  # indices colored by the last frame
+        self.pending_states = {}  # index -> bar state of steps not yet drawn
+        self.bins = None
+        self.column_colors = []
         self.setup_plot()
@@ -0,0 +1,88 @@
+"""
+Unit tests for the adversarial input generator
+"""
+
+import random
+import unittest
+from algorithms import ALGORITHMS
+from algorithms.quick_sort import QuickSort
+from utils.adversarial_generator import AdversarialGenerator
+from utils.data_generator import DataGenerator
+
+class TestAdversarialGenerator(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        self.size = 300
+
+    def test_permutation(self):
+        """Test that the input is a permutation of consecutive integers"""
+        for name in ['quick_sort', 'heap_sort', 'merge_sort', 'tim_sort']:
+            with self.subTest(algorithm=name):
+                array = AdversarialGenerator(name).generate(self.size, 5)
+                self.assertEqual(sorted(array), list(range(5, 5 + self.size)))
+
+        self.assertEqual(AdversarialGenerator('quick_sort').generate(0, 1), [])
+
+    def test_quadratic_quick_sort(self):
+        """Test that every quick sort pivot strategy is driven far past random input"""
+        random_array = DataGenerator().generate_random_array(self.size, 1, 1000, seed=42)
+        for strategy in ['last', 'median_of_three', 'random']:
+            with self.subTest(pivot_strategy=strategy):
+                generator = AdversarialGenerator('quick_sort', pivot_strategy=strategy, seed=1)
+                array = generator.generate(self.size, 1)
+
+                replay = QuickSort(array, headless=True, pivot_strategy=strategy, seed=1)
+                replay.sort()
+                self.assertEqual(replay.comparisons, generator.comparisons)
+                self.assertGreaterEqual(replay.comparisons, self.size * self.size // 5)
+
+                baseline = QuickSort(random_array, headless=True, pivot_strategy=strategy, seed=1)
+                baseline.sort()
+                self.assertGreater(replay.comparisons, 3 * baseline.comparisons)
+
+    def test_simple_sorts_worst_case(self):
+        """Test that insertion and bubble sort get their quadratic worst case"""
+        for name in ['insertion_sort', 'bubble_sort']:
+            with self.subTest(algorithm=name):
+                generator = AdversarialGenerator(name)
+                generator.generate(self.size)
+                self.assertEqual(generator.comparisons, self.size * (self.size - 1) // 2)
+
+    def test_never_weaker_than_random(self):
+        """Test that run-adaptive and fixed-pattern sorts get at least a shuffle's cost"""
+        size = 400
+        for name in ['tim_sort', 'merge_sort', 'heap_sort']:
+            with self.subTest(algorithm=name):
+                generator = AdversarialGenerator(name)
+                array = generator.generate(size, 0, seed=3)
+
+                shuffled = list(range(size))
+                random.Random(3).shuffle(shuffled)
+                baseline = ALGORITHMS[name](shuffled, headless=True)
+                baseline.sort()
+                self.assertGreaterEqual(generator.comparisons, baseline.comparisons)
+
+                replay = ALGORITHMS[name](array, headless=True)
+                replay.sort()
+                self.assertEqual(replay.comparisons, generator.comparisons)
+
+        # The policies alone leave tim sort runs to exploit
+        generator = AdversarialGenerator('tim_sort')
+        generator.generate(size)
+        self.assertEqual(generator.policy, 'random')
+
+    def test_intro_sort_bounded(self):
+        """Test that intro sort's depth limit keeps adversarial input n log n"""
+        generator = AdversarialGenerator('intro_sort')
+        generator.generate(self.size)
+        self.assertLess(generator.comparisons, self.size * self.size // 10)
+
+    def test_invalid_algorithms(self):
+        """Test that unknown and non-comparison algorithms are rejected"""
+        for name in ['bogus', 'counting_sort', 'radix_sort']:
+            with self.subTest(algorithm=name):
+                with self.assertRaises(ValueError):
+                    AdversarialGenerator(name)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,13 +2,34 @@
 Unit tests for sorting algorithms
 """
 
+import sys
+import tracemalloc
 import unittest
+import numpy as np
 from algorithms.bubble_sort import BubbleSort
 from algorithms.insertion_sort import InsertionSort
 from algorithms.selection_sort import SelectionSort
 from algorithms.merge_sort import MergeSort
-from algorithms.quick_sort import QuickSort
+from algorithms.quick_sort import QuickSort, PIVOT_STRATEGIES
 from algorithms.heap_sort import HeapSort
+from algorithms.intro_sort import IntroSort
+from algorithms.three_way_quick_sort import ThreeWayQuickSort
+from algorithms.tim_sort import TimSort
+from algorithms.counting_sort import CountingSort
+from algorithms.radix_sort import RadixSort
+from algorithms.parallel_merge_sort import ParallelMergeSort, measure_speedup
+from algorithms import ALGORITHMS, get_algorithm_by_name, get_available_algorithms
+from algorithms.step_events import apply_step, WRITE_OPERATIONS
+from utils.data_generator import DataGenerator
+
+class _Key:
+    """Item that compares by key only, to check stability"""
+    def __init__(self, key, index):
+        self.key = key
+        self.index = index
+
+    def __lt__(self, other):
+        return self.key < other.key
 
 class TestSortingAlgorithms(unittest.TestCase):
     def setUp(self):
@@ -73,9 +94,201 @@ class TestSortingAlgorithms(unittest.TestCase):
                 sorter.sort()
                 self.assertEqual(sorter.array, sorted(test_array))
 
+    def test_merge_sort_single_aux_buffer(self):
+        """Test that merge sort allocates exactly one n-element buffer"""
+        size = 5000
+        test_array = list(range(size, 0, -1))
+        sorter = MergeSort(test_array, headless=True)
+
+        tracemalloc.start()
+        sorter.sort()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        self.assertEqual(sorter.array, sorted(test_array))
+        self.assertEqual(sorter.get_statistics()['aux_space'], size)
+
+        # One list the size of the input, plus a little interpreter overhead
+        self.assertLess(peak, sys.getsizeof(test_array) + 4096)
+
+    def test_quick_sort_pivot_strategies(self):
+        """Test every pivot strategy with and without the introsort guard"""
+        test_arrays = self.test_arrays + [[7, 3, 9, 1] * 20, list(range(100))]
+
+        for strategy in PIVOT_STRATEGIES:
+            for introsort in (False, True):
+                for test_array in test_arrays:
+                    with self.subTest(strategy=strategy, introsort=introsort, array=test_array):
+                        sorter = QuickSort(
+                            test_array, self.callback,
+                            pivot_strategy=strategy, introsort=introsort, seed=1
+                        )
+                        sorter.sort()
+                        self.assertEqual(sorter.array, sorted(test_array))
+
+        with self.assertRaises(ValueError):
+            QuickSort([1, 2], self.callback, pivot_strategy='first')
+
+    def test_intro_sort(self):
+        """Test intro sort stays O(n log n) on ordered inputs"""
+        size = 2000
+        limit = 4 * size * size.bit_length()
+
+        for test_array in self.test_arrays + [list(range(size)), list(range(size, 0, -1))]:
+            with self.subTest(array=test_array[:10]):
+                sorter = IntroSort(test_array, self.callback)
+                sorter.sort()
+                self.assertEqual(sorter.array, sorted(test_array))
+                self.assertLess(sorter.comparisons, limit)
+
+        # The depth guard alone bounds even the last-element pivot
+        sorter = QuickSort(list(range(size)), introsort=True)
+        sorter.sort()
+        self.assertEqual(sorter.array, list(range(size)))
+        self.assertLess(sorter.comparisons, limit)
+
+    def test_three_way_quick_sort(self):
+        """Test three-way partitioning on duplicate-heavy arrays"""
+        generator = DataGenerator()
+        generator.random.seed(7)
+        duplicates = generator.generate_duplicate_heavy_array(size=500, unique_values=5)
+
+        for test_array in self.test_arrays + [duplicates]:
+            with self.subTest(array=test_array[:10]):
+                sorter = ThreeWayQuickSort(test_array, self.callback)
+                sorter.sort()
+                self.assertEqual(sorter.array, sorted(test_array))
+
+        # Equal keys are grouped once instead of being partitioned again
+        two_way = QuickSort(duplicates)
+        two_way.sort()
+        three_way = ThreeWayQuickSort(duplicates)
+        three_way.sort()
+        self.assertLess(three_way.comparisons * 5, two_way.comparisons)
+        self.assertEqual(three_way.get_statistics()['comparisons'], three_way.comparisons)
+
+        all_equal = ThreeWayQuickSort([5] * 1000)
+        all_equal.sort()
+        self.assertLess(all_equal.comparisons, 1010)
+        self.assertLessEqual(all_equal.swaps, 1)
+
+    def test_tim_sort(self):
+        """Test tim sort is stable and adaptive to existing order"""
+        generator = DataGenerator()
+        generator.random.seed(3)
+        size = 5000
+        nearly_sorted = generator.generate_nearly_sorted_array(size=size, swaps=5)
+        shuffled = generator.generate_random_array(size=size)
+
+        for test_array in self.test_arrays + [nearly_sorted, shuffled]:
+            with self.subTest(array=test_array[:10]):
+                sorter = TimSort(test_array, self.callback)
+                sorter.sort()
+                self.assertEqual(sorter.array, sorted(test_array))
+
+        # Sorted and reverse-sorted inputs are a single run
+        for test_array in [list(range(size)), list(range(size, 0, -1))]:
+            sorter = TimSort(test_array)
+            sorter.sort()
+            self.assertEqual(sorter.comparisons, size - 1)
+
+        # A handful of misplaced elements costs close to n comparisons
+        tim_sort = TimSort(nearly_sorted)
+        tim_sort.sort()
+        merge_sort = MergeSort(nearly_sorted)
+        merge_sort.sort()
+        self.assertLess(tim_sort.comparisons, 2 * size)
+        self.assertLess(tim_sort.comparisons * 4, merge_sort.comparisons)
+
+        # Equal keys keep their original order
+        pairs = [(value % 7, index) for index, value in enumerate(shuffled)]
+        sorter = TimSort([_Key(key, index) for key, index in pairs])
+        sorter.sort()
+        self.assertEqual([(item.key, item.index) for item in sorter.array], sorted(pairs))
+
+    def test_integer_sorts(self):
+        """Test counting and radix sort in both the bulk and the step path"""
+        generator = DataGenerator()
+        test_arrays = self.test_arrays + [
+            [5, -3, 2, -3, 0, 1000],
+            generator.generate_random_array(size=1000, seed=5)
+        ]
+
+        for algorithm_class in [CountingSort, RadixSort]:
+            for test_array in test_arrays:
+                with self.subTest(algorithm=algorithm_class.__name__, array=test_array[:10]):
+                    visual = algorithm_class(test_array, self.callback)
+                    visual.sort()
+                    self.assertEqual(visual.array, sorted(test_array))
+
+                    headless = algorithm_class(test_array)
+                    headless.sort()
+                    self.assertEqual(headless.array, sorted(test_array))
+
+            # NumPy input stays a NumPy array on the bulk path
+            values = np.array([9, -4, 7, 7, 0], dtype=np.int32)
+            sorter = algorithm_class(values)
+            sorter.sort()
+            self.assertIsInstance(sorter.array, np.ndarray)
+            self.assertEqual(sorter.array.dtype, np.int32)
+            self.assertEqual(sorter.array.tolist(), [-4, 0, 7, 7, 9])
+
+            with self.assertRaises(ValueError):
+                algorithm_class([1.5, 0.5]).sort()
+
+        # Reading values into the histogram is not a comparison
+        for algorithm_class in [CountingSort, RadixSort]:
+            steps = []
+            sorter = algorithm_class([5, 3, 8, 1], lambda op, idx, values: steps.append(op))
+            sorter.sort()
+            self.assertIn('read', steps)
+            self.assertNotIn('compare', steps)
+            self.assertEqual(sorter.comparisons, 0)
+
+        # Small radixes take more, shorter passes
+        sorter = RadixSort([170, 45, 75, 90, 802, 24, 2, 66], self.callback, radix=10)
+        sorter.sort()
+        self.assertEqual(sorter.array, [2, 24, 45, 66, 75, 90, 170, 802])
+
+    def test_parallel_merge_sort(self):
+        """Test the shared-memory worker path against the serial merge sort"""
+        generator = DataGenerator()
+        integers = generator.generate_random_array(size=5000, seed=11)
+        floats = [value / 7 for value in integers]
+
+        for test_array in [integers, floats, np.array(integers)]:
+            for workers in [1, 3]:
+                with self.subTest(dtype=type(test_array[0]).__name__, workers=workers):
+                    sorter = ParallelMergeSort(test_array, workers=workers, min_parallel_size=100)
+                    sorter.sort()
+                    self.assertTrue(sorter.parallel)
+                    self.assertTrue(sorter.get_statistics()['parallel'])
+                    self.assertEqual(sorter.get_statistics()['comparisons'], 0)
+                    self.assertEqual(list(sorter.array), sorted(test_array))
+                    self.assertIsInstance(sorter.array, type(test_array))
+
+        # Steps shown on the canvas come from the serial merge sort
+        visual = ParallelMergeSort(integers[:50], self.callback, min_parallel_size=10)
+        visual.sort()
+        serial = MergeSort(integers[:50], self.callback)
+        serial.sort()
+        self.assertFalse(visual.parallel)
+        self.assertFalse(visual.get_statistics()['parallel'])
+        self.assertEqual(visual.array, serial.array)
+        self.assertEqual(visual.comparisons, serial.comparisons)
+
+    def test_measure_speedup(self):
+        """Test that the speed-up is taken against the same path on one worker"""
+        result = measure_speedup(list(range(3000, 0, -1)), workers=2)
+        self.assertEqual(result['workers'], 2)
+        self.assertAlmostEqual(result['speedup'], result['serial_time'] / result['parallel_time'])
+        self.assertAlmostEqual(result['merge_sort_speedup'],
+                               result['merge_sort_time'] / result['parallel_time'])
+
     def test_algorithm_properties(self):
         """Test that algorithms return correct complexity information"""
-        algorithms = [BubbleSort, InsertionSort, SelectionSort, MergeSort, QuickSort, HeapSort]
+        algorithms = [BubbleSort, InsertionSort, SelectionSort, MergeSort, QuickSort, HeapSort, IntroSort,
+                      ThreeWayQuickSort, TimSort, CountingSort, RadixSort, ParallelMergeSort]
 
         for algorithm_class in algorithms:
             with self.subTest(algorithm=algorithm_class.__name__):
@@ -90,5 +303,89 @@ class TestSortingAlgorithms(unittest.TestCase):
                     self.assertIn(field, info)
                     self.assertIsNotNone(info[field])
 
+    def test_step_deltas_reproduce_result(self):
+        """Test that applying step deltas to a local copy tracks the algorithm"""
+        for algorithm_class in ALGORITHMS.values():
+            for test_array in self.test_arrays:
+                with self.subTest(algorithm=algorithm_class.__name__, array=test_array):
+                    local_copy = test_array.copy()
+
+                    def on_step(operation, indices, values):
+                        if operation in WRITE_OPERATIONS:
+                            self.assertEqual(len(values), len(indices))
+                        else:
+                            self.assertIsNone(values)
+                        apply_step(local_copy, operation, indices, values)
+
+                    sorter = algorithm_class(test_array, on_step)
+                    sorter.sort()
+                    self.assertEqual(local_copy, sorter.array)
+
+    def test_headless_mode_keeps_statistics(self):
+        """Test that headless runs sort and count without visualization calls"""
+        calls = []
+
+        for name in get_available_algorithms():
+            with self.subTest(algorithm=name):
+                test_array = [64, 34, 25, 12, 22, 11, 90, 5, 77, 3]
+
+                visual = get_algorithm_by_name(name, test_array, self.callback)
+                visual.sort()
+
+                headless = get_algorithm_by_name(
+                    name, test_array, lambda *step: calls.append(step), headless=True
+                )
+                headless.sort()
+
+                self.assertEqual(headless.array, sorted(test_array))
+                self.assertEqual(headless.comparisons, visual.comparisons)
+                self.assertEqual(headless.swaps, visual.swaps)
+
+                # No callback at all implies headless mode
+                self.assertTrue(get_algorithm_by_name(name, test_array).headless)
+
+        self.assertEqual(calls, [])
+
+    def test_steps_generator_matches_callback_run(self):
+        """Test that pulling steps one at a time replays the callback run"""
+        for name in get_available_algorithms():
+            with self.subTest(algorithm=name):
+                test_array = [64, 34, 25, 12, 22, 11, 90, 5, 77, 3]
+
+                callback_steps = []
+                visual = get_algorithm_by_name(
+                    name, test_array, lambda *step: callback_steps.append(step)
+                )
+                visual.sort()
+
+                stepped = get_algorithm_by_name(name, test_array)
+                steps = stepped.steps()
+                first = [next(steps) for _ in range(5)]
+
+                # The run is suspended part-way until more steps are pulled
+                # (counting and radix sort never compare, so check the array)
+                if visual.comparisons:
+                    self.assertLess(stepped.comparisons, visual.comparisons)
+                else:
+                    self.assertNotEqual(stepped.array, visual.array)
+
+                pulled_steps = first + list(steps)
+                self.assertEqual(pulled_steps, callback_steps)
+                self.assertEqual(stepped.array, sorted(test_array))
+                self.assertEqual(stepped.comparisons, visual.comparisons)
+                self.assertTrue(stepped.headless)
+
+    def test_large_ordered_inputs_do_not_recurse(self):
+        """Test that sorted and reverse-sorted inputs beyond the recursion limit work"""
+        size = sys.getrecursionlimit() * 2
+        inputs = [list(range(size)), list(range(size, 0, -1))]
+
+        for algorithm_class in [MergeSort, QuickSort, HeapSort]:
+            for test_array in inputs:
+                with self.subTest(algorithm=algorithm_class.__name__, ascending=test_array[0] == 0):
+                    sorter = algorithm_class(test_array, headless=True)
+                    sorter.sort()
+                    self.assertEqual(sorter.array, sorted(test_array))
+
 if __name__ == '__main__':
     unittest.main()
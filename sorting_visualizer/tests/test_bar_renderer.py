@@ -0,0 +1,107 @@
+"""
+Unit tests for the persistent-artist bar renderer
+"""
+
+import random
+import unittest
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from gui.bar_renderer import BarRenderer
+
+DEFAULT = '#3498DB'
+HIGHLIGHT = '#E74C3C'
+
+def make_renderer():
+    """Renderer on an off-screen Agg canvas"""
+    figure = Figure(figsize=(8, 5), dpi=100)
+    ax = figure.add_subplot(111)
+    return BarRenderer(figure, ax, FigureCanvasAgg(figure))
+
+def pixels(renderer):
+    """Copy of the renderer's canvas pixels"""
+    return np.asarray(renderer.canvas.buffer_rgba()).copy()
+
+class TestBarRenderer(unittest.TestCase):
+    def test_artists_persist(self):
+        """Test that updates change bars in place instead of rebuilding them"""
+        renderer = make_renderer()
+        values = [5, 3, 8, 1]
+        renderer.draw(values, [DEFAULT] * 4)
+        bars = list(renderer.bars)
+
+        values[0], values[3] = values[3], values[0]
+        renderer.update([0, 3], values, [HIGHLIGHT, DEFAULT, DEFAULT, HIGHLIGHT])
+
+        self.assertEqual(renderer.bars, bars)
+        self.assertEqual(renderer.layout_count, 1)
+        self.assertEqual(renderer.frame_count, 1)
+        self.assertEqual([bar.get_height() for bar in bars], [1, 3, 8, 5])
+        self.assertEqual([label.get_text() for label in renderer.labels], ['1', '3', '8', '5'])
+
+    def test_frames_match_full_draw(self):
+        """Test that blitted frames are pixel-identical to a full redraw"""
+        rng = random.Random(1)
+        for size in [12, 150, 600]:
+            with self.subTest(size=size):
+                values = [rng.randint(10, 400) for _ in range(size)]
+                renderer = make_renderer()
+                renderer.draw(values, [DEFAULT] * size)
+
+                highlighted = []
+                for _ in range(25):
+                    i, j = rng.randrange(size), rng.randrange(size)
+                    values[i], values[j] = values[j], values[i]
+                    colors = [DEFAULT] * size
+                    colors[i] = colors[j] = HIGHLIGHT
+                    renderer.update(highlighted + [i, j], values, colors)
+                    highlighted = [i, j]
+
+                reference = make_renderer()
+                reference.draw(values, colors)
+                np.testing.assert_array_equal(pixels(renderer), pixels(reference))
+
+    def test_ranges_match_full_draw(self):
+        """Test that bars showing ranges also blit identically to a full redraw"""
+        rng = random.Random(2)
+        size = 300
+        highs = [rng.randint(200, 400) for _ in range(size)]
+        lows = [rng.randint(10, 200) for _ in range(size)]
+        renderer = make_renderer()
+        renderer.draw(highs, [DEFAULT] * size, lows=lows)
+        self.assertEqual(len(renderer.floors), size)
+
+        highlighted = []
+        for _ in range(25):
+            i = rng.randrange(size)
+            highs[i], lows[i] = rng.randint(200, 400), rng.randint(10, 200)
+            colors = [DEFAULT] * size
+            colors[i] = HIGHLIGHT
+            renderer.update(highlighted + [i], highs, colors, lows=lows)
+            highlighted = [i]
+
+        self.assertEqual(renderer.layout_count, 1)
+        self.assertEqual(renderer.floors[i].get_height(), lows[i])
+
+        reference = make_renderer()
+        reference.draw(highs, colors, lows=lows)
+        np.testing.assert_array_equal(pixels(renderer), pixels(reference))
+
+    def test_relayout(self):
+        """Test that new sizes and out-of-range values lay the plot out again"""
+        renderer = make_renderer()
+        renderer.draw([5, 3, 8], [DEFAULT] * 3)
+
+        renderer.update([1], [5, 100, 8], [DEFAULT] * 3)
+        self.assertEqual(renderer.layout_count, 2)
+        self.assertGreaterEqual(renderer.ax.get_ylim()[1], 100)
+
+        renderer.update([0], [1, 2, 3, 4], [DEFAULT] * 4)
+        self.assertEqual(renderer.layout_count, 3)
+        self.assertEqual(len(renderer.bars), 4)
+
+        renderer.draw([], [])
+        self.assertEqual(renderer.bars, [])
+
+if __name__ == '__main__':
+    unittest.main()
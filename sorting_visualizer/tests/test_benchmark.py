@@ -0,0 +1,122 @@
+"""
+Unit tests for the benchmark harness
+"""
+
+import gc
+import json
+import os
+import tempfile
+import unittest
+from algorithms.merge_sort import MergeSort
+from utils import benchmark as benchmark_module
+from utils.benchmark import Benchmark, time_trials, summarize, load_results, save_results, main
+from utils.complexity_analyzer import ComplexityAnalyzer
+
+class TestBenchmark(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output = os.path.join(self.temp_dir.name, 'results.json')
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        self.temp_dir.cleanup()
+
+    def test_time_trials(self):
+        """Test trial counts, input preservation and GC restoration"""
+        array = [5, 3, 8, 1, 9, 2]
+        times_ns, algorithm = time_trials(MergeSort, array, trials=4, warmup=2)
+
+        self.assertEqual(len(times_ns), 4)
+        self.assertTrue(all(isinstance(t, int) and t >= 0 for t in times_ns))
+        self.assertEqual(algorithm.array, sorted(array))
+        self.assertEqual(array, [5, 3, 8, 1, 9, 2])
+        self.assertTrue(gc.isenabled())
+
+    def test_summarize(self):
+        """Test the summary statistics"""
+        summary = summarize(list(range(1, 21)))
+        self.assertEqual(summary['min_ns'], 1)
+        self.assertEqual(summary['median_ns'], 10.5)
+        self.assertEqual(summary['p95_ns'], 19)
+        self.assertAlmostEqual(summary['mean_ns'], 10.5)
+        self.assertGreater(summary['stddev_ns'], 0)
+
+        self.assertEqual(summarize([7])['stddev_ns'], 0.0)
+
+    def test_matrix(self):
+        """Test the matrix of cells and the quadratic size limit"""
+        benchmark = Benchmark(['bubble_sort', 'merge_sort'], ['random', 'sorted'], [100, 10 ** 9])
+        cells = benchmark.cells()
+        self.assertIn(('bubble_sort', 'random', 100, benchmark.seed), cells)
+        self.assertNotIn(('bubble_sort', 'random', 10 ** 9, benchmark.seed), cells)
+        self.assertIn(('merge_sort', 'sorted', 10 ** 9, benchmark.seed), cells)
+        self.assertEqual(len(cells), 6)
+
+        with self.assertRaises(ValueError):
+            Benchmark(['bogus'])
+        with self.assertRaises(ValueError):
+            Benchmark(distributions=['bogus'])
+
+    def test_run_and_save(self):
+        """Test that a run is reproducible in counts and round-trips through JSON"""
+        benchmark = Benchmark(['quick_sort', 'tim_sort'], ['random'], [200], trials=3, warmup=0)
+        first = benchmark.run()
+        second = benchmark.run()
+
+        self.assertEqual(len(first['results']), 2)
+        for a, b in zip(first['results'], second['results']):
+            self.assertEqual(a['comparisons'], b['comparisons'])
+            self.assertEqual(len(a['times_ns']), 3)
+            self.assertLessEqual(a['min_ns'], a['median_ns'])
+            self.assertLessEqual(a['median_ns'], a['p95_ns'])
+
+        save_results(first, self.output)
+        self.assertEqual(load_results(self.output), json.loads(json.dumps(first)))
+
+        with open(self.output, 'w') as f:
+            f.write('[]')
+        with self.assertRaises(ValueError):
+            load_results(self.output)
+
+    def test_run_parallel(self):
+        """Test that pooled cells stream back and merge in matrix order"""
+        benchmark = Benchmark(['merge_sort', 'heap_sort'], ['random', 'reversed'], [100],
+                              trials=2, warmup=0, inputs=2)
+        streamed = []
+        results = benchmark.run_parallel(workers=2, callback=streamed.append)
+
+        cells = [(r['algorithm'], r['distribution'], r['size'], r['seed']) for r in results['results']]
+        self.assertEqual(cells, benchmark.cells())
+        self.assertEqual(len(streamed), 8)
+        self.assertEqual(results['metadata']['memory_limit'], None)
+
+        serial = benchmark.run()['results']
+        self.assertEqual([r['comparisons'] for r in results['results']],
+                         [r['comparisons'] for r in serial])
+
+    @unittest.skipIf(benchmark_module.resource is None, "needs the resource module")
+    def test_run_parallel_memory_limit(self):
+        """Test that a cell over the memory limit fails without stopping the run"""
+        benchmark = Benchmark(['counting_sort'], ['random'], [100, 5000000], trials=1, warmup=0)
+        results = benchmark.run_parallel(workers=1, memory_limit=200000000)['results']
+
+        self.assertNotIn('error', results[0])
+        self.assertIn('MemoryError', results[1]['error'])
+
+    def test_command_line(self):
+        """Test the command line entry point"""
+        status = main(['--algorithms', 'heap_sort', '--distributions', 'reversed',
+                       '--sizes', '50', '--trials', '2', '--output', self.output])
+        self.assertEqual(status, 0)
+        results = load_results(self.output)['results']
+        self.assertEqual([(r['algorithm'], r['size']) for r in results], [('heap_sort', 50)])
+
+    def test_complexity_analyzer_delegates(self):
+        """Test that ComplexityAnalyzer.benchmark_algorithm uses the harness"""
+        results = ComplexityAnalyzer().benchmark_algorithm(MergeSort, [[3, 1, 2], [5, 4]], trials=3)
+        self.assertEqual([r['test_case'] for r in results], [0, 1])
+        self.assertEqual(results[0]['timing']['median_ns'] / 1e9, results[0]['time_elapsed'])
+
+if __name__ == '__main__':
+    unittest.main()
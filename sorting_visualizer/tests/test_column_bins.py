@@ -0,0 +1,42 @@
+"""
+Unit tests for the per-pixel-column array summary
+"""
+
+import random
+import unittest
+import numpy as np
+from gui.column_bins import ColumnBins
+
+class TestColumnBins(unittest.TestCase):
+    def test_column_of(self):
+        """Test that every element maps to the column whose run holds it"""
+        for size, columns in [(10, 10), (11, 3), (1000, 7), (12345, 640)]:
+            with self.subTest(size=size, columns=columns):
+                bins = ColumnBins(range(size), columns)
+                for index in range(size):
+                    column = bins.column_of(index)
+                    self.assertTrue(bins.starts[column] <= index < bins.stops[column])
+
+    def test_incremental_ranges(self):
+        """Test that writes keep each column's minimum and maximum exact"""
+        rng = random.Random(3)
+        values = [rng.randint(10, 400) for _ in range(5000)]
+        bins = ColumnBins(values, 64)
+
+        for _ in range(50):
+            written = set()
+            for _ in range(40):
+                i, j = rng.randrange(len(values)), rng.randrange(len(values))
+                values[i], values[j] = values[j], rng.choice([values[i], 5, 500])
+                bins.write([i, j], [values[i], values[j]])
+                written.update([bins.column_of(i), bins.column_of(j)])
+
+            self.assertEqual(bins.flush(), sorted(written))
+            array = np.array(values, dtype=float)
+            np.testing.assert_array_equal(bins.lows, np.minimum.reduceat(array, bins.starts))
+            np.testing.assert_array_equal(bins.highs, np.maximum.reduceat(array, bins.starts))
+
+        self.assertEqual(bins.flush(), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+"""
+Unit tests for the complexity analyzer
+"""
+
+import math
+import unittest
+from algorithms.merge_sort import MergeSort
+from algorithms.insertion_sort import InsertionSort
+from utils.complexity_analyzer import ComplexityAnalyzer
+from utils.data_generator import DataGenerator
+
+class TestComplexityAnalyzer(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        self.analyzer = ComplexityAnalyzer()
+        self.sizes = [250, 500, 1000, 2000, 4000, 8000]
+
+    def test_fit_exact_models(self):
+        """Test that exact model data recovers the model and its constant"""
+        models = {
+            'O(n)': lambda n: 3 * n,
+            'O(n log n)': lambda n: 1.5 * n * math.log2(n),
+            'O(n^1.5)': lambda n: 0.2 * n ** 1.5,
+            'O(n²)': lambda n: 0.5 * n * n,
+        }
+        for model, function in models.items():
+            with self.subTest(model=model):
+                fit = self.analyzer.fit_complexity(self.sizes, [function(n) for n in self.sizes])
+                self.assertEqual(fit['model'], model)
+                self.assertAlmostEqual(fit['r_squared'], 1.0)
+                self.assertAlmostEqual(
+                    self.analyzer.predict(fit, 16000) / function(16000), 1.0
+                )
+
+        fit = self.analyzer.fit_complexity(self.sizes, [0.5 * n * n for n in self.sizes])
+        self.assertAlmostEqual(fit['constant'], 0.5)
+        self.assertAlmostEqual(fit['exponent'], 2.0)
+
+    def test_fit_noisy_measurements(self):
+        """Test fitting measurements with a few percent of noise"""
+        noise = [1.03, 0.97, 1.02, 0.99, 1.04, 0.98]
+        measurements = [2 * n * math.log2(n) * e for n, e in zip(self.sizes, noise)]
+
+        fit = self.analyzer.fit_complexity(self.sizes, measurements)
+        self.assertEqual(fit['model'], 'O(n log n)')
+        self.assertAlmostEqual(fit['constant'], 2.0, delta=0.1)
+        self.assertGreater(fit['r_squared'], 0.99)
+
+    def test_fit_needs_two_sizes(self):
+        """Test that a single size or zero measurements cannot be fitted"""
+        with self.assertRaises(ValueError):
+            self.analyzer.fit_complexity([100, 100], [5, 6])
+        with self.assertRaises(ValueError):
+            self.analyzer.fit_complexity([100, 200], [0, 0])
+
+    def test_single_point_estimate(self):
+        """Test that n log n operation counts are not labelled quadratic"""
+        n = 1000
+        self.assertEqual(self.analyzer.estimate_complexity_class(n, 2 * n * 10), 'O(n log n)')
+        self.assertEqual(self.analyzer.estimate_complexity_class(n, n * n // 2), 'O(n²)')
+        self.assertEqual(self.analyzer.estimate_complexity_class(n, n - 1), 'O(n)')
+        self.assertEqual(self.analyzer.estimate_complexity_class(1, 0), 'O(1)')
+
+    def test_benchmark_fits_sizes(self):
+        """Test that benchmark_algorithm labels runs from a fit over all sizes"""
+        generator = DataGenerator()
+        arrays = [generator.generate_random_array(n, 1, 10 ** 6, seed=n) for n in [100, 200, 400, 800]]
+
+        for algorithm_class, model in [(MergeSort, 'O(n log n)'), (InsertionSort, 'O(n²)')]:
+            with self.subTest(algorithm=algorithm_class.__name__):
+                results = self.analyzer.benchmark_algorithm(algorithm_class, arrays, trials=1, warmup=0)
+                self.assertEqual({r['estimated_complexity'] for r in results}, {model})
+
+if __name__ == '__main__':
+    unittest.main()
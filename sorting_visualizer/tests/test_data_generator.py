@@ -0,0 +1,99 @@
+"""
+Unit tests for loading and saving number files
+"""
+
+import os
+import tempfile
+import unittest
+import numpy as np
+from utils.data_generator import DataGenerator
+
+class TestLoadFromFile(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.temp_dir.name, 'numbers.txt')
+        self.generator = DataGenerator()
+
+    def tearDown(self):
+        """Clean up after tests"""
+        self.temp_dir.cleanup()
+
+    def write(self, content):
+        with open(self.filename, 'w') as f:
+            f.write(content)
+
+    def test_formats_and_chunk_boundaries(self):
+        """Test both delimiters, with tokens split across small chunks"""
+        cases = {
+            '64,34,25,12': [64, 34, 25, 12],
+            '64\n34\n25\n12\n': [64, 34, 25, 12],
+            '64, 34,\n25 ,12,\n': [64, 34, 25, 12],
+            '-5 17\n\n3\n': [-5, 17, 3],
+            '': [],
+        }
+
+        for content, expected in cases.items():
+            for chunk_bytes in [4, 1 << 20]:
+                with self.subTest(content=content, chunk_bytes=chunk_bytes):
+                    self.write(content)
+                    self.assertEqual(self.generator.load_from_file(self.filename, chunk_bytes=chunk_bytes), expected)
+
+    def test_as_array(self):
+        """Test loading straight into a NumPy array"""
+        numbers = self.generator.generate_random_array(size=5000, seed=2)
+        self.write('\n'.join(map(str, numbers)))
+
+        loaded = self.generator.load_from_file(self.filename, as_array=True, chunk_bytes=1000)
+        self.assertIsInstance(loaded, np.ndarray)
+        self.assertEqual(loaded.dtype, np.int64)
+        self.assertEqual(loaded.tolist(), numbers)
+
+    def test_bad_token_reports_line(self):
+        """Test that errors name the line of the first bad token"""
+        self.write('1\n2\n3\n4.5\n5\n')
+        for chunk_bytes in [3, 1 << 20]:
+            with self.subTest(chunk_bytes=chunk_bytes):
+                with self.assertRaisesRegex(ValueError, "line 4: invalid number '4.5'"):
+                    self.generator.load_from_file(self.filename, chunk_bytes=chunk_bytes)
+
+        self.write('1,2\n3,99999999999999999999999\n')
+        with self.assertRaisesRegex(ValueError, 'line 2'):
+            self.generator.load_from_file(self.filename)
+
+        with self.assertRaises(ValueError):
+            self.generator.load_from_file(os.path.join(self.temp_dir.name, 'missing.txt'))
+
+    def test_binary_formats_round_trip(self):
+        """Test saving and memory-mapped loading of .npy and raw files"""
+        numbers = self.generator.generate_random_array(size=1000, min_val=-50, max_val=5000, seed=4)
+
+        for extension, dtype in [('.npy', np.int64), ('.i32', np.int32), ('.f64', np.float64)]:
+            with self.subTest(extension=extension):
+                filename = os.path.join(self.temp_dir.name, 'numbers' + extension)
+                self.generator.save_to_file(numbers, filename)
+
+                mapped = self.generator.load_from_file(filename, as_array=True)
+                self.assertIsInstance(mapped, np.memmap)
+                self.assertEqual(mapped.dtype, dtype)
+                self.assertEqual(mapped.tolist(), numbers)
+                self.assertEqual(self.generator.load_from_file(filename), numbers)
+                del mapped
+
+        # Text output is one number per line
+        self.generator.save_to_file(np.array(numbers), self.filename)
+        self.assertEqual(self.generator.load_from_file(self.filename), numbers)
+
+    def test_binary_format_errors(self):
+        """Test values that do not fit and files with partial values"""
+        with self.assertRaises(ValueError):
+            self.generator.save_to_file([2 ** 40], os.path.join(self.temp_dir.name, 'big.i32'))
+
+        filename = os.path.join(self.temp_dir.name, 'partial.f64')
+        with open(filename, 'wb') as f:
+            f.write(b'\0' * 12)
+        with self.assertRaises(ValueError):
+            self.generator.load_from_file(filename)
+
+if __name__ == '__main__':
+    unittest.main()
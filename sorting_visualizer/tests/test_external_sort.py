@@ -0,0 +1,72 @@
+"""
+Unit tests for the external merge sort
+"""
+
+import os
+import tempfile
+import unittest
+from utils.data_generator import DataGenerator
+from utils.external_sort import ExternalSorter
+
+class TestExternalSort(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.input_file = os.path.join(self.temp_dir.name, 'numbers.txt')
+        self.output_file = os.path.join(self.temp_dir.name, 'sorted.txt')
+
+        generator = DataGenerator()
+        self.numbers = generator.generate_random_array(size=20000, min_val=-500, max_val=100000, seed=3)
+
+    def tearDown(self):
+        """Clean up after tests"""
+        self.temp_dir.cleanup()
+
+    def read_output(self):
+        with open(self.output_file) as f:
+            return [int(line) for line in f]
+
+    def test_sorts_with_every_engine(self):
+        """Test that runs sorted by different engines merge correctly"""
+        with open(self.input_file, 'w') as f:
+            f.write(','.join(map(str, self.numbers)))
+
+        for engine in ['radix_sort', 'counting_sort', 'tim_sort', 'quick_sort']:
+            with self.subTest(engine=engine):
+                sorter = ExternalSorter(memory_budget=64 * 1024, engine=engine)
+                self.assertEqual(sorter.sort_file(self.input_file, self.output_file), len(self.numbers))
+                self.assertGreater(sorter.run_count, 1)
+                self.assertEqual(self.read_output(), sorted(self.numbers))
+
+    def test_multiple_merge_passes_and_progress(self):
+        """Test that more runs than the fan-in are merged over several passes"""
+        with open(self.input_file, 'w') as f:
+            f.write('\n'.join(map(str, self.numbers)) + '\n')
+
+        progress = []
+        sorter = ExternalSorter(
+            memory_budget=1024, callback=lambda *step: progress.append(step),
+            temp_dir=self.temp_dir.name, fan_in=4
+        )
+        sorter.sort_file(self.input_file, self.output_file)
+
+        self.assertEqual(self.read_output(), sorted(self.numbers))
+        self.assertGreater(sorter.merge_passes, 1)
+
+        # Progress arrives as (stage, [done, total], None) steps
+        self.assertEqual(progress[0][0], 'split')
+        self.assertEqual(progress[-1], ('merge', [len(self.numbers), len(self.numbers)], None))
+
+        # Temporary runs are removed afterwards
+        self.assertEqual(sorted(os.listdir(self.temp_dir.name)), ['numbers.txt', 'sorted.txt'])
+
+    def test_rejects_bad_tokens(self):
+        """Test that non-integer input is reported"""
+        with open(self.input_file, 'w') as f:
+            f.write('1,2,x,4')
+
+        with self.assertRaises(ValueError):
+            ExternalSorter().sort_file(self.input_file, self.output_file)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+Unit tests for the animation frame pacer
+"""
+
+import math
+import unittest
+from gui.frame_pacer import FramePacer, format_speed, steps_per_second_for_speed
+from config.settings import ANIMATION_CONFIG
+
+class TestFramePacer(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        self.pacer = FramePacer(50)  # 20 ms frames
+        self.pacer.start(100.0)
+
+    def test_fixed_deadlines(self):
+        """Test that frame work shortens the wait instead of adding to it"""
+        self.assertEqual(self.pacer.next_delay(100.000), 20)
+        self.assertEqual(self.pacer.next_delay(100.032), 8)
+        self.assertEqual(self.pacer.next_delay(100.060), 0)
+        self.assertEqual(self.pacer.dropped, 0)
+
+    def test_dropped_frames(self):
+        """Test that overrunning whole intervals skips and counts those frames"""
+        self.pacer.next_delay(100.0)
+        delay = self.pacer.next_delay(100.095)  # deadline 100.040, overran by 55 ms
+
+        # The frames due at 100.040 and 100.060 are skipped, 100.080 runs at once
+        self.assertEqual(self.pacer.dropped, 2)
+        self.assertEqual(delay, 0)
+        self.assertEqual(self.pacer.next_delay(100.095), 5)
+
+    def test_coalesced_steps(self):
+        """Test the frame, step and coalesced step counters"""
+        for steps in [1, 5, 0, 10]:
+            self.pacer.record_frame(steps)
+
+        self.assertEqual(self.pacer.frames, 4)
+        self.assertEqual(self.pacer.steps, 16)
+        self.assertEqual(self.pacer.coalesced, 13)
+        self.assertAlmostEqual(self.pacer.steps_per_second(102.0), 8.0)
+
+        self.pacer.start(200.0)
+        self.assertEqual((self.pacer.frames, self.pacer.coalesced, self.pacer.dropped), (0, 0, 0))
+
+    def test_steps_without_frames(self):
+        """Test that undrawn steps count as coalesced and in the sampled rate"""
+        self.pacer.record_steps(3000)
+        self.assertEqual(self.pacer.rate_mark, (100.0, 0))
+        self.assertAlmostEqual(self.pacer.sample_rate(100.5), 6000.0)
+
+        self.pacer.record_frame(1000)
+        self.assertEqual((self.pacer.frames, self.pacer.coalesced), (1, 3999))
+        self.assertAlmostEqual(self.pacer.sample_rate(101.0), 2000.0)
+        self.assertEqual(self.pacer.sample_rate(101.0), 0.0)
+
+class TestSpeedModel(unittest.TestCase):
+    def test_logarithmic_mapping(self):
+        """Test that equal slider moves multiply the step rate equally"""
+        low, high = ANIMATION_CONFIG['SPEED_MIN'], ANIMATION_CONFIG['SPEED_MAX']
+        rates = [steps_per_second_for_speed(speed) for speed in range(low, high)]
+
+        self.assertAlmostEqual(rates[0], ANIMATION_CONFIG['STEPS_PER_SECOND_MIN'])
+        self.assertAlmostEqual(rates[-1], ANIMATION_CONFIG['STEPS_PER_SECOND_MAX'])
+
+        ratios = {round(math.log(b / a), 9) for a, b in zip(rates, rates[1:])}
+        self.assertEqual(len(ratios), 1)
+        self.assertGreater(ratios.pop(), 0)
+
+        # The fast end runs thousands of steps per frame
+        self.assertGreater(rates[-1] / ANIMATION_CONFIG['FRAME_RATE'], 1000)
+
+    def test_run_to_completion(self):
+        """Test that the top position means running to completion"""
+        top = ANIMATION_CONFIG['SPEED_MAX']
+        self.assertIsNone(steps_per_second_for_speed(top))
+        self.assertEqual(format_speed(top), "Run to completion")
+        self.assertEqual(format_speed(ANIMATION_CONFIG['SPEED_MIN']), "1.0 steps/s")
+        self.assertEqual(format_speed(top - 1), "1,000,000 steps/s")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,6 +5,8 @@ Basic GUI component tests
 import unittest
 import tkinter as tk
 from gui.main_window import MainWindow
+from gui.control_panel import array_size_for_position, position_for_array_size
+from config.settings import ARRAY_CONFIG
 from utils.data_generator import DataGenerator
 
 class TestGUIComponents(unittest.TestCase):
@@ -42,5 +44,22 @@ class TestGUIComponents(unittest.TestCase):
         reverse_array = generator.generate_reverse_sorted_array(size=5)
         self.assertEqual(reverse_array, sorted(reverse_array, reverse=True))
 
+class TestSizeSlider(unittest.TestCase):
+    def test_logarithmic_sizes(self):
+        """Test that the size slider spans the configured sizes logarithmically"""
+        steps = ARRAY_CONFIG['SIZE_SLIDER_STEPS']
+        self.assertEqual(array_size_for_position(0), ARRAY_CONFIG['SIZE_MIN'])
+        self.assertEqual(array_size_for_position(steps), ARRAY_CONFIG['SIZE_MAX'])
+
+        sizes = [array_size_for_position(position) for position in range(steps + 1)]
+        self.assertEqual(sizes, sorted(sizes))
+        self.assertAlmostEqual(sizes[steps // 2] ** 2 / (sizes[0] * sizes[-1]), 1, places=2)
+
+    def test_default_size_round_trip(self):
+        """Test that the default size has a slider position of its own"""
+        default = ARRAY_CONFIG['SIZE_DEFAULT']
+        self.assertEqual(array_size_for_position(position_for_array_size(default)), default)
+        self.assertEqual(position_for_array_size(10 ** 9), ARRAY_CONFIG['SIZE_SLIDER_STEPS'])
+
 if __name__ == '__main__':
     unittest.main()
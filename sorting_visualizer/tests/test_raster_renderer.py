@@ -0,0 +1,136 @@
+"""
+Unit tests for the image buffer renderer
+"""
+
+import random
+import unittest
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from gui.raster_renderer import RasterRenderer, _pixel
+from gui.bar_renderer import envelope_color
+
+DEFAULT = '#3498DB'
+HIGHLIGHT = '#E74C3C'
+
+def make_renderer():
+    """Renderer on an off-screen Agg canvas"""
+    figure = Figure(figsize=(8, 5), dpi=100)
+    ax = figure.add_subplot(111)
+    return RasterRenderer(figure, ax, FigureCanvasAgg(figure))
+
+def pixels(renderer):
+    """Copy of the renderer's canvas pixels"""
+    return np.asarray(renderer.canvas.buffer_rgba()).copy()
+
+class TestRasterRenderer(unittest.TestCase):
+    def test_buffer_fits_axes(self):
+        """Test that the buffer has one pixel per screen pixel of the axes"""
+        renderer = make_renderer()
+        renderer.draw([5, 3, 8], [DEFAULT] * 3)
+        bbox = renderer.ax.bbox
+        self.assertEqual(renderer.buffer.shape, (round(bbox.height), round(bbox.width), 4))
+
+        # A resize fits the buffer to the new size on the next full draw
+        renderer.figure.set_size_inches(6, 4)
+        renderer.canvas.draw()
+        bbox = renderer.ax.bbox
+        self.assertEqual(renderer.buffer.shape[:2], (round(bbox.height), round(bbox.width)))
+
+    def test_column_heights(self):
+        """Test that each element fills its slot up to its value, with gaps"""
+        renderer = make_renderer()
+        renderer.draw([10, 20, 40], [DEFAULT, HIGHLIGHT, DEFAULT])
+        height = renderer.buffer.shape[0]
+        filled = renderer.pixels != renderer.background_pixel
+
+        for i, value in enumerate([10, 20, 40]):
+            columns = np.flatnonzero((renderer.lo == i) & ~renderer.gaps)
+            expected = round(value / renderer.y_max * height)
+            self.assertTrue((filled[:, columns].sum(axis=0) == expected).all())
+        self.assertFalse(filled[:, renderer.gaps].any())
+        self.assertTrue(renderer.gaps.any())
+
+        column = np.flatnonzero(renderer.lo == 1)[0]
+        np.testing.assert_array_equal(renderer.buffer[0, column], [0xE7, 0x4C, 0x3C, 0xFF])
+
+    def test_tallest_element_shows(self):
+        """Test that a column shared by several elements shows the tallest"""
+        size = 100000
+        values = [10] * size
+        renderer = make_renderer()
+        renderer.draw(values, [DEFAULT] * size)
+        self.assertEqual(renderer.hi[-1], size)
+
+        column = 100
+        index = (renderer.lo[column] + renderer.hi[column]) // 2
+        values[index] = 300
+        colors = [DEFAULT] * size
+        colors[index] = HIGHLIGHT
+        renderer.update([index], values, colors)
+
+        filled = (renderer.pixels != renderer.background_pixel).sum(axis=0)
+        self.assertEqual(filled[column], round(300 / renderer.y_max * renderer.buffer.shape[0]))
+        self.assertEqual(len(set(filled) - {filled[column]}), 1)
+        np.testing.assert_array_equal(renderer.buffer[0, column], [0xE7, 0x4C, 0x3C, 0xFF])
+
+    def test_frames_match_full_draw(self):
+        """Test that updated frames are pixel-identical to a full redraw"""
+        rng = random.Random(1)
+        for size in [12, 600, 20000]:
+            with self.subTest(size=size):
+                values = [rng.randint(10, 400) for _ in range(size)]
+                renderer = make_renderer()
+                renderer.draw(values, [DEFAULT] * size)
+
+                highlighted = []
+                for _ in range(25):
+                    i, j = rng.randrange(size), rng.randrange(size)
+                    values[i], values[j] = values[j], values[i]
+                    colors = [DEFAULT] * size
+                    colors[i] = colors[j] = HIGHLIGHT
+                    renderer.update(highlighted + [i, j], values, colors)
+                    highlighted = [i, j]
+
+                self.assertEqual(renderer.layout_count, 1)
+                self.assertEqual(renderer.frame_count, 25)
+
+                reference = make_renderer()
+                reference.draw(values, colors)
+                np.testing.assert_array_equal(pixels(renderer), pixels(reference))
+
+    def test_ranges(self):
+        """Test that ranges are solid up to the low end and lighter above it"""
+        renderer = make_renderer()
+        renderer.draw([40, 40], [DEFAULT, DEFAULT], lows=[10, 40])
+        renderer.update([0], [40, 40], [HIGHLIGHT, DEFAULT], lows=[20, 40])
+        self.assertEqual(renderer.layout_count, 1)
+
+        height = renderer.pixels.shape[0]
+        low, high = (round(value / renderer.y_max * height) for value in [20, 40])
+        column = renderer.pixels[:, np.flatnonzero(renderer.lo == 0)[0]]
+        self.assertTrue((column[:low] == _pixel(HIGHLIGHT)).all())
+        self.assertTrue((column[low:high] == _pixel(envelope_color(HIGHLIGHT))).all())
+        self.assertTrue((column[high:] == renderer.background_pixel).all())
+
+        column = renderer.pixels[:, np.flatnonzero(renderer.lo == 1)[0]]
+        self.assertTrue((column[:high] == _pixel(DEFAULT)).all())
+
+    def test_relayout(self):
+        """Test that new sizes and out-of-range values lay the plot out again"""
+        renderer = make_renderer()
+        renderer.draw([5, 3, 8], [DEFAULT] * 3)
+
+        renderer.update([1], [5, 100, 8], [DEFAULT] * 3)
+        self.assertEqual(renderer.layout_count, 2)
+        self.assertGreaterEqual(renderer.ax.get_ylim()[1], 100)
+
+        renderer.update([0], [1, 2, 3, 4], [DEFAULT] * 4)
+        self.assertEqual(renderer.layout_count, 3)
+        self.assertEqual(renderer.lo.max(), 3)
+
+        renderer.draw([], [])
+        self.assertIsNone(renderer.image)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+"""
+Unit tests for the benchmark regression gate
+"""
+
+import copy
+import os
+import unittest
+from utils.benchmark import load_results
+from utils.regression_gate import RegressionGate, mann_whitney_u, main
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmark_baseline.json')
+
+def make_results(comparisons=100, swaps=50, times_ns=(100, 101, 102, 103, 104, 105, 106, 107, 108)):
+    """Results dictionary with a single quick sort cell"""
+    ordered = sorted(times_ns)
+    return {
+        'metadata': {},
+        'results': [{
+            'algorithm': 'quick_sort',
+            'distribution': 'random',
+            'size': 256,
+            'seed': 42,
+            'comparisons': comparisons,
+            'swaps': swaps,
+            'median_ns': ordered[len(ordered) // 2],
+            'times_ns': list(times_ns),
+        }],
+    }
+
+class TestRegressionGate(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        self.baseline = make_results()
+        self.gate = RegressionGate(self.baseline, alpha=0.01, min_slowdown=0.05)
+
+    def test_mann_whitney_u(self):
+        """Test the one-sided U test on shifted, equal and faster samples"""
+        baseline = [100, 102, 98, 101, 99, 103, 97]
+        slower = [120, 125, 118, 122, 121, 119, 124]
+
+        u, p_value = mann_whitney_u(baseline, slower)
+        self.assertEqual(u, 49)
+        self.assertLess(p_value, 0.01)
+
+        self.assertGreater(mann_whitney_u(baseline, baseline)[1], 0.4)
+        self.assertGreater(mann_whitney_u(slower, baseline)[1], 0.99)
+        self.assertEqual(mann_whitney_u([5, 5, 5], [5, 5, 5])[1], 1.0)
+        self.assertEqual(mann_whitney_u([], [1, 2])[1], 1.0)
+
+    def test_unchanged(self):
+        """Test that identical results pass"""
+        self.assertEqual(self.gate.compare(copy.deepcopy(self.baseline)), [])
+
+    def test_count_regression(self):
+        """Test that doubled comparisons fail and fewer swaps only report"""
+        findings = self.gate.compare(make_results(comparisons=200, swaps=40))
+        by_kind = {finding['kind']: finding for finding in findings}
+
+        self.assertTrue(by_kind['comparisons']['regression'])
+        self.assertFalse(by_kind['swaps']['regression'])
+
+    def test_timing_regression(self):
+        """Test that a significant slowdown fails and a tiny one does not"""
+        slower = make_results(times_ns=[t * 2 for t in self.baseline['results'][0]['times_ns']])
+        findings = self.gate.compare(slower)
+        self.assertEqual([finding['kind'] for finding in findings], ['time'])
+        self.assertTrue(findings[0]['regression'])
+        self.assertAlmostEqual(findings[0]['slowdown'], 1.0)
+
+        # Significant, but below the minimum slowdown
+        marginal = make_results(times_ns=[t + 3 for t in self.baseline['results'][0]['times_ns']])
+        self.assertEqual(self.gate.compare(marginal), [])
+
+        gate = RegressionGate(self.baseline, check_timing=False)
+        self.assertEqual(gate.compare(slower), [])
+
+    def test_failed_cell(self):
+        """Test that a cell that failed to run is a regression"""
+        results = make_results()
+        results['results'][0] = {key: results['results'][0][key]
+                                 for key in ['algorithm', 'distribution', 'size', 'seed']}
+        results['results'][0]['error'] = 'MemoryError'
+
+        findings = self.gate.compare(results)
+        self.assertEqual([(f['kind'], f['regression']) for f in findings], [('error', True)])
+
+    def test_too_few_baseline_samples(self):
+        """Test that timings are not checked against a baseline of a few samples"""
+        baseline = make_results(times_ns=[100, 101, 102])
+        with self.assertRaises(ValueError):
+            RegressionGate(baseline)
+
+        gate = RegressionGate(baseline, check_timing=False)
+        self.assertEqual(gate.compare(make_results(times_ns=[200, 201, 202])), [])
+        RegressionGate(baseline, min_samples=3)
+
+    def test_stored_baseline_can_detect_slowdowns(self):
+        """Test that the stored baseline has enough samples for the timing test"""
+        RegressionGate(load_results(BASELINE_FILE))
+
+    def test_suite_against_stored_baseline(self):
+        """Test that the algorithms still make the baseline's comparisons and swaps"""
+        status = main(['--baseline', BASELINE_FILE, '--counts-only', '--trials', '1'])
+        self.assertEqual(status, 0)
+
+if __name__ == '__main__':
+    unittest.main()
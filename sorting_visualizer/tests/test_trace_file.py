@@ -0,0 +1,99 @@
+"""
+Unit tests for binary trace recording and replay
+"""
+
+import os
+import tempfile
+import unittest
+import numpy as np
+from algorithms import get_algorithm_by_name, get_available_algorithms
+from algorithms.step_events import apply_step
+from utils.trace_file import TraceReader, TraceWriter, record_trace, RECORD_DTYPE
+
+class TestTraceFile(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.temp_dir.name, 'run.svtrace')
+        self.test_array = [64, 34, 25, 12, 22, 11, 90, 5, 77, 3]
+
+    def tearDown(self):
+        """Clean up after tests"""
+        self.temp_dir.cleanup()
+
+    def test_replay_matches_recorded_steps(self):
+        """Test that replayed steps are exactly the steps the algorithm emitted"""
+        for name in get_available_algorithms():
+            with self.subTest(algorithm=name):
+                steps = []
+                get_algorithm_by_name(
+                    name, self.test_array, lambda *step: steps.append(step)
+                ).sort()
+
+                record_trace(name, self.test_array, self.filename)
+                reader = TraceReader(self.filename)
+
+                replayed = []
+                local_copy = reader.initial_array
+                for operation, indices, values in reader.iter_steps(chunk_size=7):
+                    apply_step(local_copy, operation, indices, values)
+                    replayed.append((operation, indices, values))
+                reader.close()
+
+                # Long highlight lists may be split into several range records
+                self.assertEqual(
+                    [step for step in replayed if len(step[1]) <= 2],
+                    [step for step in steps if len(step[1]) <= 2]
+                )
+                self.assertEqual(local_copy, sorted(self.test_array))
+
+    def test_records_are_fixed_width(self):
+        """Test that the file size is header + values + fixed-width records"""
+        with TraceWriter(self.filename, [3, 1, 2], buffer_records=2) as writer:
+            writer('compare', [0, 1], None)
+            writer('swap', [0, 1], [1, 3])
+            writer('sorted', [0, 1, 2], None)
+            writer('read', [2], None)
+
+        reader = TraceReader(self.filename)
+        self.assertEqual(len(reader), 4)
+        self.assertEqual(list(reader), [
+            ('compare', [0, 1], None),
+            ('swap', [0, 1], [1, 3]),
+            ('sorted', [0, 1, 2], None),
+            ('read', [2], None),
+        ])
+        reader.close()
+
+        expected_size = 28 + 3 * 8 + 4 * RECORD_DTYPE.itemsize
+        self.assertEqual(os.path.getsize(self.filename), expected_size)
+
+    def test_rejects_float_arrays(self):
+        """Test that float arrays are refused before any file is written"""
+        values = np.array([2.5, 1.0, 3.0])
+        with self.assertRaises(ValueError):
+            record_trace('merge_sort', values, self.filename)
+        self.assertFalse(os.path.exists(self.filename))
+
+        # Integer NumPy arrays, as loaded from binary files, are fine
+        record_trace('merge_sort', np.array([3, 1, 2], dtype=np.int32), self.filename)
+        reader = TraceReader(self.filename)
+        self.assertEqual(reader.initial_array, [3, 1, 2])
+        reader.close()
+
+    def test_failed_run_leaves_no_file(self):
+        """Test that a run that fails part way removes its trace file"""
+        with self.assertRaises(ValueError):
+            record_trace('bogus_sort', self.test_array, self.filename)
+        self.assertFalse(os.path.exists(self.filename))
+
+    def test_rejects_other_files(self):
+        """Test that non-trace files are rejected"""
+        with open(self.filename, 'w') as f:
+            f.write('1,2,3')
+
+        with self.assertRaises(ValueError):
+            TraceReader(self.filename)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+"""
+Unit tests for the vectorized data generator
+"""
+
+import unittest
+import numpy as np
+from config.settings import ARRAY_CONFIG
+from utils.vectorized_generator import VectorizedGenerator, DISTRIBUTIONS
+
+class TestVectorizedGenerator(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        self.generator = VectorizedGenerator(seed=42)
+        self.size = 1000
+
+    def test_every_distribution(self):
+        """Test size, dtype and value range of every distribution"""
+        for distribution in DISTRIBUTIONS:
+            for size in [0, 1, self.size]:
+                with self.subTest(distribution=distribution, size=size):
+                    array = self.generator.generate(distribution, size)
+                    self.assertIsInstance(array, np.ndarray)
+                    self.assertEqual(array.dtype, np.int64)
+                    self.assertEqual(len(array), size)
+                    if size:
+                        self.assertGreaterEqual(array.min(), ARRAY_CONFIG['VALUE_MIN'])
+                        self.assertLessEqual(array.max(), ARRAY_CONFIG['VALUE_MAX'])
+
+        with self.assertRaises(ValueError):
+            self.generator.generate('bogus', 10)
+
+    def test_seeded_reproducibility(self):
+        """Test that the same seed gives the same arrays"""
+        for distribution in DISTRIBUTIONS:
+            with self.subTest(distribution=distribution):
+                first = VectorizedGenerator(seed=7).generate(distribution, self.size)
+                second = VectorizedGenerator(seed=7).generate(distribution, self.size)
+                np.testing.assert_array_equal(first, second)
+
+    def test_shuffles_are_permutations(self):
+        """Test that the partly shuffled distributions only rearrange sorted input"""
+        for distribution in ['nearly_sorted', 'k_percent_shuffled']:
+            for seed in range(20):
+                with self.subTest(distribution=distribution, seed=seed):
+                    array = VectorizedGenerator(seed).generate(distribution, self.size)
+                    expected = VectorizedGenerator(seed).generate_sorted_array(self.size)
+                    np.testing.assert_array_equal(np.sort(array), expected)
+
+    def test_distribution_shapes(self):
+        """Test the defining property of each structured distribution"""
+        descents = lambda array: int((np.diff(array) < 0).sum())
+
+        self.assertEqual(descents(self.generator.generate('sorted', self.size)), 0)
+        self.assertEqual(descents(self.generator.generate('k_runs', self.size, runs=5)), 4)
+        self.assertEqual(descents(self.generator.generate('sawtooth', self.size, teeth=4)), 3)
+
+        pipe = self.generator.generate('organ_pipe', self.size)
+        peak = int(pipe.argmax())
+        self.assertEqual(descents(pipe[:peak + 1]), 0)
+        self.assertEqual(int((np.diff(pipe[peak:]) > 0).sum()), 0)
+
+        few = self.generator.generate('few_unique', self.size, unique_values=3)
+        self.assertLessEqual(len(np.unique(few)), 3)
+
+        nearly = self.generator.generate('nearly_sorted', self.size, swaps=30)
+        self.assertLessEqual((nearly != self.generator.generate('sorted', self.size)).sum(), 60)
+
+        shuffled = self.generator.generate('k_percent_shuffled', self.size, percent=5)
+        moved = (shuffled != self.generator.generate('sorted', self.size)).sum()
+        self.assertLessEqual(moved, self.size * 5 // 100)
+
+        # The most common Zipf value is far more frequent than uniform
+        counts = np.bincount(self.generator.generate('zipf', 10000))
+        self.assertGreater(counts.max(), 10 * 10000 // len(np.nonzero(counts)[0]))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,183 @@
+"""
+Adversarial worst-case input generation (McIlroy's "antiqsort")
+
+The target algorithm sorts placeholder items whose comparison operators
+consult an adversary, so every comparison is seen: the algorithm's compare
+hook as well as the comparisons some algorithms make inline. All items
+start as "gas", on one side of every value decided so far. When two gas
+items meet, one is frozen to the next value, preferring the item that most
+recently survived a comparison as gas, which is usually the pivot
+candidate. Replaying the frozen values as a real input reproduces the same
+comparisons, which drives pivot-based sorts to their quadratic worst case;
+with gas below the frozen values the same game yields the reversed-style
+inputs that defeat insertion and bubble sort.
+
+The game only pays off against algorithms whose comparisons depend on
+choices the adversary can steer: quick sort under every pivot strategy
+(intro sort falls back to heap sort and stays n log n), insertion sort and
+bubble sort. Merge sort and heap sort compare in a nearly fixed pattern,
+so the game gains only a few percent over a shuffle, and tim sort finds
+the runs the game leaves behind, so its frozen inputs are easier than a
+shuffle. A seeded random permutation is therefore always tried as well,
+so the result is never weaker than that random input.
+"""
+
+import random
+
+from algorithms import ALGORITHMS
+from config.settings import ARRAY_CONFIG
+
+# Algorithms that never compare elements, so there is nothing to instrument
+NON_COMPARISON_ALGORITHMS = ('counting_sort', 'radix_sort')
+
+class _Item:
+    """Placeholder element whose comparisons are decided by the adversary"""
+    __slots__ = ('adversary', 'index')
+
+    def __init__(self, adversary, index):
+        self.adversary = adversary
+        self.index = index
+
+    def __lt__(self, other):
+        return self.adversary.compare(self.index, other.index) < 0
+
+    def __le__(self, other):
+        return self.adversary.compare(self.index, other.index) <= 0
+
+    def __gt__(self, other):
+        return self.adversary.compare(self.index, other.index) > 0
+
+    def __ge__(self, other):
+        return self.adversary.compare(self.index, other.index) >= 0
+
+    def __eq__(self, other):
+        return self.adversary.compare(self.index, other.index) == 0
+
+    def __ne__(self, other):
+        return self.adversary.compare(self.index, other.index) != 0
+
+    def __hash__(self):
+        return self.index
+
+class AdversarialGenerator:
+    # Ways to settle a comparison between two gas items, as (side, freeze):
+    # side 'low' hands out values from the bottom with gas above every
+    # frozen value, 'high' from the top with gas below; freeze 'candidate'
+    # freezes the most recent gas survivor (McIlroy's pivot guess), 'other'
+    # freezes the item it meets
+    POLICIES = (
+        ('low', 'candidate'),
+        ('low', 'other'),
+        ('high', 'candidate'),
+        ('high', 'other'),
+    )
+
+    def __init__(self, algorithm_name, **options):
+        """
+        Set up an adversary against one algorithm
+
+        Args:
+            algorithm_name: Name of the target algorithm in the registry
+            **options: Extra constructor arguments of the target, such as
+                QuickSort's pivot_strategy or seed
+        """
+        if algorithm_name not in ALGORITHMS:
+            raise ValueError(f"Unknown algorithm: {algorithm_name}")
+        if algorithm_name in NON_COMPARISON_ALGORITHMS:
+            raise ValueError(f"{algorithm_name} does not compare elements, so it has no adversary")
+
+        self.algorithm_name = algorithm_name
+        self.options = options
+
+        # Result of the last generate()
+        self.comparisons = 0
+        self.policy = None  # winning (side, freeze) policy, or 'random'
+
+    def generate(self, size=None, min_val=None, seed=0):
+        """
+        Build an input that makes the target algorithm compare as much as it can
+
+        Every policy is played against the algorithm, a random permutation
+        is added as a further candidate, and the input whose replay takes
+        the most comparisons wins.
+
+        Args:
+            size: Number of elements (default from config)
+            min_val: Smallest value of the result (default from config)
+            seed: Random seed of the permutation candidate
+
+        Returns:
+            List of distinct integers from min_val to min_val + size - 1
+        """
+        size = ARRAY_CONFIG['SIZE_DEFAULT'] if size is None else size
+        min_val = ARRAY_CONFIG['VALUE_MIN'] if min_val is None else min_val
+
+        shuffled = list(range(min_val, min_val + size))
+        random.Random(seed).shuffle(shuffled)
+        candidates = [(policy, [min_val + value for value in self._play(size, *policy)])
+                      for policy in self.POLICIES]
+        candidates.append(('random', shuffled))
+
+        best = None
+        for policy, array in candidates:
+            replay = self._create(array)
+            replay.sort()
+            if best is None or replay.comparisons > self.comparisons:
+                best, self.comparisons, self.policy = array, replay.comparisons, policy
+
+        return best
+
+    def _create(self, array):
+        """Instantiate the target algorithm headless on an array"""
+        return ALGORITHMS[self.algorithm_name](array, headless=True, **self.options)
+
+    def _play(self, size, side, freeze):
+        """
+        Run the target on gas items under one policy
+
+        Returns:
+            List of the values decided for each position, 0 to size - 1
+        """
+        self.side = side
+        self.freeze_candidate = freeze == 'candidate'
+        self.gas = size if side == 'low' else -1
+        self.values = [self.gas] * size
+        self.next_value = 0 if side == 'low' else size - 1
+        self.candidate = None
+
+        self._create([_Item(self, index) for index in range(size)]).sort()
+
+        # Items never compared with each other can take any remaining values
+        for index in range(size):
+            if self.values[index] == self.gas:
+                self._freeze(index)
+
+        return self.values
+
+    def compare(self, x, y):
+        """
+        Decide a comparison between the items first placed at x and y
+
+        Returns:
+            Negative, zero or positive as item x is less than, equal to or
+            greater than item y
+        """
+        values = self.values
+
+        if values[x] == self.gas and values[y] == self.gas:
+            if (x == self.candidate) == self.freeze_candidate:
+                self._freeze(x)
+            else:
+                self._freeze(y)
+
+        if values[x] == self.gas:
+            self.candidate = x
+        elif values[y] == self.gas:
+            self.candidate = y
+
+        return values[x] - values[y]
+
+    def _freeze(self, index):
+        """Give a gas item the next value from its side of the range"""
+        self.values[index] = self.next_value
+        self.next_value += 1 if self.side == 'low' else -1
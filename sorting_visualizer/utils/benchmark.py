@@ -0,0 +1,428 @@
+"""
+Benchmark harness for the sorting algorithms
+
+Every cell of the algorithm x distribution x size matrix is timed with
+time.perf_counter_ns over repeated headless runs, after untimed warm-up
+runs, with the garbage collector disabled while the clock is running.
+Algorithms are built before the clock starts, so only sort() is measured.
+Results hold the raw samples and their min/median/p95/stddev, and are
+written as JSON for archiving and later comparison.
+
+Cells can also be spread over worker processes, one fresh process per cell,
+each optionally pinned to its own CPU and capped in memory. Results stream
+back as cells finish and are merged in matrix order.
+
+Run from the project directory:
+
+    python -m utils.benchmark --sizes 1000 4000 --output results.json
+    python -m utils.benchmark --workers 4 --memory-limit 2000000000
+"""
+
+import argparse
+import gc
+import json
+import math
+import multiprocessing
+import os
+import platform
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+from algorithms import ALGORITHMS
+from config.settings import ALGORITHM_COMPLEXITY, BENCHMARK_CONFIG
+from utils.vectorized_generator import VectorizedGenerator, DISTRIBUTIONS
+
+# Version of the results file layout
+RESULTS_VERSION = 1
+
+def time_trials(algorithm_class, array, trials=None, warmup=None, callback=None, **options):
+    """
+    Time repeated runs of an algorithm on one input
+
+    Args:
+        algorithm_class: Algorithm class to run
+        array: Input array, left unchanged
+        trials: Number of timed runs (default from config)
+        warmup: Number of untimed runs first (default from config)
+        callback: Step callback; None runs the algorithm headless
+        **options: Extra constructor arguments of the algorithm
+
+    Returns:
+        (times_ns, algorithm) tuple: the duration of each timed run in
+        nanoseconds, and the instance of the last run for its statistics
+    """
+    trials = BENCHMARK_CONFIG['TRIALS'] if trials is None else trials
+    warmup = BENCHMARK_CONFIG['WARMUP_RUNS'] if warmup is None else warmup
+
+    times_ns = []
+    algorithm = None
+    gc_was_enabled = gc.isenabled()
+
+    try:
+        for run in range(warmup + max(1, trials)):
+            algorithm = algorithm_class(array, callback, headless=callback is None, **options)
+
+            # Collect outside the timed region, then keep the collector out of it
+            gc.collect()
+            gc.disable()
+            start = time.perf_counter_ns()
+            algorithm.sort()
+            elapsed = time.perf_counter_ns() - start
+            if gc_was_enabled:
+                gc.enable()
+
+            if run >= warmup:
+                times_ns.append(elapsed)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    return times_ns, algorithm
+
+def summarize(times_ns):
+    """
+    Summary statistics of timing samples
+
+    Args:
+        times_ns: Durations in nanoseconds
+
+    Returns:
+        Dictionary with min, median, p95, mean and stddev, in nanoseconds
+    """
+    ordered = sorted(times_ns)
+
+    # Nearest-rank percentile, so p95 is always one of the samples
+    p95 = ordered[max(0, math.ceil(0.95 * len(ordered)) - 1)]
+
+    return {
+        'min_ns': ordered[0],
+        'median_ns': statistics.median(ordered),
+        'p95_ns': p95,
+        'mean_ns': statistics.fmean(ordered),
+        'stddev_ns': statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+    }
+
+def is_quadratic(algorithm_name):
+    """Whether an algorithm's average case is quadratic"""
+    return ALGORITHM_COMPLEXITY.get(algorithm_name, {}).get('time_average') == 'O(n²)'
+
+class Benchmark:
+    def __init__(self, algorithms=None, distributions=None, sizes=None,
+                 trials=None, warmup=None, seed=None, inputs=1):
+        """
+        Describe a benchmark matrix
+
+        Args:
+            algorithms: Algorithm names (default: all registered)
+            distributions: Distribution names from DISTRIBUTIONS (default: all)
+            sizes: Array sizes (default from config)
+            trials: Timed runs per cell (default from config)
+            warmup: Untimed runs per cell (default from config)
+            seed: Seed of the first generated input (default from config)
+            inputs: Number of inputs per distribution and size, seeded
+                seed, seed + 1, ...
+        """
+        self.algorithms = list(algorithms or ALGORITHMS)
+        self.distributions = list(distributions or DISTRIBUTIONS)
+        self.sizes = list(sizes or BENCHMARK_CONFIG['SIZES'])
+        self.trials = BENCHMARK_CONFIG['TRIALS'] if trials is None else trials
+        self.warmup = BENCHMARK_CONFIG['WARMUP_RUNS'] if warmup is None else warmup
+        self.seed = BENCHMARK_CONFIG['SEED'] if seed is None else seed
+        self.inputs = max(1, inputs)
+
+        for name in self.algorithms:
+            if name not in ALGORITHMS:
+                raise ValueError(f"Unknown algorithm: {name}")
+        for distribution in self.distributions:
+            if distribution not in DISTRIBUTIONS:
+                raise ValueError(f"Unknown distribution: {distribution}")
+
+    def cells(self):
+        """
+        List the (algorithm, distribution, size, seed) cells to run
+
+        Quadratic algorithms are left out above the configured size limit.
+        """
+        limit = BENCHMARK_CONFIG['QUADRATIC_SIZE_LIMIT']
+        return [
+            (name, distribution, size, seed)
+            for size in self.sizes
+            for distribution in self.distributions
+            for seed in range(self.seed, self.seed + self.inputs)
+            for name in self.algorithms
+            if not (is_quadratic(name) and size > limit)
+        ]
+
+    def run_cell(self, algorithm_name, distribution, size, seed):
+        """
+        Benchmark one cell of the matrix
+
+        Returns:
+            Result dictionary with the cell, operation counts, summary
+            statistics and raw samples
+        """
+        array = VectorizedGenerator(seed).generate(distribution, size).tolist()
+        times_ns, algorithm = time_trials(
+            ALGORITHMS[algorithm_name], array, self.trials, self.warmup
+        )
+
+        result = {
+            'algorithm': algorithm_name,
+            'distribution': distribution,
+            'size': size,
+            'seed': seed,
+            'trials': len(times_ns),
+            'warmup': self.warmup,
+            'comparisons': algorithm.comparisons,
+            'swaps': algorithm.swaps,
+        }
+        result.update(summarize(times_ns))
+        result['times_ns'] = times_ns
+        return result
+
+    def run(self, callback=None):
+        """
+        Run every cell of the matrix, one after another
+
+        Args:
+            callback: Optional function called with each cell result
+
+        Returns:
+            Results dictionary with 'metadata' and 'results'
+        """
+        results = []
+        for cell in self.cells():
+            result = self.run_cell(*cell)
+            results.append(result)
+            if callback:
+                callback(result)
+
+        return {'metadata': self.metadata(), 'results': results}
+
+    def run_parallel(self, workers=None, pin_cpus=None, memory_limit=None, callback=None):
+        """
+        Run the cells of the matrix in worker processes
+
+        Every cell runs in a fresh process of its own, a single-worker pool
+        that is shut down once the cell is done, so no cell inherits another's
+        heap or caches. Timings are only comparable with a serial run when
+        the cells do not compete for CPUs or memory bandwidth; keep workers
+        low (1 for the quietest runs) on a busy or small machine.
+
+        Args:
+            workers: Most cells running at once (default from config;
+                0 or None there means one per available CPU)
+            pin_cpus: Pin each running cell to a CPU of its own (default
+                from config); workers is then capped at the CPU count
+            memory_limit: Address space cap per worker in bytes (default
+                from config); a cell over it fails with a MemoryError
+            callback: Optional function called with each cell result as it
+                finishes, in completion order
+
+        Returns:
+            Results dictionary with 'metadata' and 'results', the results in
+            matrix order; failed cells hold an 'error' instead of timings
+        """
+        cpus = _allowed_cpus()
+        workers = BENCHMARK_CONFIG['MAX_WORKERS'] if workers is None else workers
+        workers = workers or len(cpus)
+        pin_cpus = BENCHMARK_CONFIG['PIN_CPUS'] if pin_cpus is None else pin_cpus
+        pin_cpus = pin_cpus and hasattr(os, 'sched_setaffinity')
+        memory_limit = BENCHMARK_CONFIG['MEMORY_LIMIT'] if memory_limit is None else memory_limit
+        if pin_cpus:
+            workers = min(workers, len(cpus))
+
+        queue = list(enumerate(self.cells()))
+        queue.reverse()
+        results = [None] * len(queue)
+        free_cpus = list(cpus) if pin_cpus else []
+        running = {}
+
+        try:
+            while queue or running:
+                while queue and len(running) < workers:
+                    index, cell = queue.pop()
+                    cpu = free_cpus.pop(0) if pin_cpus else None
+                    pool = _new_pool()
+                    future = pool.submit(_run_cell_in_worker, cell, self.trials,
+                                         self.warmup, cpu, memory_limit)
+                    running[future] = (index, cell, cpu, pool)
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, cell, cpu, pool = running.pop(future)
+                    pool.shutdown(wait=True)
+                    if cpu is not None:
+                        free_cpus.append(cpu)
+
+                    try:
+                        result = future.result()
+                    except BrokenProcessPool as e:
+                        # The cell's process died outright
+                        result = _failed_cell(cell, f"worker died: {e}")
+                    except Exception as e:
+                        result = _failed_cell(cell, f"{type(e).__name__}: {e}")
+
+                    results[index] = result
+                    if callback:
+                        callback(result)
+        finally:
+            for _, _, _, pool in running.values():
+                pool.shutdown(wait=True)
+
+        metadata = self.metadata()
+        metadata.update({'workers': workers, 'pin_cpus': pin_cpus, 'memory_limit': memory_limit})
+        return {'metadata': metadata, 'results': results}
+
+    def metadata(self):
+        """Describe the machine and settings the results come from"""
+        return {
+            'version': RESULTS_VERSION,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'processor': platform.processor(),
+            'cpu_count': os.cpu_count(),
+            'clock': 'perf_counter_ns',
+            'trials': self.trials,
+            'warmup': self.warmup,
+            'seed': self.seed,
+        }
+
+def _allowed_cpus():
+    """CPUs this process may run on"""
+    if hasattr(os, 'sched_getaffinity'):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+def _new_pool():
+    """Single-worker process pool in a fresh interpreter, used for one cell"""
+    # Spawned rather than forked, so the cell inherits nothing from this process
+    return ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn'))
+
+def _run_cell_in_worker(cell, trials, warmup, cpu, memory_limit):
+    """
+    Benchmark one cell inside a pool worker
+
+    Args:
+        cell: (algorithm, distribution, size, seed) tuple
+        trials: Timed runs
+        warmup: Untimed runs
+        cpu: CPU to pin this process to, or None
+        memory_limit: Address space cap in bytes, or None
+    """
+    if cpu is not None:
+        os.sched_setaffinity(0, {cpu})
+    algorithm_name, distribution, size, seed = cell
+    if memory_limit and resource is not None:
+        # Load the lazily imported generator modules first, so the cap only
+        # has to hold the cell's own data
+        VectorizedGenerator(seed).generate(distribution, 1)
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, hard))
+
+    benchmark = Benchmark([algorithm_name], [distribution], [size], trials, warmup, seed)
+    try:
+        result = benchmark.run_cell(*cell)
+    except MemoryError:
+        return _failed_cell(cell, f"MemoryError: over the memory limit of {memory_limit} bytes")
+
+    result['cpu'] = cpu
+    return result
+
+def _failed_cell(cell, error):
+    """Result of a cell that could not be measured"""
+    algorithm_name, distribution, size, seed = cell
+    return {
+        'algorithm': algorithm_name,
+        'distribution': distribution,
+        'size': size,
+        'seed': seed,
+        'error': error,
+    }
+
+def save_results(results, filename):
+    """Write benchmark results to a JSON file"""
+    with open(filename, 'w') as f:
+        json.dump(results, f, indent=2)
+
+def load_results(filename):
+    """
+    Read benchmark results from a JSON file
+
+    Raises:
+        ValueError: If the file is missing or is not a results file
+    """
+    try:
+        with open(filename) as f:
+            results = json.load(f)
+    except (OSError, ValueError) as e:
+        raise ValueError(f"Could not load benchmark results: {e}")
+
+    if not isinstance(results, dict) or 'results' not in results:
+        raise ValueError(f"Could not load benchmark results: {filename} has no results")
+    return results
+
+def format_result(result):
+    """One line summary of a cell result"""
+    cell = f"{result['algorithm']:<20} {result['distribution']:<18} {result['size']:>8} "
+    if 'error' in result:
+        return cell + f"failed: {result['error']}"
+    return (
+        cell +
+        f"median {result['median_ns'] / 1e6:10.3f} ms  p95 {result['p95_ns'] / 1e6:10.3f} ms  "
+        f"comparisons {result['comparisons']}"
+    )
+
+def build_parser():
+    """Command line options shared by the benchmark commands"""
+    parser = argparse.ArgumentParser(description='Benchmark the sorting algorithms')
+    parser.add_argument('--algorithms', nargs='+', choices=list(ALGORITHMS),
+                        help='algorithms to run (default: all)')
+    parser.add_argument('--distributions', nargs='+', choices=list(DISTRIBUTIONS),
+                        help='input distributions (default: all)')
+    parser.add_argument('--sizes', nargs='+', type=int, help='array sizes')
+    parser.add_argument('--trials', type=int, help='timed runs per cell')
+    parser.add_argument('--warmup', type=int, help='untimed runs per cell')
+    parser.add_argument('--seed', type=int, help='seed of the first generated input')
+    parser.add_argument('--inputs', type=int, default=1,
+                        help='inputs per distribution and size, seeded from --seed up')
+    parser.add_argument('--workers', type=int,
+                        help='run cells in a process pool with this many at once (0: one per CPU)')
+    parser.add_argument('--no-pin', action='store_true',
+                        help='do not pin pool workers to their own CPUs')
+    parser.add_argument('--memory-limit', type=int, help='address space cap per pool worker, in bytes')
+    parser.add_argument('--output', help='JSON file to write the results to')
+    return parser
+
+def main(argv=None):
+    """Command line entry point"""
+    args = build_parser().parse_args(argv)
+    benchmark = Benchmark(args.algorithms, args.distributions, args.sizes,
+                          args.trials, args.warmup, args.seed, args.inputs)
+    report = lambda result: print(format_result(result), flush=True)
+
+    if args.workers is None and args.memory_limit is None:
+        results = benchmark.run(callback=report)
+    else:
+        results = benchmark.run_parallel(args.workers, False if args.no_pin else None,
+                                         args.memory_limit, callback=report)
+    if args.output:
+        save_results(results, args.output)
+        print(f"Wrote {len(results['results'])} results to {args.output}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -59,7 +59,8 @@ class ColorManager:
             'swapping': self.get_color('bar_swapping'),
             'sorted': self.get_color('bar_sorted'),
             'pivot': self.get_color('bar_pivot'),
-            'current': self.get_color('bar_current')
+            'current': self.get_color('bar_current'),
+            'reading': self.get_color('bar_reading')
         }
 
         return color_map.get(state, self.get_color('bar_default'))
@@ -2,8 +2,21 @@
 Performance analysis and complexity calculation utilities
 """
 
-import time
+import numpy as np
+
 from config.settings import ALGORITHM_COMPLEXITY
+from utils.benchmark import time_trials, summarize
+
+# Candidate growth models for fitting, from slowest to fastest growing
+COMPLEXITY_MODELS = {
+    'O(n)': lambda n: n,
+    'O(n log n)': lambda n: n * np.log2(n),
+    'O(n^1.5)': lambda n: n ** 1.5,
+    'O(n²)': lambda n: n ** 2,
+}
+
+# Largest constant a single measurement may have and still be put in a class
+SINGLE_POINT_MAX_CONSTANT = 4
 
 class ComplexityAnalyzer:
     def __init__(self):
@@ -97,6 +110,11 @@ class ComplexityAnalyzer:
         """
         Estimate the complexity class based on actual operations
 
+        One measurement cannot tell growth rates apart, so this only picks
+        the slowest growing class whose constant stays small. Use
+        fit_complexity with measurements over several sizes instead
+        whenever they are available.
+
         Args:
             array_size: Size of the input array
             operations: Number of operations performed
@@ -108,49 +126,142 @@ class ComplexityAnalyzer:
         if n <= 1:
             return "O(1)"
 
-        # Calculate ratios for different complexity classes
-        linear_ratio = operations / n
-        nlogn_ratio = operations / (n * (n.bit_length() - 1)) if n > 1 else float('inf')
-        quadratic_ratio = operations / (n * n)
+        for model in ['O(n)', 'O(n log n)', 'O(n²)']:
+            if operations <= SINGLE_POINT_MAX_CONSTANT * COMPLEXITY_MODELS[model](n):
+                return model
+
+        return "O(n²) or higher"
+
+    def fit_complexity(self, sizes, measurements, models=None):
+        """
+        Fit measurements over a size ladder to growth models
+
+        The measurements are regressed in log-log space, whose slope is the
+        empirical exponent, and fitted by least squares to c * f(n) for
+        every candidate model. Errors are taken relative to each
+        measurement, so small sizes count as much as large ones. The best
+        model has the smallest relative error.
+
+        Args:
+            sizes: Array sizes
+            measurements: Time or operation count measured at each size;
+                sizes without a positive measurement are left out
+            models: Names of COMPLEXITY_MODELS to try (default: all)
+
+        Returns:
+            Dictionary with the best 'model', its 'constant' and
+            'r_squared', the log-log 'exponent' and its 'exponent_r_squared',
+            and per-model 'fits' of constant, r_squared and relative_error
+
+        Raises:
+            ValueError: If fewer than two distinct sizes have measurements
+        """
+        points = [(n, y) for n, y in zip(sizes, measurements) if n > 1 and y > 0]
+        if len({n for n, _ in points}) < 2:
+            raise ValueError("Fitting needs positive measurements at two or more sizes")
 
-        # Determine which complexity class fits best
-        if quadratic_ratio <= 2:
-            return "O(n²)"
-        elif nlogn_ratio <= 10:
-            return "O(n log n)"
-        elif linear_ratio <= 5:
-            return "O(n)"
-        else:
-            return "O(n²) or higher"
+        n = np.array([p[0] for p in points], dtype=np.float64)
+        y = np.array([p[1] for p in points], dtype=np.float64)
 
-    def benchmark_algorithm(self, algorithm_class, test_arrays, callback_func=None):
+        # Log-log regression: log y = exponent * log n + intercept
+        slope, intercept = np.polyfit(np.log(n), np.log(y), 1)
+        log_prediction = slope * np.log(n) + intercept
+
+        fits = {}
+        for name in models or COMPLEXITY_MODELS:
+            # Weighted least squares for y = c * f(n), minimizing sum(((y - c f) / y)^2)
+            f = COMPLEXITY_MODELS[name](n) / y
+            constant = float(np.dot(f, np.ones_like(f)) / np.dot(f, f))
+            prediction = constant * COMPLEXITY_MODELS[name](n)
+
+            fits[name] = {
+                'constant': constant,
+                'r_squared': _r_squared(y, prediction),
+                'relative_error': float(np.sqrt(np.mean(((y - prediction) / y) ** 2))),
+            }
+
+        best = min(fits, key=lambda name: fits[name]['relative_error'])
+        return {
+            'model': best,
+            'constant': fits[best]['constant'],
+            'r_squared': fits[best]['r_squared'],
+            'exponent': float(slope),
+            'exponent_r_squared': _r_squared(np.log(y), log_prediction),
+            'fits': fits,
+        }
+
+    def predict(self, fit, size, model=None):
+        """
+        Predict the measurement at a size from a fit
+
+        Args:
+            fit: Result of fit_complexity
+            size: Array size to predict for
+            model: Model to predict with (default: the best fitted model)
+
+        Returns:
+            Predicted measurement, in the units that were fitted
+        """
+        model = model or fit['model']
+        return fit['fits'][model]['constant'] * float(COMPLEXITY_MODELS[model](size))
+
+    def fit_benchmark(self, results, algorithm_name, distribution='random', metric='median_ns'):
+        """
+        Fit one algorithm's cells of a benchmark run over their sizes
+
+        Args:
+            results: Results dictionary from utils.benchmark
+            algorithm_name: Algorithm to fit
+            distribution: Input distribution to fit
+            metric: Cell value to fit, such as 'median_ns' or 'comparisons';
+                cells with several seeds are averaged per size
+
+        Returns:
+            Result of fit_complexity
+        """
+        by_size = {}
+        for result in results['results']:
+            if (result['algorithm'] == algorithm_name and result['distribution'] == distribution
+                    and 'error' not in result):
+                by_size.setdefault(result['size'], []).append(result[metric])
+
+        sizes = sorted(by_size)
+        return self.fit_complexity(sizes, [sum(by_size[n]) / len(by_size[n]) for n in sizes])
+
+    def benchmark_algorithm(self, algorithm_class, test_arrays, callback_func=None,
+                            trials=None, warmup=None):
         """
         Benchmark an algorithm on multiple test cases
 
+        Timing is done by utils.benchmark: warm-up runs, then repeated
+        trials measured with perf_counter_ns and the GC disabled.
+
         Args:
             algorithm_class: Algorithm class to benchmark
             test_arrays: List of arrays to test on
-            callback_func: Optional callback for visualization
+            callback_func: Optional callback for visualization; without
+                one the algorithm runs in headless mode
+            trials: Timed runs per array (default from config)
+            warmup: Untimed runs per array (default from config)
 
         Returns:
-            List of benchmark results
+            List of benchmark results; time_elapsed is the median run in
+            seconds and timing holds the full summary in nanoseconds.
+            When the arrays span several sizes, estimated_complexity comes
+            from a fit of comparisons plus swaps over all of them
         """
         results = []
 
         for i, test_array in enumerate(test_arrays):
-            # Use dummy callback if none provided
-            dummy_callback = callback_func or (lambda op, idx, arr: None)
-
-            # Create algorithm instance
-            algorithm = algorithm_class(test_array, dummy_callback)
-
-            # Run the algorithm
-            start_time = time.time()
-            algorithm.sort()
-            end_time = time.time()
+            times_ns, algorithm = time_trials(
+                algorithm_class, test_array, trials, warmup, callback_func
+            )
+            timing = summarize(times_ns)
 
             # Analyze results
             analysis = self.analyze_performance(algorithm)
+            analysis['time_elapsed'] = timing['median_ns'] / 1e9
+            analysis['timing'] = timing
             analysis['test_case'] = i
             analysis['estimated_complexity'] = self.estimate_complexity_class(
                 len(test_array), 
@@ -159,4 +270,22 @@ class ComplexityAnalyzer:
 
             results.append(analysis)
 
+        # Prefer a fit over all sizes to the single-point estimates
+        try:
+            fit = self.fit_complexity(
+                [r['array_size'] for r in results],
+                [r['comparisons'] + r['swaps'] for r in results]
+            )
+        except ValueError:
+            return results
+
+        for analysis in results:
+            analysis['estimated_complexity'] = fit['model']
         return results
+
+def _r_squared(actual, predicted):
+    """Coefficient of determination of predictions"""
+    total = np.sum((actual - np.mean(actual)) ** 2)
+    if total == 0:
+        return 1.0
+    return float(1 - np.sum((actual - predicted) ** 2) / total)
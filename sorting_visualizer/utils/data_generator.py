@@ -2,9 +2,27 @@
 Data generation utilities for creating test arrays
 """
 
+import os
 import random
+import warnings
+
+import numpy as np
+
 from config.settings import ARRAY_CONFIG
 
+# Bytes read and parsed at a time when loading number files
+LOAD_CHUNK_BYTES = 1 << 20
+
+# Binary file formats by extension: NumPy .npy files, or raw little-endian
+# values of one dtype; any other extension is read as text
+BINARY_FORMATS = {
+    '.npy': 'npy',
+    '.i32': '<i4',
+    '.int32': '<i4',
+    '.f64': '<f8',
+    '.float64': '<f8',
+}
+
 class DataGenerator:
     def __init__(self):
         """Initialize the data generator"""
@@ -118,27 +136,193 @@ class DataGenerator:
 
         return array
 
-    def load_from_file(self, filename):
+    def load_from_file(self, filename, as_array=False, chunk_bytes=LOAD_CHUNK_BYTES):
         """
         Load array data from a file
 
+        Binary files (see BINARY_FORMATS) are memory-mapped, so with
+        as_array the data is only paged in as it is used.
+
         Args:
-            filename: Path to file containing numbers (one per line or comma-separated)
+            filename: Path to file containing numbers (one per line or
+                comma-separated), a .npy file, or raw .i32 / .f64 values
+            as_array: Return a NumPy array instead of a list (int64 for
+                text files, read-only memory map for binary files)
+            chunk_bytes: Bytes read and parsed at a time from text files
 
         Returns:
-            List of numbers from file
+            List (or NumPy array) of numbers from file
+        """
+        file_format = _binary_format(filename)
+        if file_format is not None:
+            numbers = _map_binary_file(filename, file_format)
+            return numbers if as_array else numbers.tolist()
+
+        blocks = [values for values, _ in self.iter_file_chunks(filename, chunk_bytes)]
+        numbers = np.concatenate(blocks) if blocks else np.zeros(0, dtype=np.int64)
+
+        return numbers if as_array else numbers.tolist()
+
+    def iter_file_chunks(self, filename, chunk_bytes=LOAD_CHUNK_BYTES):
+        """
+        Stream a number file in fixed-size chunks
+
+        The delimiter is detected from the first chunk: a comma if it has
+        one, otherwise whitespace. Each chunk is parsed in bulk by NumPy,
+        and only a chunk with a bad token is rescanned to locate it.
+        Values are limited to the int64 range.
+
+        Args:
+            filename: Path to file containing numbers (one per line or comma-separated)
+            chunk_bytes: Bytes read and parsed at a time
+
+        Yields:
+            (values, bytes_read) tuples, values being a NumPy int64 array
+
+        Raises:
+            ValueError: If the file is missing or holds something other than integers
         """
         try:
-            with open(filename, 'r') as f:
-                content = f.read().strip()
-
-                # Try comma-separated first
-                if ',' in content:
-                    numbers = [int(x.strip()) for x in content.split(',')]
-                else:
-                    # Try line-separated
-                    numbers = [int(line.strip()) for line in content.split('\n') if line.strip()]
-
-                return numbers
-        except (FileNotFoundError, ValueError) as e:
+            f = open(filename, 'rb')
+        except OSError as e:
             raise ValueError(f"Could not load data from file: {e}")
+
+        with f:
+            data = f.read(chunk_bytes)
+            delimiter = b',' if b',' in data else None
+            carry = b''
+            line = 1  # Line number the next parsed chunk starts on
+            bytes_read = 0
+
+            while data:
+                bytes_read += len(data)
+
+                # The last token may continue in the next chunk
+                data = carry + data
+                cut = max(data.rfind(b','), data.rfind(b'\n'), data.rfind(b' '))
+                data, carry = data[:cut + 1], data[cut + 1:]
+
+                yield _parse_chunk(data, delimiter, line, filename), bytes_read
+                line += data.count(b'\n')
+                data = f.read(chunk_bytes)
+
+            if carry.strip():
+                yield _parse_chunk(carry, delimiter, line, filename), bytes_read
+
+    def save_to_file(self, array, filename):
+        """
+        Save array data to a file, in the format given by its extension
+
+        Args:
+            array: List or NumPy array of numbers
+            filename: .npy, raw .i32 / .f64, or any other name for a text
+                file with one number per line
+
+        Raises:
+            ValueError: If the values do not fit the file format
+        """
+        file_format = _binary_format(filename)
+        values = np.asarray(array)
+
+        if file_format is None:
+            with open(filename, 'w') as f:
+                for start in range(0, len(values), LOAD_CHUNK_BYTES // 8):
+                    block = values[start:start + LOAD_CHUNK_BYTES // 8].tolist()
+                    f.write('\n'.join(map(str, block)) + '\n')
+            return
+
+        if file_format == 'npy':
+            np.save(filename, values)
+            return
+
+        converted = values.astype(file_format)
+        if len(values) and not np.array_equal(converted, values):
+            raise ValueError(f"Values do not fit the {np.dtype(file_format).name} format of {filename}")
+
+        # Write through a memory map, so huge arrays are copied page by page
+        if len(values):
+            target = np.memmap(filename, dtype=file_format, mode='w+', shape=(len(values),))
+            target[:] = converted
+            target.flush()
+            del target
+        else:
+            open(filename, 'wb').close()
+
+def _binary_format(filename):
+    """Binary format for a file name, or None for text files"""
+    extension = filename[filename.rfind('.'):].lower() if '.' in filename else ''
+    return BINARY_FORMATS.get(extension)
+
+def _map_binary_file(filename, file_format):
+    """
+    Open a binary number file as a read-only memory map
+
+    Raises:
+        ValueError: If the file is missing or does not hold whole values
+    """
+    try:
+        if file_format == 'npy':
+            values = np.load(filename, mmap_mode='r', allow_pickle=False)
+            if values.ndim != 1:
+                raise ValueError(f"expected a 1-D array, found shape {values.shape}")
+            return values
+
+        size = os.path.getsize(filename)
+        itemsize = np.dtype(file_format).itemsize
+        if size % itemsize:
+            raise ValueError(f"{size} bytes is not a whole number of {itemsize}-byte values")
+        if not size:
+            return np.zeros(0, dtype=file_format)
+        return np.memmap(filename, dtype=file_format, mode='r')
+    except (OSError, ValueError) as e:
+        raise ValueError(f"Could not load data from file: {e}")
+
+def _parse_chunk(data, delimiter, line, filename):
+    """
+    Parse one chunk of numbers into an int64 array
+
+    Args:
+        data: Bytes holding whole tokens only
+        delimiter: b',' for comma-separated data, None for whitespace
+        line: Line number the chunk starts on, for error messages
+        filename: File name, for error messages
+    """
+    # NumPy's C parser reads blank trailing fields as zeros, so drop them
+    body = data.strip(b' \t\r\n,' if delimiter else b' \t\r\n')
+    if not body:
+        return np.zeros(0, dtype=np.int64)
+
+    # Fast path: trusted only when it reads the whole chunk, finds one value
+    # per field and no value sits at the int64 limits (it saturates there)
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', DeprecationWarning)
+        try:
+            values = np.fromstring(body, dtype=np.int64, sep=',' if delimiter else ' ')
+        except (ValueError, DeprecationWarning):
+            values = None
+
+    limits = np.iinfo(np.int64)
+    if (values is not None and
+            (delimiter is None or len(values) == body.count(delimiter) + 1) and
+            not ((values == limits.max) | (values == limits.min)).any()):
+        return values
+
+    # Slower path for irregular separators such as bare newlines in comma files
+    if delimiter is not None:
+        data = data.replace(delimiter, b' ')
+    try:
+        return np.array(data.split(), dtype=np.int64)
+    except (ValueError, OverflowError):
+        pass
+
+    # Rescan the chunk line by line to report the first bad token
+    for offset, text in enumerate(data.split(b'\n')):
+        for token in text.split():
+            try:
+                np.int64(int(token))
+            except (ValueError, OverflowError):
+                raise ValueError(
+                    f"Could not load data from file: {filename}, line {line + offset}: "
+                    f"invalid number {token.decode(errors='replace')!r}"
+                )
+    raise ValueError(f"Could not load data from file: {filename}")
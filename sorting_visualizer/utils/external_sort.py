@@ -0,0 +1,189 @@
+"""
+External merge sort for number files larger than memory
+
+The input is streamed through the DataGenerator chunked loader in chunks that
+fit the memory budget. Each chunk is sorted with one of the registered
+algorithms (run headless) and spilled to a temporary file as a sorted run of
+int64 values. The runs are then k-way merged through a heap into the output
+file, one number per line.
+"""
+
+import heapq
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from algorithms import get_algorithm_by_name
+from utils.data_generator import DataGenerator
+
+VALUE_DTYPE = np.dtype('<i8')
+
+# Bytes of memory per value while a chunk is parsed and sorted: the chunk,
+# the engine's working copy and its output buffers
+BYTES_PER_VALUE = 4 * VALUE_DTYPE.itemsize
+
+# Default most runs merged at once; more runs take several passes
+MAX_FAN_IN = 64
+
+class ExternalSorter:
+    def __init__(self, memory_budget=256 * 1024 * 1024, engine='radix_sort',
+                 temp_dir=None, callback=None, fan_in=MAX_FAN_IN):
+        """
+        Set up an external sort
+
+        Args:
+            memory_budget: Approximate memory to use, in bytes
+            engine: Registered algorithm used to sort each in-memory chunk
+            temp_dir: Directory for sorted runs (default: system temp dir)
+            callback: Progress function called as (stage, [done, total], None),
+                in the style of an algorithm step callback; stage is 'split'
+                (bytes read) or 'merge' (values written)
+            fan_in: Most runs merged at once
+        """
+        self.chunk_values = max(1024, memory_budget // BYTES_PER_VALUE)
+        self.read_bytes = max(4096, memory_budget // 16)
+        self.engine = engine
+        self.temp_dir = temp_dir
+        self.callback = callback
+        self.fan_in = max(2, fan_in)
+
+        # Statistics of the last sort
+        self.value_count = 0
+        self.run_count = 0
+        self.merge_passes = 0
+
+    def sort_file(self, input_filename, output_filename):
+        """
+        Sort the numbers in one file into another
+
+        Args:
+            input_filename: Text file of integers, comma or line separated
+            output_filename: File to write the sorted numbers to, one per line
+
+        Returns:
+            Number of values sorted
+        """
+        work_dir = tempfile.mkdtemp(prefix='external_sort_', dir=self.temp_dir)
+        try:
+            runs = self._write_runs(input_filename, work_dir)
+            self.run_count = len(runs)
+            self.merge_passes = 0
+
+            # Merge in passes until the remaining runs fit one fan-in
+            while len(runs) > self.fan_in:
+                merged = []
+                for start in range(0, len(runs), self.fan_in):
+                    group = runs[start:start + self.fan_in]
+                    target = os.path.join(work_dir, f'pass{self.merge_passes}_{start}.run')
+                    with open(target, 'wb') as out:
+                        self._merge_runs(group, lambda block: block.tofile(out), report=False)
+                    for run in group:
+                        os.remove(run)
+                    merged.append(target)
+                runs = merged
+                self.merge_passes += 1
+
+            with open(output_filename, 'w') as out:
+                self._merge_runs(runs, lambda block: out.write(_format_block(block)), report=True)
+            self.merge_passes += 1
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+        return self.value_count
+
+    def _write_runs(self, input_filename, work_dir):
+        """
+        Split the input into sorted run files
+
+        Returns:
+            List of run file paths, in input order
+        """
+        runs = []
+        self.value_count = 0
+        total_bytes = os.path.getsize(input_filename)
+
+        for chunk, bytes_read in self._read_chunks(input_filename):
+            sorter = get_algorithm_by_name(self.engine, chunk, headless=True)
+            sorter.sort()
+
+            run = os.path.join(work_dir, f'run{len(runs)}.run')
+            np.asarray(sorter.array, dtype=VALUE_DTYPE).tofile(run)
+            runs.append(run)
+            self.value_count += len(chunk)
+
+            if self.callback:
+                self.callback('split', [bytes_read, total_bytes], None)
+
+        return runs
+
+    def _read_chunks(self, filename):
+        """
+        Stream the file as arrays of at most chunk_values integers
+
+        Yields:
+            (values, bytes_read) tuples
+        """
+        pending = []
+        pending_count = 0
+        bytes_read = 0
+
+        for values, bytes_read in DataGenerator().iter_file_chunks(filename, self.read_bytes):
+            pending.append(values)
+            pending_count += len(values)
+
+            while pending_count >= self.chunk_values:
+                block = np.concatenate(pending)
+                yield block[:self.chunk_values], bytes_read
+                pending = [block[self.chunk_values:]]
+                pending_count = len(pending[0])
+
+        if pending_count:
+            yield np.concatenate(pending), bytes_read
+
+    def _merge_runs(self, runs, write_block, report):
+        """
+        K-way merge sorted run files through a heap
+
+        Args:
+            runs: Run file paths
+            write_block: Function called with each merged block of values
+            report: Send 'merge' progress to the callback
+        """
+        block_values = max(1024, self.chunk_values // (len(runs) + 1))
+        files = [open(run, 'rb') for run in runs]
+        try:
+            streams = [_iter_run(f, block_values) for f in files]
+            output = []
+            written = 0
+
+            for value in heapq.merge(*streams):
+                output.append(value)
+                if len(output) >= block_values:
+                    write_block(np.array(output, dtype=VALUE_DTYPE))
+                    written += len(output)
+                    output = []
+                    if report and self.callback:
+                        self.callback('merge', [written, self.value_count], None)
+
+            if output:
+                write_block(np.array(output, dtype=VALUE_DTYPE))
+                written += len(output)
+            if report and self.callback:
+                self.callback('merge', [written, self.value_count], None)
+        finally:
+            for f in files:
+                f.close()
+
+def _iter_run(f, block_values):
+    """Yield the values of a run file, reading one block at a time"""
+    while True:
+        block = np.fromfile(f, dtype=VALUE_DTYPE, count=block_values)
+        if not len(block):
+            return
+        yield from block.tolist()
+
+def _format_block(block):
+    """Format values as text, one per line"""
+    return '\n'.join(map(str, block.tolist())) + '\n'
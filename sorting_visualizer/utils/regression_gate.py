@@ -0,0 +1,243 @@
+"""
+Benchmark regression gate against a stored baseline
+
+A fixed benchmark suite is run and every cell is compared with the same
+cell of a baseline results file (as written by utils.benchmark):
+
+- Comparison and swap counts are deterministic for a seeded input, so any
+  increase is a regression.
+- Timings are compared with a one-sided Mann-Whitney U test on the raw
+  samples (normal approximation with tie correction). A cell regresses
+  when the current samples are significantly slower and the median slowed
+  down by at least the configured fraction. With only a handful of
+  baseline samples no slowdown can reach significance, so the gate
+  refuses to check timings against a baseline with too few.
+
+Timings are only comparable on the machine the baseline was recorded on,
+so refresh the baseline with --update when the machine changes.
+
+Run from the project directory:
+
+    python -m utils.regression_gate --baseline baseline.json
+    python -m utils.regression_gate --baseline baseline.json --update
+"""
+
+import argparse
+import math
+import sys
+
+from algorithms import ALGORITHMS
+from config.settings import REGRESSION_CONFIG
+from utils.benchmark import Benchmark, format_result, load_results, save_results
+
+def mann_whitney_u(baseline, current):
+    """
+    One-sided Mann-Whitney U test that current tends to exceed baseline
+
+    Args:
+        baseline: Samples of the baseline
+        current: Samples to test
+
+    Returns:
+        (u, p_value) tuple: U counts the (baseline, current) pairs where the
+        current sample is larger, ties counting a half
+    """
+    n1, n2 = len(baseline), len(current)
+    if not n1 or not n2:
+        return 0.0, 1.0
+
+    # Rank the pooled samples, giving tied values their average rank
+    pooled = sorted([(value, 0) for value in baseline] + [(value, 1) for value in current])
+    n = n1 + n2
+    current_rank_sum = 0.0
+    tie_term = 0
+
+    start = 0
+    while start < n:
+        stop = start
+        while stop + 1 < n and pooled[stop + 1][0] == pooled[start][0]:
+            stop += 1
+
+        ties = stop - start + 1
+        rank = (start + stop) / 2 + 1
+        current_rank_sum += rank * sum(group for _, group in pooled[start:stop + 1])
+        tie_term += ties ** 3 - ties
+        start = stop + 1
+
+    u = current_rank_sum - n2 * (n2 + 1) / 2
+    mean = n1 * n2 / 2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1))) if n > 1 else 0
+
+    if variance <= 0:
+        return u, 1.0
+
+    # Continuity correction towards the mean
+    z = (u - mean - 0.5) / math.sqrt(variance)
+    return u, 0.5 * math.erfc(z / math.sqrt(2))
+
+def cell_key(result):
+    """(algorithm, distribution, size, seed) identifying a result's cell"""
+    return result['algorithm'], result['distribution'], result['size'], result['seed']
+
+class RegressionGate:
+    def __init__(self, baseline, alpha=None, min_slowdown=None, check_timing=True, min_samples=None):
+        """
+        Set up a gate against a baseline
+
+        Args:
+            baseline: Results dictionary, as returned by Benchmark.run
+            alpha: Significance level of the timing test (default from config)
+            min_slowdown: Smallest median slowdown, as a fraction, that can
+                fail a cell (default from config)
+            check_timing: Compare timings as well as operation counts
+            min_samples: Fewest timing samples a baseline cell needs when
+                timings are checked (default from config)
+
+        Raises:
+            ValueError: If timings are checked and a baseline cell has too
+                few samples to test them
+        """
+        self.baseline = {cell_key(result): result for result in baseline['results']}
+        self.alpha = REGRESSION_CONFIG['ALPHA'] if alpha is None else alpha
+        self.min_slowdown = REGRESSION_CONFIG['MIN_SLOWDOWN'] if min_slowdown is None else min_slowdown
+        self.check_timing = check_timing
+        self.min_samples = REGRESSION_CONFIG['MIN_BASELINE_SAMPLES'] if min_samples is None else min_samples
+
+        if check_timing:
+            for key, result in self.baseline.items():
+                if 'error' in result:
+                    continue
+                samples = len(result['times_ns'])
+                if samples < self.min_samples:
+                    raise ValueError(
+                        f"Baseline cell {key} has {samples} timing sample(s), at least "
+                        f"{self.min_samples} are needed to test timings; record it again "
+                        f"with more trials or compare counts only"
+                    )
+
+    def compare(self, results):
+        """
+        Compare current results with the baseline
+
+        Args:
+            results: Results dictionary of the current run
+
+        Returns:
+            List of finding dictionaries with the cell, a 'kind' ('time',
+            'comparisons', 'swaps' or 'error'), a 'regression' flag and a
+            message; cells without a baseline are skipped
+        """
+        findings = []
+
+        for result in results['results']:
+            key = cell_key(result)
+            baseline = self.baseline.get(key)
+            if baseline is None or 'error' in baseline:
+                continue
+
+            if 'error' in result:
+                findings.append(self._finding(key, 'error', True, result['error']))
+                continue
+
+            for counter in ['comparisons', 'swaps']:
+                before, after = baseline[counter], result[counter]
+                if after != before:
+                    findings.append(self._finding(
+                        key, counter, after > before, f"{counter} {before} -> {after}"
+                    ))
+
+            if self.check_timing:
+                finding = self._compare_timing(key, baseline, result)
+                if finding:
+                    findings.append(finding)
+
+        return findings
+
+    def _compare_timing(self, key, baseline, result):
+        """Timing finding for one cell, or None when it did not slow down"""
+        _, p_value = mann_whitney_u(baseline['times_ns'], result['times_ns'])
+        slowdown = result['median_ns'] / baseline['median_ns'] - 1 if baseline['median_ns'] else 0.0
+
+        if p_value >= self.alpha or slowdown < self.min_slowdown:
+            return None
+
+        message = (f"median {baseline['median_ns'] / 1e6:.3f} ms -> {result['median_ns'] / 1e6:.3f} ms "
+                   f"(+{slowdown:.1%}, p={p_value:.2g})")
+        finding = self._finding(key, 'time', True, message)
+        finding['p_value'] = p_value
+        finding['slowdown'] = slowdown
+        return finding
+
+    def _finding(self, key, kind, regression, message):
+        """Build a finding dictionary"""
+        algorithm_name, distribution, size, seed = key
+        return {
+            'algorithm': algorithm_name,
+            'distribution': distribution,
+            'size': size,
+            'seed': seed,
+            'kind': kind,
+            'regression': regression,
+            'message': message,
+        }
+
+def regression_suite(trials=None):
+    """
+    The fixed benchmark suite the gate runs
+
+    Args:
+        trials: Timed runs per cell (default from config)
+    """
+    return Benchmark(
+        list(ALGORITHMS),
+        REGRESSION_CONFIG['DISTRIBUTIONS'],
+        REGRESSION_CONFIG['SIZES'],
+        REGRESSION_CONFIG['TRIALS'] if trials is None else trials,
+        REGRESSION_CONFIG['WARMUP_RUNS'],
+        REGRESSION_CONFIG['SEED'],
+    )
+
+def format_finding(finding):
+    """One line description of a finding"""
+    label = 'REGRESSION' if finding['regression'] else 'changed'
+    return (f"{label:<10} {finding['algorithm']:<20} {finding['distribution']:<12} "
+            f"{finding['size']:>6}  {finding['kind']}: {finding['message']}")
+
+def main(argv=None):
+    """
+    Command line entry point
+
+    Returns:
+        0 when no cell regressed, 1 otherwise
+    """
+    parser = argparse.ArgumentParser(description='Check the sorting algorithms against a benchmark baseline')
+    parser.add_argument('--baseline', required=True, help='baseline results JSON file')
+    parser.add_argument('--update', action='store_true', help='run the suite and overwrite the baseline')
+    parser.add_argument('--counts-only', action='store_true',
+                        help='compare comparison and swap counts only, not timings')
+    parser.add_argument('--trials', type=int, help='timed runs per cell')
+    parser.add_argument('--alpha', type=float, help='significance level of the timing test')
+    parser.add_argument('--min-slowdown', type=float, help='smallest median slowdown that can fail a cell')
+    parser.add_argument('--verbose', action='store_true', help='print every cell result')
+    args = parser.parse_args(argv)
+
+    report = (lambda result: print(format_result(result), flush=True)) if args.verbose else None
+    results = regression_suite(args.trials).run(callback=report)
+
+    if args.update:
+        save_results(results, args.baseline)
+        print(f"Wrote baseline of {len(results['results'])} cells to {args.baseline}")
+        return 0
+
+    gate = RegressionGate(load_results(args.baseline), args.alpha, args.min_slowdown,
+                          check_timing=not args.counts_only)
+    findings = gate.compare(results)
+    for finding in findings:
+        print(format_finding(finding))
+
+    regressions = [finding for finding in findings if finding['regression']]
+    print(f"{len(regressions)} regression(s) in {len(results['results'])} cells")
+    return 1 if regressions else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,278 @@
+"""
+Binary trace recording and memory-mapped replay of sorting runs
+
+A trace file holds a fixed header, the initial array as little-endian
+int64 values and then one fixed-width record per step. Records are read
+back through numpy.memmap, so replaying never re-runs the algorithm and
+never loads the whole trace into memory.
+"""
+
+import os
+from array import array
+
+import numpy as np
+
+from algorithms import get_algorithm_by_name
+from algorithms.step_events import WRITE_OPERATIONS
+
+TRACE_MAGIC = b'SVTRACE1'
+TRACE_VERSION = 1
+
+# Operation codes stored in each record; append only, never reorder
+TRACE_OPERATIONS = ('compare', 'swap', 'sorted', 'pivot', 'merge', 'insert', 'shift', 'read')
+OPERATION_CODES = {name: code for code, name in enumerate(TRACE_OPERATIONS)}
+
+# Record count value meaning "every index from i to j inclusive"
+INDEX_RANGE = 0xFF
+
+HEADER_DTYPE = np.dtype([
+    ('magic', 'S8'),
+    ('version', '<u4'),
+    ('array_size', '<u8'),
+    ('record_count', '<u8'),
+])
+
+RECORD_DTYPE = np.dtype([
+    ('op', 'u1'),
+    ('count', 'u1'),
+    ('i', '<i4'),
+    ('j', '<i4'),
+    ('vi', '<i8'),
+    ('vj', '<i8'),
+])
+
+VALUE_DTYPE = np.dtype('<i8')
+
+class TraceWriter:
+    def __init__(self, filename, initial_array, buffer_records=65536):
+        """
+        Open a trace file for writing
+
+        The writer is a step callback itself, so it can be passed straight
+        to an algorithm as its update_callback.
+
+        Args:
+            filename: Path of the trace file to create
+            initial_array: Integer array the run starts from
+            buffer_records: Number of records buffered before each flush
+
+        Raises:
+            ValueError: If the array holds non-integer values, which the
+                int64 records cannot store
+        """
+        initial_values = np.asarray(initial_array)
+        if len(initial_values) and initial_values.dtype.kind not in 'iu':
+            raise ValueError(f"Traces store integer arrays, not {initial_values.dtype} values")
+
+        self.filename = filename
+        self.buffer_records = buffer_records
+        self.array_size = len(initial_array)
+        self.record_count = 0
+
+        # Column buffers, converted to one structured block per flush
+        self._ops = array('B')
+        self._counts = array('B')
+        self._i = array('i')
+        self._j = array('i')
+        self._vi = array('q')
+        self._vj = array('q')
+
+        self.file = open(filename, 'wb')
+        self._write_header()
+        initial_values.astype(VALUE_DTYPE).tofile(self.file)
+
+    def __call__(self, operation, indices, values):
+        """Record one step (same signature as an algorithm callback)"""
+        self.write_step(operation, indices, values)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write_step(self, operation, indices, values):
+        """
+        Append one step to the trace
+
+        Args:
+            operation: Type of operation ('compare', 'swap', 'sorted', etc.)
+            indices: List of indices involved in the operation
+            values: New values at those indices, or None for read-only steps
+        """
+        code = OPERATION_CODES[operation]
+
+        if values is None and len(indices) > 2:
+            # Long highlight lists (e.g. 'sorted') are stored as index ranges
+            start = previous = indices[0]
+            for index in indices[1:]:
+                if index != previous + 1:
+                    self._append(code, INDEX_RANGE, start, previous, 0, 0)
+                    start = index
+                previous = index
+            self._append(code, INDEX_RANGE, start, previous, 0, 0)
+            return
+
+        # Everything else fits in records of at most two indices
+        for k in range(0, len(indices), 2):
+            pair = indices[k:k + 2]
+            new_values = values[k:k + 2] if values is not None else (0, 0)
+            if len(pair) == 2:
+                self._append(code, 2, pair[0], pair[1], new_values[0], new_values[1])
+            else:
+                self._append(code, 1, pair[0], -1, new_values[0], 0)
+
+        if not indices:
+            self._append(code, 0, -1, -1, 0, 0)
+
+    def _append(self, code, count, i, j, vi, vj):
+        """Buffer a single record"""
+        self._ops.append(code)
+        self._counts.append(count)
+        self._i.append(i)
+        self._j.append(j)
+        self._vi.append(vi)
+        self._vj.append(vj)
+
+        if len(self._ops) >= self.buffer_records:
+            self.flush()
+
+    def flush(self):
+        """Write buffered records to the file"""
+        size = len(self._ops)
+        if not size:
+            return
+
+        block = np.empty(size, dtype=RECORD_DTYPE)
+        block['op'] = np.frombuffer(self._ops, dtype=np.uint8)
+        block['count'] = np.frombuffer(self._counts, dtype=np.uint8)
+        block['i'] = np.frombuffer(self._i, dtype=np.intc)
+        block['j'] = np.frombuffer(self._j, dtype=np.intc)
+        block['vi'] = np.frombuffer(self._vi, dtype=np.longlong)
+        block['vj'] = np.frombuffer(self._vj, dtype=np.longlong)
+        block.tofile(self.file)
+
+        self.record_count += size
+        for column in (self._ops, self._counts, self._i, self._j, self._vi, self._vj):
+            del column[:]
+
+    def close(self):
+        """Flush remaining records and finalize the header"""
+        if self.file.closed:
+            return
+
+        self.flush()
+        self.file.seek(0)
+        self._write_header()
+        self.file.close()
+
+    def _write_header(self):
+        """Write the header block at the current file position"""
+        header = np.zeros(1, dtype=HEADER_DTYPE)
+        header['magic'] = TRACE_MAGIC
+        header['version'] = TRACE_VERSION
+        header['array_size'] = self.array_size
+        header['record_count'] = self.record_count
+        self.file.write(header.tobytes())
+
+class TraceReader:
+    def __init__(self, filename):
+        """
+        Open a trace file for replay through a memory map
+
+        Args:
+            filename: Path of an existing trace file
+        """
+        self.filename = filename
+
+        header = np.fromfile(filename, dtype=HEADER_DTYPE, count=1)
+        if len(header) != 1 or header['magic'][0] != TRACE_MAGIC:
+            raise ValueError(f"Not a sorting trace file: {filename}")
+        if header['version'][0] != TRACE_VERSION:
+            raise ValueError(f"Unsupported trace version: {header['version'][0]}")
+
+        self.array_size = int(header['array_size'][0])
+        self.record_count = int(header['record_count'][0])
+
+        values_offset = HEADER_DTYPE.itemsize
+        records_offset = values_offset + self.array_size * VALUE_DTYPE.itemsize
+
+        self._values = np.memmap(
+            filename, dtype=VALUE_DTYPE, mode='r',
+            offset=values_offset, shape=(self.array_size,)
+        ) if self.array_size else np.zeros(0, dtype=VALUE_DTYPE)
+        self._records = np.memmap(
+            filename, dtype=RECORD_DTYPE, mode='r',
+            offset=records_offset, shape=(self.record_count,)
+        ) if self.record_count else np.zeros(0, dtype=RECORD_DTYPE)
+
+    def __len__(self):
+        return self.record_count
+
+    def __iter__(self):
+        return self.iter_steps()
+
+    @property
+    def initial_array(self):
+        """The array the recorded run started from, as a list"""
+        return self._values.tolist()
+
+    def iter_steps(self, start=0, chunk_size=65536):
+        """
+        Iterate over recorded steps, decoding one chunk of records at a time
+
+        Args:
+            start: Index of the first record to replay
+            chunk_size: Number of records paged in per chunk
+
+        Yields:
+            (operation, indices, values) tuples, as passed to a step callback
+        """
+        for chunk_start in range(start, self.record_count, chunk_size):
+            chunk = self._records[chunk_start:chunk_start + chunk_size].tolist()
+
+            for code, count, i, j, vi, vj in chunk:
+                operation = TRACE_OPERATIONS[code]
+                writes = operation in WRITE_OPERATIONS
+
+                if count == INDEX_RANGE:
+                    yield operation, list(range(i, j + 1)), None
+                elif count == 2:
+                    yield operation, [i, j], [vi, vj] if writes else None
+                elif count == 1:
+                    yield operation, [i], [vi] if writes else None
+                else:
+                    yield operation, [], [] if writes else None
+
+    def close(self):
+        """Release the memory maps"""
+        self._values = np.zeros(0, dtype=VALUE_DTYPE)
+        self._records = np.zeros(0, dtype=RECORD_DTYPE)
+        self.record_count = 0
+
+def record_trace(algorithm_name, array, filename):
+    """
+    Run an algorithm once and record every step to a trace file
+
+    Args:
+        algorithm_name: Name of the algorithm in the registry
+        array: Integer array to sort
+        filename: Path of the trace file to create
+
+    Returns:
+        The algorithm instance after sorting, for its statistics
+
+    Raises:
+        ValueError: If the array is not an integer array
+    """
+    writer = TraceWriter(filename, array)
+    try:
+        with writer:
+            algorithm = get_algorithm_by_name(algorithm_name, array, writer)
+            algorithm.sort()
+    except Exception:
+        # Leave no half-written trace behind
+        os.remove(filename)
+        raise
+
+    return algorithm
@@ -0,0 +1,249 @@
+"""
+Vectorized data generation on numpy.random.Generator
+
+Produces the same input distributions as DataGenerator, plus Zipf,
+few-unique, sawtooth, organ-pipe, k-runs and k%-shuffled inputs, as typed
+NumPy arrays built without per-element Python loops. Runs with the same
+seed produce the same arrays.
+"""
+
+import numpy as np
+
+from config.settings import ARRAY_CONFIG
+
+# Distribution names accepted by VectorizedGenerator.generate
+DISTRIBUTIONS = {
+    'random': 'generate_random_array',
+    'sorted': 'generate_sorted_array',
+    'reversed': 'generate_reverse_sorted_array',
+    'nearly_sorted': 'generate_nearly_sorted_array',
+    'duplicate_heavy': 'generate_duplicate_heavy_array',
+    'zipf': 'generate_zipf_array',
+    'few_unique': 'generate_few_unique_array',
+    'sawtooth': 'generate_sawtooth_array',
+    'organ_pipe': 'generate_organ_pipe_array',
+    'k_runs': 'generate_k_runs_array',
+    'k_percent_shuffled': 'generate_k_percent_shuffled_array',
+}
+
+class VectorizedGenerator:
+    def __init__(self, seed=None, dtype=np.int64):
+        """
+        Initialize the generator
+
+        Args:
+            seed: Random seed for reproducible results
+            dtype: Integer dtype of the generated arrays
+        """
+        self.rng = np.random.default_rng(seed)
+        self.dtype = dtype
+
+    def seed(self, seed):
+        """Restart the random stream from a seed"""
+        self.rng = np.random.default_rng(seed)
+
+    def generate(self, distribution, size=None, **options):
+        """
+        Generate an array from a distribution by name
+
+        Args:
+            distribution: Key of DISTRIBUTIONS
+            size: Number of elements
+            **options: Extra arguments of that distribution's method
+
+        Returns:
+            NumPy array of integers
+        """
+        if distribution not in DISTRIBUTIONS:
+            raise ValueError(f"Unknown distribution: {distribution}")
+        return getattr(self, DISTRIBUTIONS[distribution])(size, **options)
+
+    def generate_random_array(self, size=None, min_val=None, max_val=None):
+        """
+        Generate uniformly random integers in [min_val, max_val]
+
+        Args:
+            size: Number of elements (default from config)
+            min_val: Minimum value (default from config)
+            max_val: Maximum value (default from config)
+
+        Returns:
+            NumPy array of random integers
+        """
+        size, min_val, max_val = self._defaults(size, min_val, max_val)
+        return self.rng.integers(min_val, max_val, size=size, endpoint=True, dtype=self.dtype)
+
+    def generate_sorted_array(self, size=None, ascending=True):
+        """
+        Generate evenly spaced sorted values
+
+        Args:
+            size: Number of elements
+            ascending: True for ascending, False for descending
+
+        Returns:
+            Sorted NumPy array
+        """
+        size, min_val, max_val = self._defaults(size)
+        array = np.linspace(min_val, max_val, size).astype(self.dtype)
+        return array if ascending else array[::-1].copy()
+
+    def generate_reverse_sorted_array(self, size=None):
+        """Generate a descending array"""
+        return self.generate_sorted_array(size, ascending=False)
+
+    def generate_nearly_sorted_array(self, size=None, swaps=None):
+        """
+        Generate a sorted array with some random pairs swapped
+
+        The pairs are disjoint, so all the swaps can be made at once as one
+        permutation of the positions.
+
+        Args:
+            size: Number of elements
+            swaps: Number of random swaps to make (default: size/10, at
+                most size/2)
+
+        Returns:
+            Nearly sorted NumPy array
+        """
+        array = self.generate_sorted_array(size)
+        size = len(array)
+        swaps = min(swaps or max(1, size // 10), size // 2)
+
+        positions = self.rng.choice(size, size=2 * swaps, replace=False)
+        i, j = positions[:swaps], positions[swaps:]
+        order = np.arange(size)
+        order[i], order[j] = j, i
+        return array[order]
+
+    def generate_duplicate_heavy_array(self, size=None, unique_values=None):
+        """
+        Generate values drawn from a few evenly spaced levels
+
+        Args:
+            size: Number of elements
+            unique_values: Number of levels (default: size/5, at least 3)
+
+        Returns:
+            NumPy array with many duplicates
+        """
+        size, min_val, max_val = self._defaults(size)
+        unique_values = unique_values or max(3, size // 5)
+        levels = np.linspace(min_val, max_val, unique_values).astype(self.dtype)
+        return levels[self.rng.integers(0, unique_values, size=size)]
+
+    def generate_few_unique_array(self, size=None, unique_values=4):
+        """
+        Generate values drawn from a handful of random distinct values
+
+        Args:
+            size: Number of elements
+            unique_values: Number of distinct values
+
+        Returns:
+            NumPy array with at most unique_values distinct values
+        """
+        size, min_val, max_val = self._defaults(size)
+        unique_values = min(unique_values, max_val - min_val + 1)
+        values = self.rng.choice(
+            np.arange(min_val, max_val + 1, dtype=self.dtype), size=unique_values, replace=False
+        )
+        return values[self.rng.integers(0, unique_values, size=size)]
+
+    def generate_zipf_array(self, size=None, exponent=1.2):
+        """
+        Generate values whose frequencies follow Zipf's law
+
+        The k-th most common value occurs in proportion to 1 / k^exponent.
+        Ranks are assigned to the values of the range in random order, so
+        the common values are not simply the smallest ones.
+
+        Args:
+            size: Number of elements
+            exponent: Skew of the distribution (larger is more skewed)
+
+        Returns:
+            NumPy array of Zipf-distributed integers
+        """
+        size, min_val, max_val = self._defaults(size)
+        values = self.rng.permutation(np.arange(min_val, max_val + 1, dtype=self.dtype))
+        weights = 1.0 / np.arange(1, len(values) + 1) ** exponent
+        return self.rng.choice(values, size=size, p=weights / weights.sum())
+
+    def generate_sawtooth_array(self, size=None, teeth=5):
+        """
+        Generate several identical ascending ramps in a row
+
+        Args:
+            size: Number of elements
+            teeth: Number of ramps
+
+        Returns:
+            Sawtooth-shaped NumPy array
+        """
+        size, min_val, max_val = self._defaults(size)
+        period = max(1, -(-size // teeth))
+        ramp = np.arange(size) % period
+        return (min_val + ramp * (max_val - min_val) // max(1, period - 1)).astype(self.dtype)
+
+    def generate_organ_pipe_array(self, size=None):
+        """
+        Generate values that rise to the middle and fall back again
+
+        Args:
+            size: Number of elements
+
+        Returns:
+            Organ-pipe-shaped NumPy array
+        """
+        size, min_val, max_val = self._defaults(size)
+        half = (size + 1) // 2
+        rising = np.linspace(min_val, max_val, half).astype(self.dtype)
+        return np.concatenate([rising, rising[:size - half][::-1]])
+
+    def generate_k_runs_array(self, size=None, runs=4):
+        """
+        Generate k ascending runs of random values, back to back
+
+        Args:
+            size: Number of elements
+            runs: Number of sorted runs
+
+        Returns:
+            NumPy array made of runs sorted stretches
+        """
+        size, min_val, max_val = self._defaults(size)
+        values = self.generate_random_array(size, min_val, max_val)
+
+        # Sorting (run, value) keys packed into one integer sorts every run at once
+        span = max_val - min_val + 1
+        run_ids = np.arange(size, dtype=np.int64) * runs // max(1, size)
+        keys = np.sort(run_ids * span + (values - min_val))
+        return (keys % span + min_val).astype(self.dtype)
+
+    def generate_k_percent_shuffled_array(self, size=None, percent=10):
+        """
+        Generate a sorted array with k% of its elements shuffled among themselves
+
+        Args:
+            size: Number of elements
+            percent: Percentage of positions whose values are shuffled
+
+        Returns:
+            Partly shuffled NumPy array
+        """
+        array = self.generate_sorted_array(size)
+        count = int(round(len(array) * percent / 100))
+
+        positions = self.rng.choice(len(array), size=count, replace=False)
+        array[positions] = array[self.rng.permutation(positions)]
+        return array
+
+    def _defaults(self, size=None, min_val=None, max_val=None):
+        """Fill in the configured size and value range"""
+        return (
+            ARRAY_CONFIG['SIZE_DEFAULT'] if size is None else size,
+            ARRAY_CONFIG['VALUE_MIN'] if min_val is None else min_val,
+            ARRAY_CONFIG['VALUE_MAX'] if max_val is None else max_val,
+        )